@@ -0,0 +1,96 @@
+"""
+Microbenchmark of serializing a 1,000-row page of GET /business/all.
+
+Compares the former path, which mapped every entity to a schema, dumped it to a dict,
+validated the dicts again into the list response and let FastAPI encode the model, with
+the current one validating the column rows once and writing the JSON bytes directly.
+
+Usage: python -m benchmarks.business_list_serialization [rows] [iterations]
+"""
+
+import json
+import sys
+import timeit
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from typing import cast
+from uuid import uuid4
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.routes.businesses.business_schemes import (
+    BusinessBaseSchema,
+    BusinessListResponseSchema,
+    BusinessResponseSchema,
+    BusinessType,
+)
+from src.api.schemes import PaginationParams, SearchResult
+from src.models.dbo.database_models import Business
+from src.models.managers.business import BusinessManager
+from src.services.common.base_service import BaseService
+
+
+def get_businesses(count: int) -> list[Business]:
+    owner_id = uuid4()
+    return [
+        Business(
+            id=uuid4(),
+            name=f"Business {i}",
+            description="Небольшой бизнес" if i % 2 else None,
+            business_type=list(BusinessType)[i % len(BusinessType)],
+            initial_investment=Decimal("150000.00") + i,
+            operational_costs=Decimal("1200.50"),
+            expected_revenue=Decimal("4000.00"),
+            break_even_months=Decimal("12.5") if i % 3 else None,
+            owner_id=owner_id,
+            created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+            updated_at=datetime(2025, 2, 1, tzinfo=timezone.utc),
+        )
+        for i in range(count)
+    ]
+
+
+def serialize_mapped(businesses: list[Business], pagination: PaginationParams) -> bytes:
+    """
+    The former path: per-row mapping and dump, validation of the envelope, FastAPI encoding.
+    """
+    result = SearchResult(items=businesses, total=len(businesses))
+    response = BusinessListResponseSchema.create(
+        list_data=result.map(lambda business: BaseService.map_obj_to_schema(business, BusinessBaseSchema).model_dump()),
+        pagination=pagination,
+    )
+    return JSONResponse(jsonable_encoder(response)).body
+
+
+def serialize_direct(rows: list, pagination: PaginationParams) -> bytes:
+    return BusinessListResponseSchema.create_response(
+        list_data=SearchResult(items=rows, total=len(rows)),
+        pagination=pagination,
+    ).body
+
+
+def main(row_count: int, iterations: int) -> None:
+    businesses = get_businesses(row_count)
+    # building the query never touches the database
+    manager = BusinessManager(db=cast(AsyncSession, None))
+    columns = list(manager.get_schema_query(BusinessResponseSchema).selected_columns.keys())
+    rows = [SimpleNamespace(**{column: getattr(business, column) for column in columns}) for business in businesses]
+    pagination = PaginationParams(page=1, per_page=row_count)
+
+    assert json.loads(serialize_mapped(businesses, pagination)) == json.loads(serialize_direct(rows, pagination))
+
+    mapped_time = timeit.timeit(lambda: serialize_mapped(businesses, pagination), number=iterations)
+    direct_time = timeit.timeit(lambda: serialize_direct(rows, pagination), number=iterations)
+
+    print(f"rows per page:      {row_count}")
+    print(f"map + revalidate:   {mapped_time / iterations * 1e3:.2f} ms/page")
+    print(f"validate once:      {direct_time / iterations * 1e3:.2f} ms/page")
+    print(f"speedup:            {mapped_time / direct_time:.1f}x")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [1000, 20][len(args) :]))
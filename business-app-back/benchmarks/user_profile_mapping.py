@@ -0,0 +1,105 @@
+"""
+Microbenchmark of building the user profile response.
+
+Compares the former flat join, which returned roles x achievements rows per user and
+de-duplicated them in Python with linear scans, with the current query returning a
+single row with the roles and achievements aggregated into JSON arrays.
+
+Usage: python -m benchmarks.user_profile_mapping [achievements] [roles] [iterations]
+"""
+
+import sys
+import timeit
+from datetime import datetime
+from types import SimpleNamespace
+from typing import cast
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.routes.users.schemes import AchievementSchema, RoleSchema, UserProfileResponse
+from src.services.users.user import UserService
+
+USER_FIELDS = {
+    "id": uuid4(),
+    "email": "user@example.com",
+    "is_active": True,
+    "created_at": datetime(2025, 1, 1),
+    "updated_at": datetime(2025, 1, 1),
+    "user_profile_id": uuid4(),
+    "user_profile_first_name": "Иван",
+    "user_profile_last_name": "Петров",
+    "user_profile_avatar_url": None,
+    "user_profile_bio": None,
+    "user_stats_total_business": 3,
+    "user_stats_total_capital": 100000.0,
+    "user_stats_success_rate": 0.5,
+}
+
+# the mapping never touches the database
+NO_SESSION = cast(AsyncSession, None)
+
+
+def get_joined_rows(roles: list[dict], achievements: list[dict]) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(
+            **USER_FIELDS,
+            role_id=role["id"],
+            role_name=role["name"],
+            achievement_id=achievement["id"],
+            achievement_name=achievement["name"],
+        )
+        for role in roles
+        for achievement in achievements
+    ]
+
+
+def map_joined_rows(rows: list[SimpleNamespace]) -> UserProfileResponse:
+    """
+    The former de-duplicating merge of the flat join rows (user stats omitted).
+    """
+    service = UserService(db=NO_SESSION)
+    user_profiles = {}
+    for row in rows:
+        if row.id not in user_profiles:
+            user_profiles[row.id] = service.map_user_info(SimpleNamespace(**USER_FIELDS, roles=[], achievements=[]))
+
+        profile = user_profiles[row.id]
+        assert profile.achievement is not None and profile.role is not None
+        if not any(achievement.id == row.achievement_id for achievement in profile.achievement):
+            profile.achievement.append(AchievementSchema(id=row.achievement_id, name=row.achievement_name))
+        if not any(role.id == row.role_id for role in profile.role):
+            profile.role.append(RoleSchema(id=row.role_id, name=row.role_name))
+
+    return UserProfileResponse(data=list(user_profiles.values()))
+
+
+def main(achievement_count: int, role_count: int, iterations: int) -> None:
+    roles = [{"id": str(uuid4()), "name": f"role {i}"} for i in range(role_count)]
+    achievements = [{"id": str(uuid4()), "name": f"achievement {i}"} for i in range(achievement_count)]
+
+    service = UserService(db=NO_SESSION)
+    joined_rows = get_joined_rows(roles, achievements)
+    aggregated_row = SimpleNamespace(**USER_FIELDS, roles=roles, achievements=achievements)
+
+    joined = map_joined_rows(joined_rows)
+    aggregated = UserProfileResponse(data=[service.map_user_info(aggregated_row)])
+    assert {a.id for a in joined.data[0].achievement or []} == {a.id for a in aggregated.data[0].achievement or []}
+    assert {r.id for r in joined.data[0].role or []} == {r.id for r in aggregated.data[0].role or []}
+
+    joined_time = timeit.timeit(lambda: map_joined_rows(joined_rows), number=iterations)
+    aggregated_time = timeit.timeit(
+        lambda: UserProfileResponse(data=[service.map_user_info(aggregated_row)]),
+        number=iterations,
+    )
+
+    print(f"roles x achievements: {role_count} x {achievement_count}")
+    print(f"rows fetched:         {len(joined_rows)} (flat join) vs 1 (aggregated)")
+    print(f"flat join:            {joined_time / iterations * 1e3:.2f} ms/profile")
+    print(f"aggregated:           {aggregated_time / iterations * 1e3:.2f} ms/profile")
+    print(f"speedup:              {joined_time / aggregated_time:.1f}x")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    main(*(args + [500, 3, 20][len(args) :]))
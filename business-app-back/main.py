@@ -1,7 +1,13 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from starlette.middleware.cors import CORSMiddleware
 
+from src.api.middlewares.metrics import MetricsMiddleware
+from src.api.middlewares.profiling import ProfilingMiddleware
+from src.api.middlewares.request_id import RequestIdMiddleware
 from src.api.routes.auth.views import auth_router
 from src.api.routes.education.category.views import course_categories_router
 from src.api.routes.education.course.views import course_router
@@ -11,9 +17,43 @@ from src.api.routes.home.views import home_router
 from src.api.routes.users.views import user_router
 from src.api.routes.businesses.view import business_router
 from src.api.routes.education.lesson.views import lessons_router
+from src.api.routes.education.tree.views import tree_router
+from src.api.routes.metrics.views import metrics_router
+from src.api.routes.profiler.views import profiler_router
+from src.api.routes.search.views import search_router
 from src.config.admin import config as admin_config
+from src.config.app_config import settings
+from src.services.businesses.simulation import monte_carlo_simulator
+from src.services.cache import session_denylist
+from src.services.logger import LoggerProvider
+from src.services.passwords.hashing import password_hashing_executor
+from src.services.profiling.sampler import sampling_profiler
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    denylist_sync = None
+    if settings.AUTH_BACKEND == "jwt":
+        denylist_sync = asyncio.create_task(session_denylist.run(settings.AUTH_DENYLIST_SYNC_SECONDS))
+    yield
+    if denylist_sync is not None:
+        denylist_sync.cancel()
+    password_hashing_executor.shutdown()
+    monte_carlo_simulator.shutdown()
+    sampling_profiler.shutdown()
+    LoggerProvider.shutdown()
+
+
+app = FastAPI(lifespan=lifespan)
 
-app = FastAPI()
+if settings.PROFILER_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        profiler=sampling_profiler,
+        paths=tuple(filter(None, settings.PROFILER_PATHS.split(","))),
+        sample_rate=settings.PROFILER_SAMPLE_RATE,
+        token=settings.PROFILER_TOKEN,
+    )
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,7 +61,10 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID"],
 )
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(RequestIdMiddleware)
 
 app.include_router(auth_router)
 app.include_router(business_router)
@@ -32,4 +75,8 @@ app.include_router(course_categories_router)
 app.include_router(course_router)
 app.include_router(quiz_router)
 app.include_router(progress_router)
+app.include_router(tree_router)
+app.include_router(search_router)
+app.include_router(profiler_router)
+app.include_router(metrics_router)
 admin_config.init_admin(app)
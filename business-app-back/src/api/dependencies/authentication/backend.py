@@ -1,10 +1,22 @@
 from fastapi_users.authentication import AuthenticationBackend
 
-from src.api.dependencies.authentication.strategy import get_database_strategy
+from src.api.dependencies.authentication.strategy import (
+    get_database_strategy,
+    get_jwt_strategy,
+)
+from src.config.app_config import settings
+from src.config.authentication.backend import RefreshableAuthenticationBackend
 from src.config.authentication.transport import bearer_transport
 
-authentication_backend = AuthenticationBackend(
-    name="access-tokens-db",
-    transport=bearer_transport,
-    get_strategy=get_database_strategy,
-)
+if settings.AUTH_BACKEND == "jwt":
+    authentication_backend: AuthenticationBackend = RefreshableAuthenticationBackend(
+        name="jwt",
+        transport=bearer_transport,
+        get_strategy=get_jwt_strategy,
+    )
+else:
+    authentication_backend = AuthenticationBackend(
+        name="access-tokens-db",
+        transport=bearer_transport,
+        get_strategy=get_database_strategy,
+    )
@@ -4,11 +4,11 @@ from typing import (
 )
 
 from fastapi import Depends
-from fastapi_users.authentication.strategy.db import (
-    DatabaseStrategy,
-)
 
 from src.api.dependencies.authentication.access_token import get_access_tokens_db
+from src.config.app_config import settings
+from src.config.authentication.strategy import CachedDatabaseStrategy, StatelessJWTStrategy
+from src.services.cache import auth_cache, session_denylist
 from src.utils.constants import LIFETIME_SECONDS
 
 if TYPE_CHECKING:
@@ -21,8 +21,24 @@ def get_database_strategy(
         "AccessTokenDatabase[AccessToken]",
         Depends(get_access_tokens_db),
     ],
-) -> DatabaseStrategy:
-    return DatabaseStrategy(
+) -> CachedDatabaseStrategy:
+    return CachedDatabaseStrategy(
         database=access_tokens_db,
         lifetime_seconds=LIFETIME_SECONDS,
+        cache=auth_cache,
+    )
+
+
+def get_jwt_strategy(
+    access_tokens_db: Annotated[
+        "AccessTokenDatabase[AccessToken]",
+        Depends(get_access_tokens_db),
+    ],
+) -> StatelessJWTStrategy:
+    return StatelessJWTStrategy(
+        secret=settings.JWT_TOKEN_SECRET,
+        lifetime_seconds=settings.JWT_LIFETIME_SECONDS,
+        access_tokens_db=access_tokens_db,
+        denylist=session_denylist,
+        refresh_lifetime_seconds=settings.JWT_REFRESH_LIFETIME_SECONDS,
     )
@@ -0,0 +1,53 @@
+import hmac
+import random
+from typing import Optional
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.services.profiling.sampler import SamplingProfiler
+
+PROFILE_HEADER = b"x-profile"
+
+
+class ProfilingMiddleware:
+    """
+    Selects the requests sampled by the profiler.
+
+    A request is profiled if its path starts with one of `paths` and it falls within
+    `sample_rate`, or if it carries the ``X-Profile`` header set to `token`. Other requests
+    only pay for the prefix check.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        profiler: SamplingProfiler,
+        paths: tuple[str, ...] = (),
+        sample_rate: float = 1.0,
+        token: Optional[str] = None,
+    ):
+        self.app = app
+        self.profiler = profiler
+        self.paths = paths
+        self.sample_rate = sample_rate
+        self.token = token.encode() if token else None
+
+    def _is_profiled(self, scope: Scope) -> bool:
+        if self.paths and scope["path"].startswith(self.paths) and random.random() < self.sample_rate:
+            return True
+        if self.token is not None:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return hmac.compare_digest(value, self.token)
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not self._is_profiled(scope):
+            await self.app(scope, receive, send)
+            return
+
+        task = self.profiler.begin(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.profiler.end(task)
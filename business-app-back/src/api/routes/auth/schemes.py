@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class RefreshTokenSchema(BaseModel):
+    refresh_token: str
+
+
+class TokenPairSchema(BaseModel):
+    access_token: str
+    refresh_token: str
+    token_type: str = "bearer"
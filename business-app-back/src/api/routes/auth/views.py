@@ -1,15 +1,31 @@
 from fastapi import (
     APIRouter,
     Depends,
+    HTTPException,
+    status,
 )
 from fastapi.security import HTTPBearer
 
 from src.api.dependencies.authentication.backend import authentication_backend
-from src.api.routes.auth.fastapi_users_auth_router import fastapi_users
+from src.api.dependencies.authentication.strategy import get_jwt_strategy
+from src.api.dependencies.authentication.user_auth import get_user_manager
+from src.api.routes.auth.fastapi_users_auth_router import (
+    fastapi_users,
+    current_active_super_user,
+)
+from src.api.routes.auth.schemes import (
+    RefreshTokenSchema,
+    TokenPairSchema,
+)
 from src.api.routes.users.schemes import (
     UserRead,
     UserCreate,
 )
+from src.config.app_config import settings
+from src.config.authentication.strategy import StatelessJWTStrategy
+from src.models.managers.user_auth import UserAuthManager
+from src.services.cache import auth_cache
+from src.services.passwords.hashing import password_hashing_executor
 
 http_bearer = HTTPBearer(auto_error=False)
 
@@ -34,3 +50,48 @@ auth_router.include_router(
 auth_router.include_router(
     router=fastapi_users.get_reset_password_router(),
 )
+
+jwt_router = APIRouter()
+
+
+@jwt_router.post(
+    "/refresh",
+    response_model=TokenPairSchema,
+    responses={status.HTTP_401_UNAUTHORIZED: {"description": "Invalid or expired refresh token"}},
+    summary="Exchange a refresh token for a new access token and refresh token",
+)
+async def refresh_access_token(
+    payload: RefreshTokenSchema,
+    user_manager: UserAuthManager = Depends(get_user_manager),
+    strategy: StatelessJWTStrategy = Depends(get_jwt_strategy),
+):
+    tokens = await strategy.refresh(payload.refresh_token, user_manager)
+    if tokens is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid or expired refresh token",
+        )
+    access_token, refresh_token = tokens
+    return TokenPairSchema(access_token=access_token, refresh_token=refresh_token)
+
+
+if settings.AUTH_BACKEND == "jwt":
+    auth_router.include_router(router=jwt_router)
+
+
+@auth_router.get(
+    "/cache-stats",
+    dependencies=[Depends(current_active_super_user)],
+    summary="Hit/miss counters of the authentication cache",
+)
+async def get_auth_cache_stats():
+    return auth_cache.stats()
+
+
+@auth_router.get(
+    "/password-hashing-stats",
+    dependencies=[Depends(current_active_super_user)],
+    summary="Load and outcome counters of the password hashing executor",
+)
+async def get_password_hashing_stats():
+    return password_hashing_executor.stats()
@@ -38,7 +38,6 @@ class BusinessCreateSchema(IDSchema):
     initial_investment: Decimal = Field(..., gt=0)
     operational_costs: Decimal = Field(default=0.0, ge=0)
     expected_revenue: Decimal = Field(..., ge=0)
-    break_even_months: Optional[Decimal] = Field(None, ge=0)
 
 
 class BusinessCreateWithUserSchema(BusinessCreateSchema):
@@ -81,3 +80,17 @@ class BusinessCreateWithUserBatchSchema(BaseModel):
 
 class BusinessDeleteBatchSchema(BaseModel):
     data: List[UUID]
+
+
+class BusinessProjectionSchema(BaseModel):
+    business_id: UUID
+    horizon: int
+    seed: int
+    break_even_month: Optional[int] = None
+    month: List[int]
+    revenue: List[float]
+    costs: List[float]
+    taxes: List[float]
+    profit: List[float]
+    cumulative_profit: List[float]
+    roi: List[float]
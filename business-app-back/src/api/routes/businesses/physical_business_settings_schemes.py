@@ -4,7 +4,7 @@ from uuid import UUID
 from datetime import datetime
 
 from pydantic import BaseModel, Field, ConfigDict
-from src.api.schemes import ListDataResponseSchema, IDSchema
+from src.api.schemes import BatchItemErrorSchema, ListDataResponseSchema, IDSchema
 
 
 class PhysicalBusinessSettingsSchema(BaseModel):
@@ -79,6 +79,11 @@ class PhysicalBusinessCreateBatchSchema(BaseModel):
     data: List[PhysicalBusinessSettingsCreateSchema]
 
 
+class PhysicalBusinessSettingsBatchResultSchema(BaseModel):
+    data: List[PhysicalBusinessSettingsBaseSchema]
+    errors: List[BatchItemErrorSchema]
+
+
 class PhysicalBusinessCreateWithUserBatchSchema(BaseModel):
     data: List[PhysicalBusinessCreateWithUserSchema]
 
@@ -0,0 +1,26 @@
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Optional
+from uuid import UUID
+
+from pydantic import ConfigDict
+
+from src.api.schemes import IDSchema
+
+
+class TransactionType(str, Enum):
+    INVESTMENT = "INVESTMENT"
+    WITHDRAWAL = "WITHDRAWAL"
+    TRANSFER = "TRANSFER"
+
+
+class TransactionSchema(IDSchema):
+    business_id: UUID
+    amount: Decimal
+    transaction_type: TransactionType
+    details: Any = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID
 from typing import (
     Annotated,
@@ -16,6 +17,7 @@ from src.api.routes.auth.fastapi_users_auth_router import (
     current_active_user,
 )
 from src.api.schemes import (
+    ExportFormat,
     OrderParams,
     Response400Schema,
     Response500Schema,
@@ -28,20 +30,28 @@ from src.api.routes.businesses.business_schemes import (
     BusinessBaseSchema,
     BusinessCreateBatchSchema,
     BusinessCreateWithUserBatchSchema,
+    BusinessProjectionSchema,
 )
+from src.api.routes.businesses.transaction_schemes import TransactionType
 from src.api.routes.businesses.physical_business_settings_schemes import (
     PhysicalBusinessCreateBatchSchema,
     PhysicalBusinessSettingsBaseSchema,
+    PhysicalBusinessSettingsBatchResultSchema,
 )
 from src.api.routes.businesses.virtual_business_settings_schemes import (
     VirtualBusinessCreateBatchSchema,
     VirtualBusinessSettingsBaseSchema,
+    VirtualBusinessSettingsBatchResultSchema,
+    VirtualBusinessSimulationRequestSchema,
+    VirtualBusinessSimulationSchema,
 )
 from src.models.dbo.database_models import User
 from src.services.businesses.business import (
     BusinessService,
     get_business_service,
 )
+from src.services.common.export import EXPORT_MEDIA_TYPES, get_export_response
+from src.utils.constants import MAX_PROJECTION_HORIZON
 from src.utils.helpers import pagination_params
 
 business_router = APIRouter(
@@ -76,6 +86,7 @@ async def get_businesses_for_all_user(
     business_id: Optional[UUID] = None,
     search: Optional[str] = Query(None, description="Search by business name"),
     business_type: Optional[BusinessType] = Query(None),
+    estimated_total: bool = Query(False, description="Estimate the total number of businesses from statistics"),
     pagination: PaginationParams = Depends(pagination_params),
     order_by: OrderParams = Depends(),
     service: BusinessService = Depends(get_business_service),
@@ -87,6 +98,7 @@ async def get_businesses_for_all_user(
             search=search,
             pagination=pagination,
             order_by=order_by.model_dump()["order_by"],
+            estimated_total=estimated_total,
         )
     except ValueError as e:
         raise HTTPException(
@@ -163,6 +175,62 @@ async def get_businesses(
         )
 
 
+@business_router.get(
+    "/export",
+    responses={
+        200: {
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()},
+            "description": "Businesses exported successfully",
+        },
+        400: {
+            "model": Response400Schema,
+            "description": "Invalid request",
+        },
+        500: {
+            "model": Response500Schema,
+            "description": "Server error occurred",
+        },
+    },
+    summary="Export the businesses of the user as NDJSON or CSV",
+)
+async def export_businesses(
+    user: Annotated[
+        User,
+        Depends(current_active_user),
+    ],
+    search: Optional[str] = Query(None, description="Search by business name"),
+    business_type: Optional[BusinessType] = Query(None),
+    export_format: ExportFormat = Query(ExportFormat.ndjson, alias="format"),
+    order_by: OrderParams = Depends(),
+    service: BusinessService = Depends(get_business_service),
+):
+    try:
+        chunks = service.export_businesses(
+            user_id=user.id,
+            business_type=business_type,
+            search=search,
+            order_by=order_by.model_dump()["order_by"],
+            export_format=export_format,
+        )
+        return get_export_response(chunks, export_format, filename="businesses")
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "detail": str(e),
+                "code": "validation_error",
+            },
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "detail": "Internal server error",
+                "code": "server_error",
+            },
+        )
+
+
 @business_router.get(
     "/{business_id}",
     responses={
@@ -212,6 +280,143 @@ async def get_business_detail_information(
         )
 
 
+@business_router.get(
+    "/{business_id}/projection",
+    responses={
+        200: {
+            "model": BusinessProjectionSchema,
+            "description": "Business projection calculated successfully",
+        },
+        400: {
+            "model": Response400Schema,
+            "description": "Invalid request",
+        },
+        404: {
+            "model": Response404Schema,
+            "description": "Business not found",
+        },
+        500: {
+            "model": Response500Schema,
+            "description": "Server error occurred",
+        },
+    },
+    summary="Project monthly revenue, costs, profit and ROI of a business",
+)
+async def get_business_projection(
+    user: Annotated[User, Depends(current_active_user)],
+    business_id: UUID,
+    horizon: int = Query(12, ge=1, le=MAX_PROJECTION_HORIZON, description="Number of months to project"),
+    seed: Optional[int] = Query(None, ge=0, description="Seed to reproduce a previous projection"),
+    growth_rate: float = Query(0.03, ge=-1, le=1, description="Monthly revenue growth (0.03 for 3%)"),
+    seasonality: float = Query(0.15, ge=0, le=1, description="Amplitude of the yearly revenue wave"),
+    volatility: float = Query(0.1, ge=0, le=1, description="Maximum random deviation of revenue and costs"),
+    service: BusinessService = Depends(get_business_service),
+):
+    try:
+        return await service.get_projection(
+            business_id=business_id,
+            user_id=user.id,
+            horizon=horizon,
+            seed=seed,
+            growth_rate=growth_rate,
+            seasonality=seasonality,
+            volatility=volatility,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "detail": str(e),
+                "code": "validation_error",
+            },
+        )
+    except LookupError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "detail": "Business not found",
+                "code": "not_found",
+            },
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "detail": "Internal server error",
+                "code": "server_error",
+            },
+        )
+
+
+@business_router.get(
+    "/{business_id}/transactions/export",
+    responses={
+        200: {
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()},
+            "description": "Transactions exported successfully",
+        },
+        400: {
+            "model": Response400Schema,
+            "description": "Invalid request",
+        },
+        404: {
+            "model": Response404Schema,
+            "description": "Business not found",
+        },
+        500: {
+            "model": Response500Schema,
+            "description": "Server error occurred",
+        },
+    },
+    summary="Export the transactions of a business as NDJSON or CSV",
+)
+async def export_business_transactions(
+    user: Annotated[User, Depends(current_active_user)],
+    business_id: UUID,
+    transaction_type: Optional[TransactionType] = Query(None),
+    created_from: Optional[datetime] = Query(None, description="Only transactions created at or after this time"),
+    created_to: Optional[datetime] = Query(None, description="Only transactions created before this time"),
+    export_format: ExportFormat = Query(ExportFormat.ndjson, alias="format"),
+    order_by: OrderParams = Depends(),
+    service: BusinessService = Depends(get_business_service),
+):
+    try:
+        chunks = await service.export_transactions(
+            business_id=business_id,
+            user_id=user.id,
+            transaction_type=transaction_type,
+            created_from=created_from,
+            created_to=created_to,
+            order_by=order_by.model_dump()["order_by"],
+            export_format=export_format,
+        )
+        return get_export_response(chunks, export_format, filename=f"transactions-{business_id}")
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "detail": str(e),
+                "code": "validation_error",
+            },
+        )
+    except LookupError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "detail": "Business not found",
+                "code": "not_found",
+            },
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "detail": "Internal server error",
+                "code": "server_error",
+            },
+        )
+
+
 @business_router.post(
     "",
     responses={
@@ -223,6 +428,10 @@ async def get_business_detail_information(
             "model": Response400Schema,
             "description": "Invalid request",
         },
+        404: {
+            "model": Response404Schema,
+            "description": "Business not found",
+        },
         500: {
             "model": Response500Schema,
             "description": "Server error occurred",
@@ -251,6 +460,14 @@ async def create_or_update_business(
                 "code": "validation_error",
             },
         )
+    except LookupError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "detail": str(e),
+                "code": "not_found",
+            },
+        )
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -375,11 +592,84 @@ async def get_virtual_business_settings(
         )
 
 
+@business_router.post(
+    "/{business_id}/virtual-settings/simulate",
+    responses={
+        200: {
+            "model": VirtualBusinessSimulationSchema,
+            "description": "Simulation completed successfully",
+        },
+        400: {
+            "model": Response400Schema,
+            "description": "Invalid request",
+        },
+        404: {
+            "model": Response404Schema,
+            "description": "Virtual business settings not found",
+        },
+        500: {
+            "model": Response500Schema,
+            "description": "Server error occurred",
+        },
+        503: {
+            "description": "Simulation time budget exceeded",
+        },
+    },
+    summary="Run a Monte Carlo risk simulation of a virtual (mining) business",
+)
+async def simulate_virtual_business(
+    user: Annotated[User, Depends(current_active_user)],
+    business_id: UUID,
+    simulation: VirtualBusinessSimulationRequestSchema,
+    service: BusinessService = Depends(get_business_service),
+):
+    try:
+        return await service.simulate_virtual_business(
+            business_id=business_id,
+            user_id=user.id,
+            paths=simulation.paths,
+            horizon=simulation.horizon,
+            seed=simulation.seed,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "detail": str(e),
+                "code": "validation_error",
+            },
+        )
+    except LookupError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "detail": "Virtual business settings not found",
+                "code": "not_found",
+            },
+        )
+    except TimeoutError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "detail": "Simulation time budget exceeded, try fewer paths",
+                "code": "time_budget_exceeded",
+            },
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "detail": "Internal server error",
+                "code": "server_error",
+            },
+        )
+
+
 @business_router.post(
     "/physical-settings",
     responses={
         201: {
-            "model": PhysicalBusinessCreateBatchSchema,
+            "model": PhysicalBusinessSettingsBatchResultSchema,
             "description": "Physical business settings created/updated successfully",
         },
         400: {
@@ -404,6 +694,7 @@ async def create_or_update_physical_settings_business(
     try:
         return await service.create_or_update_physical_business_settings(
             physical_business.data,
+            user_id=user.id,
         )
     except ValueError as e:
         raise HTTPException(
@@ -427,7 +718,7 @@ async def create_or_update_physical_settings_business(
     "/virtual-settings",
     responses={
         201: {
-            "model": VirtualBusinessCreateBatchSchema,
+            "model": VirtualBusinessSettingsBatchResultSchema,
             "description": "Virtual business settings created/updated successfully",
         },
         400: {
@@ -452,6 +743,7 @@ async def create_or_update_virtual_settings_business(
     # try:
     return await service.create_or_update_virtual_business_settings(
         virtual_business.data,
+        user_id=user.id,
     )
     # except ValueError as e:
     #     raise HTTPException(
@@ -4,7 +4,8 @@ from uuid import UUID
 from datetime import datetime
 
 from pydantic import BaseModel, Field, ConfigDict
-from src.api.schemes import ListDataResponseSchema, IDSchema
+from src.api.schemes import BatchItemErrorSchema, ListDataResponseSchema, IDSchema
+from src.utils.constants import MAX_SIMULATION_HORIZON, MAX_SIMULATION_PATHS
 
 
 class VirtualBusinessSettingsSchema(BaseModel):
@@ -79,9 +80,47 @@ class VirtualBusinessCreateBatchSchema(BaseModel):
     data: List[VirtualBusinessSettingsCreateSchema]
 
 
+class VirtualBusinessSettingsBatchResultSchema(BaseModel):
+    data: List[VirtualBusinessSettingsBaseSchema]
+    errors: List[BatchItemErrorSchema]
+
+
 class VirtualBusinessCreateWithUserBatchSchema(BaseModel):
     data: List[VirtualBusinessCreateWithUserSchema]
 
 
 class VirtualBusinessDeleteBatchSchema(BaseModel):
     data: List[UUID]
+
+
+class VirtualBusinessSimulationRequestSchema(BaseModel):
+    paths: int = Field(default=10000, ge=100, le=MAX_SIMULATION_PATHS)
+    horizon: int = Field(default=36, ge=1, le=MAX_SIMULATION_HORIZON)
+    seed: Optional[int] = Field(None, ge=0)
+
+
+class BreakEvenDistributionSchema(BaseModel):
+    probability: float
+    p5: Optional[float] = None
+    p50: Optional[float] = None
+    p95: Optional[float] = None
+    histogram: List[int]
+
+
+class ProfitBandsSchema(BaseModel):
+    p5: List[float]
+    p50: List[float]
+    p95: List[float]
+
+
+class VirtualBusinessSimulationSchema(BaseModel):
+    business_id: UUID
+    horizon: int
+    seed: int
+    paths_requested: int
+    paths_simulated: int
+    truncated: bool
+    elapsed_seconds: float
+    break_even: BreakEvenDistributionSchema
+    profit_bands: ProfitBandsSchema
+    ruin_probability: float
@@ -3,9 +3,10 @@ from typing import Optional
 
 import sqlalchemy.exc
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 
 from src.api.schemes import (
+    BatchDeleteResultSchema,
     Response500Schema,
     PaginationParams,
     OrderParams,
@@ -21,7 +22,7 @@ from src.services.categories.category import (
     CourseCategoryService,
     get_course_category_service,
 )
-from src.utils.helpers import pagination_params
+from src.utils.helpers import get_etag_response, pagination_params
 
 course_categories_router = APIRouter(
     prefix="/education/course-categories",
@@ -36,6 +37,13 @@ course_categories_router = APIRouter(
             "model": CourseCategoryReadSchema,
             "description": "Category found successfully",
         },
+        304: {
+            "description": "Not modified since the ETag of If-None-Match",
+        },
+        400: {
+            "model": Response400Schema,
+            "description": "Invalid cursor or request parameters",
+        },
         404: {
             "model": Response404Schema,
             "description": "Category not found",
@@ -52,6 +60,7 @@ async def get_course_categories(
     search: Optional[str] = Query(None, description="Search by category name"),
     pagination: PaginationParams = Depends(pagination_params),
     order_by: OrderParams = Depends(),
+    if_none_match: Optional[str] = Header(None),
     service: CourseCategoryService = Depends(get_course_category_service),
 ):
     try:
@@ -63,7 +72,15 @@ async def get_course_categories(
         )
         if not category:
             raise HTTPException(status_code=404, detail="Category not found")
-        return category
+        return get_etag_response(category.body, category.etag, if_none_match)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "detail": str(e),
+                "code": "validation_error",
+            },
+        )
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -109,7 +126,7 @@ async def create_or_update_course_categories(
     "",
     responses={
         200: {
-            "model": CourseCategoryDeleteBatchSchema,
+            "model": BatchDeleteResultSchema,
             "description": "Category deleted successfully",
         },
         400: {
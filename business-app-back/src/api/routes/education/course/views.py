@@ -3,9 +3,10 @@ from typing import Optional
 
 import sqlalchemy.exc
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 
 from src.api.schemes import (
+    BatchDeleteResultSchema,
     Response500Schema,
     PaginationParams,
     OrderParams,
@@ -18,7 +19,7 @@ from src.api.routes.education.course.schemes import (
     CourseDeleteBatchSchema,
 )
 from src.services.courses.course import CourseService, get_course_service
-from src.utils.helpers import pagination_params
+from src.utils.helpers import get_etag_response, pagination_params
 
 course_router = APIRouter(
     prefix="/education/courses",
@@ -33,6 +34,13 @@ course_router = APIRouter(
             "model": CourseReadSchema,
             "description": "Course found successfully",
         },
+        304: {
+            "description": "Not modified since the ETag of If-None-Match",
+        },
+        400: {
+            "model": Response400Schema,
+            "description": "Invalid cursor or request parameters",
+        },
         404: {
             "model": Response404Schema,
             "description": "Course not found",
@@ -49,6 +57,7 @@ async def get_courses(
     search: Optional[str] = Query(None, description="Search by course title"),
     pagination: PaginationParams = Depends(pagination_params),
     order_by: OrderParams = Depends(),
+    if_none_match: Optional[str] = Header(None),
     service: CourseService = Depends(get_course_service),
 ):
     try:
@@ -60,7 +69,15 @@ async def get_courses(
         )
         if not course:
             raise HTTPException(status_code=404, detail="Course not found")
-        return course
+        return get_etag_response(course.body, course.etag, if_none_match)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "detail": str(e),
+                "code": "validation_error",
+            },
+        )
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -106,7 +123,7 @@ async def create_or_update_courses(
     "",
     responses={
         200: {
-            "model": CourseDeleteBatchSchema,
+            "model": BatchDeleteResultSchema,
             "description": "Course deleted successfully",
         },
         400: {
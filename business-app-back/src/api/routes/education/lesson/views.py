@@ -3,12 +3,19 @@ from typing import Optional
 
 import sqlalchemy.exc
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 
-from src.api.schemes import Response500Schema, PaginationParams, OrderParams, Response400Schema, Response404Schema
+from src.api.schemes import (
+    BatchDeleteResultSchema,
+    Response500Schema,
+    PaginationParams,
+    OrderParams,
+    Response400Schema,
+    Response404Schema,
+)
 from src.api.routes.education.lesson.schemes import LessonCreateBatchSchema, LessonReadSchema, LessonDeleteBatchSchema
 from src.services.lessons.lesson import LessonService, get_lesson_service
-from src.utils.helpers import pagination_params
+from src.utils.helpers import get_etag_response, pagination_params
 
 lessons_router = APIRouter(
     prefix="/education/lessons",
@@ -23,6 +30,13 @@ lessons_router = APIRouter(
             "model": LessonReadSchema,
             "description": "Lesson found successfully",
         },
+        304: {
+            "description": "Not modified since the ETag of If-None-Match",
+        },
+        400: {
+            "model": Response400Schema,
+            "description": "Invalid cursor or request parameters",
+        },
         404: {
             "model": Response404Schema,
             "description": "Lesson not found",
@@ -40,6 +54,7 @@ async def get_lessons(
     search: Optional[str] = Query(None, description="Search by lesson name"),
     pagination: PaginationParams = Depends(pagination_params),
     order_by: OrderParams = Depends(),
+    if_none_match: Optional[str] = Header(None),
     service: LessonService = Depends(get_lesson_service),
 ):
     try:
@@ -51,7 +66,15 @@ async def get_lessons(
         )
         if not lesson:
             raise HTTPException(status_code=404, detail="Lesson not found")
-        return lesson
+        return get_etag_response(lesson.body, lesson.etag, if_none_match)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "detail": str(e),
+                "code": "validation_error",
+            },
+        )
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -98,7 +121,7 @@ async def create_or_update_contractor_works(
     "",
     responses={
         200: {
-            "model": LessonDeleteBatchSchema,
+            "model": BatchDeleteResultSchema,
             "description": "Lesson deleted successfully",
         },
         400: {
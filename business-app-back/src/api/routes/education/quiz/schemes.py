@@ -13,7 +13,6 @@ class QuizQuestionBaseSchema(IDSchema):
     lesson_id: UUID = Field(..., description="ID урока, к которому относится вопрос")
     question_text: str = Field(..., description="Текст вопроса")
     choices: List[str] | Dict[str, str] = Field(..., description="Варианты ответов (в формате списка строк)")
-    correct_answer: str = Field(..., description="Правильный ответ")
 
 
 class QuizQuestionReadSchema(QuizQuestionBaseSchema):
@@ -48,3 +47,38 @@ class QuizQuestionDeleteBatchSchema(BaseModel):
 
 class QuizQuestionListResponseSchema(ListDataResponseSchema):
     data: List[QuizQuestionReadSchema]
+
+
+class QuizAnswerSchema(BaseModel):
+    question_id: UUID
+    answer: str
+
+
+class QuizLessonAnswersSchema(BaseModel):
+    lesson_id: UUID
+    answers: List[QuizAnswerSchema]
+
+
+class QuizSubmissionSchema(BaseModel):
+    course_id: UUID = Field(..., description="ID курса, к которому относятся уроки")
+    lessons: List[QuizLessonAnswersSchema] = Field(..., min_length=1, description="Ответы по урокам")
+
+
+class QuizQuestionResultSchema(BaseModel):
+    question_id: UUID
+    is_correct: bool
+
+
+class QuizLessonResultSchema(BaseModel):
+    lesson_id: UUID
+    total_questions: int
+    correct_answers: int
+    passed: bool = Field(..., description="У урока есть вопросы, и все они отвечены верно")
+    questions: List[QuizQuestionResultSchema]
+
+
+class QuizGradeResponseSchema(BaseModel):
+    course_id: UUID
+    lessons: List[QuizLessonResultSchema]
+    completed_lessons: int
+    is_completed: bool
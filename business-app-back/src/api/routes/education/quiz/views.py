@@ -1,11 +1,13 @@
 from uuid import UUID
-from typing import Optional
+from typing import Annotated, Optional
 
 import sqlalchemy.exc
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 
+from src.api.routes.auth.fastapi_users_auth_router import current_active_user
 from src.api.schemes import (
+    BatchDeleteResultSchema,
     Response500Schema,
     PaginationParams,
     OrderParams,
@@ -16,12 +18,15 @@ from src.api.routes.education.quiz.schemes import (
     QuizQuestionCreateBatchSchema,
     QuizQuestionReadSchema,
     QuizQuestionDeleteBatchSchema,
+    QuizGradeResponseSchema,
+    QuizSubmissionSchema,
 )
+from src.models.dbo.database_models import User
 from src.services.quiz_questions.quiz_question import (
     QuizQuestionService,
     get_quiz_question_service,
 )
-from src.utils.helpers import pagination_params
+from src.utils.helpers import get_etag_response, pagination_params
 
 quiz_router = APIRouter(
     prefix="/education/quiz-questions",
@@ -36,6 +41,13 @@ quiz_router = APIRouter(
             "model": QuizQuestionReadSchema,
             "description": "Quiz question(s) retrieved successfully",
         },
+        304: {
+            "description": "Not modified since the ETag of If-None-Match",
+        },
+        400: {
+            "model": Response400Schema,
+            "description": "Invalid cursor or request parameters",
+        },
         404: {
             "model": Response404Schema,
             "description": "Quiz question not found",
@@ -62,6 +74,7 @@ async def get_quiz_questions(
     ),
     pagination: PaginationParams = Depends(pagination_params),
     order_by: OrderParams = Depends(),
+    if_none_match: Optional[str] = Header(None),
     service: QuizQuestionService = Depends(get_quiz_question_service),
 ):
     try:
@@ -77,7 +90,15 @@ async def get_quiz_questions(
                 status_code=404,
                 detail="Quiz question not found",
             )
-        return result
+        return get_etag_response(result.body, result.etag, if_none_match)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "detail": str(e),
+                "code": "validation_error",
+            },
+        )
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -123,7 +144,7 @@ async def create_or_update_quiz_questions(
     "",
     responses={
         200: {
-            "model": QuizQuestionDeleteBatchSchema,
+            "model": BatchDeleteResultSchema,
             "description": "Quiz question(s) deleted successfully",
         },
         400: {
@@ -148,3 +169,47 @@ async def delete_quiz_questions(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Resource not found.",
         )
+
+
+@quiz_router.post(
+    "/grade",
+    responses={
+        200: {
+            "model": QuizGradeResponseSchema,
+            "description": "Answers graded successfully",
+        },
+        400: {
+            "model": Response400Schema,
+            "description": "Invalid request",
+        },
+        404: {
+            "model": Response404Schema,
+            "description": "Lesson not found in the course",
+        },
+        500: {
+            "model": Response500Schema,
+            "description": "Server error occurred",
+        },
+    },
+    summary="Grade the quiz answers of whole lessons and update the course progress",
+)
+async def grade_quiz(
+    user: Annotated[
+        User,
+        Depends(current_active_user),
+    ],
+    submission: QuizSubmissionSchema,
+    service: QuizQuestionService = Depends(get_quiz_question_service),
+):
+    try:
+        return await service.grade(user_id=user.id, submission=submission)
+    except LookupError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
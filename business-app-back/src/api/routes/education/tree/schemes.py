@@ -0,0 +1,32 @@
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.api.schemes import ListDataResponseSchema
+
+
+class LessonTreeSchema(BaseModel):
+    id: UUID
+    title: str
+    order: int
+    lesson_url: Optional[str] = None
+    quiz_count: int = Field(0, description="Количество вопросов теста урока")
+
+
+class CourseTreeSchema(BaseModel):
+    id: UUID
+    title: str
+    description: Optional[str] = None
+    lesson_url: Optional[str] = None
+    lessons: list[LessonTreeSchema]
+
+
+class CourseCategoryTreeSchema(BaseModel):
+    id: Optional[UUID] = Field(None, description="ID категории (пусто для курсов без категории)")
+    name: Optional[str] = None
+    courses: list[CourseTreeSchema]
+
+
+class EducationTreeResponseSchema(ListDataResponseSchema):
+    data: list[CourseCategoryTreeSchema]
@@ -0,0 +1,49 @@
+from uuid import UUID
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
+
+from src.api.schemes import Response500Schema
+from src.api.routes.education.tree.schemes import EducationTreeResponseSchema
+from src.services.courses.course import CourseService, get_course_service
+from src.utils.helpers import get_etag_response
+
+tree_router = APIRouter(
+    prefix="/education/tree",
+    tags=["Courses"],
+)
+
+
+@tree_router.get(
+    "",
+    responses={
+        200: {
+            "model": EducationTreeResponseSchema,
+            "description": "Education tree retrieved successfully",
+        },
+        304: {
+            "description": "Not modified since the ETag of If-None-Match",
+        },
+        500: {
+            "model": Response500Schema,
+            "description": "Server error occurred",
+        },
+    },
+    summary="Retrieve categories with their active courses, lessons and quiz question counts",
+)
+async def get_education_tree(
+    category_id: Optional[UUID] = Query(None, description="Only the courses of this category"),
+    if_none_match: Optional[str] = Header(None),
+    service: CourseService = Depends(get_course_service),
+):
+    try:
+        tree = await service.get_tree(category_id=category_id)
+        return get_etag_response(tree.body, tree.etag, if_none_match)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "detail": "Internal server error",
+                "code": "server_error",
+            },
+        )
@@ -40,3 +40,8 @@ class UserCourseProgressDeleteBatchSchema(BaseModel):
 
 class UserCourseProgressListResponseSchema(ListDataResponseSchema):
     data: list[UserCourseProgressReadSchema]
+
+
+class LessonCompletionSchema(BaseModel):
+    course_id: UUID
+    lesson_id: UUID
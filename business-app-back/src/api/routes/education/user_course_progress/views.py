@@ -1,10 +1,13 @@
 from uuid import UUID
-from typing import Optional
+from typing import Annotated, Optional
 
 import sqlalchemy.exc
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
+from src.api.routes.auth.fastapi_users_auth_router import current_active_user
 from src.api.schemes import (
+    BatchDeleteResultSchema,
+    ExportFormat,
     Response400Schema,
     Response404Schema,
     Response500Schema,
@@ -15,11 +18,14 @@ from src.api.routes.education.user_course_progress.schemes import (
     UserCourseProgressCreateBatchSchema,
     UserCourseProgressReadSchema,
     UserCourseProgressDeleteBatchSchema,
+    LessonCompletionSchema,
 )
+from src.models.dbo.database_models import User
 from src.services.user_course_progresses.user_course_progress import (
     UserCourseProgressService,
     get_user_course_progress_service,
 )
+from src.services.common.export import EXPORT_MEDIA_TYPES, get_export_response
 from src.utils.helpers import pagination_params
 
 progress_router = APIRouter(
@@ -74,6 +80,65 @@ async def get_user_progress(
         )
 
 
+@progress_router.get(
+    "/export",
+    responses={
+        200: {
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()},
+            "description": "Progress exported successfully",
+        },
+        400: {
+            "model": Response400Schema,
+            "description": "Invalid request",
+        },
+        500: {
+            "model": Response500Schema,
+            "description": "Server error occurred",
+        },
+    },
+    summary="Export user course progress as NDJSON or CSV",
+)
+async def export_user_progress(
+    user: Annotated[
+        User,
+        Depends(current_active_user),
+    ],
+    user_id: Optional[UUID] = Query(None, description="User ID to filter progress, superusers only"),
+    course_id: Optional[UUID] = Query(None, description="Course ID to filter progress"),
+    export_format: ExportFormat = Query(ExportFormat.ndjson, alias="format"),
+    order_by: OrderParams = Depends(),
+    service: UserCourseProgressService = Depends(get_user_course_progress_service),
+):
+    """
+    Export progress records with the filters of the list endpoint.
+    Superusers can export the progress of any user, other users only their own.
+    """
+    try:
+        chunks = service.export_progress(
+            user_id=user_id if user.is_superuser else user.id,
+            course_id=course_id,
+            order_by=order_by.model_dump()["order_by"],
+            export_format=export_format,
+        )
+        return get_export_response(chunks, export_format, filename="progress")
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "detail": str(e),
+                "code": "validation_error",
+            },
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "detail": "Internal server error",
+                "code": "server_error",
+            },
+        )
+
+
 @progress_router.post(
     "",
     responses={
@@ -109,7 +174,7 @@ async def create_or_update_user_progress(
     "",
     responses={
         200: {
-            "model": UserCourseProgressDeleteBatchSchema,
+            "model": BatchDeleteResultSchema,
             "description": "Progress records deleted successfully",
         },
         400: {
@@ -134,3 +199,42 @@ async def delete_user_progress(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Resource not found or conflict.",
         )
+
+
+@progress_router.post(
+    "/complete-lesson",
+    responses={
+        200: {
+            "model": UserCourseProgressReadSchema,
+            "description": "Lesson completion recorded successfully",
+        },
+        404: {
+            "model": Response404Schema,
+            "description": "Lesson not found in the course",
+        },
+        500: {
+            "model": Response500Schema,
+            "description": "Server error occurred",
+        },
+    },
+    summary="Record a completed lesson in the course progress of the current user",
+)
+async def complete_lesson(
+    user: Annotated[
+        User,
+        Depends(current_active_user),
+    ],
+    data: LessonCompletionSchema,
+    service: UserCourseProgressService = Depends(get_user_course_progress_service),
+):
+    try:
+        return await service.complete_lesson(
+            user_id=user.id,
+            course_id=data.course_id,
+            lesson_id=data.lesson_id,
+        )
+    except LookupError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
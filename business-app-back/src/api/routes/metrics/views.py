@@ -0,0 +1,49 @@
+import hmac
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from src.api.schemes import Response401Schema
+from src.config.app_config import settings
+from src.services.cache import auth_cache, catalog_cache
+from src.services.metrics.instrumentation import register_stats, registry
+from src.services.passwords.hashing import password_hashing_executor
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+register_stats("auth_cache", "Authentication cache", auth_cache.stats)
+register_stats("catalog_cache", "Education catalog cache", catalog_cache.stats)
+register_stats("password_hashing", "Password hashing executor", password_hashing_executor.stats)
+
+metrics_router = APIRouter(
+    prefix="/metrics",
+    tags=["Metrics"],
+)
+
+
+@metrics_router.get(
+    "",
+    response_class=PlainTextResponse,
+    responses={
+        200: {
+            "content": {PROMETHEUS_CONTENT_TYPE: {}},
+            "description": "Metrics of this worker in the Prometheus text format",
+        },
+        401: {
+            "model": Response401Schema,
+            "description": "Missing or invalid metrics token",
+        },
+    },
+    summary="Request, database and pool metrics",
+)
+async def get_metrics(authorization: Optional[str] = Header(None)):
+    if settings.METRICS_TOKEN and not hmac.compare_digest(authorization or "", f"Bearer {settings.METRICS_TOKEN}"):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail={
+                "detail": "Invalid metrics token",
+                "code": "unauthorized",
+            },
+        )
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
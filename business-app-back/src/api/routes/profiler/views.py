@@ -0,0 +1,51 @@
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
+
+from src.api.routes.auth.fastapi_users_auth_router import current_active_super_user
+from src.api.schemes import Response404Schema
+from src.services.profiling.sampler import sampling_profiler
+
+profiler_router = APIRouter(
+    prefix="/profiler",
+    tags=["Profiler"],
+    dependencies=[Depends(current_active_super_user)],
+)
+
+
+@profiler_router.get(
+    "/profile",
+    responses={
+        200: {
+            "content": {"application/octet-stream": {}, "text/plain": {}},
+            "description": "Profile of the window as a pstats file or as collapsed stacks",
+        },
+        404: {
+            "model": Response404Schema,
+            "description": "No profile has been collected for the window",
+        },
+    },
+    summary="Download the aggregated sampling profile",
+)
+async def get_profile(
+    format: Literal["pstats", "collapsed"] = Query("pstats", description="pstats file or flame graph input"),
+    window: Literal["last", "current"] = Query("last", description="Last completed window or the current one"),
+):
+    profile = sampling_profiler.get_window(current=window == "current")
+    if profile is None or not profile.samples:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={
+                "detail": "No samples collected in the window",
+                "code": "not_found",
+            },
+        )
+
+    headers = {"X-Profile-Requests": str(profile.requests)}
+    if format == "collapsed":
+        headers["Content-Disposition"] = 'attachment; filename="profile.collapsed"'
+        return Response(sampling_profiler.to_collapsed(profile), media_type="text/plain", headers=headers)
+
+    headers["Content-Disposition"] = 'attachment; filename="profile.prof"'
+    return Response(sampling_profiler.to_pstats(profile), media_type="application/octet-stream", headers=headers)
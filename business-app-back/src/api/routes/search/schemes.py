@@ -0,0 +1,32 @@
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from src.api.schemes import ListDataResponseSchema
+
+
+class SearchEntityType(str, Enum):
+    business = "business"
+    course = "course"
+    lesson = "lesson"
+    quiz_question = "quiz_question"
+
+
+class SearchHitSchema(BaseModel):
+    type: SearchEntityType = Field(..., description="Тип найденной сущности")
+    id: UUID
+    title: Optional[str] = Field(None, description="Название найденной сущности")
+    highlight: Optional[str] = Field(
+        None,
+        description="Фрагменты текста с совпадениями, выделенными тегом <mark>",
+    )
+    rank: float = Field(..., description="Релевантность совпадения")
+
+    class Config:
+        from_attributes = True
+
+
+class SearchListResponseSchema(ListDataResponseSchema):
+    data: list[SearchHitSchema]
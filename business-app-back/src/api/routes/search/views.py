@@ -0,0 +1,72 @@
+from typing import Annotated, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from src.api.routes.auth.fastapi_users_auth_router import current_active_user
+from src.api.routes.search.schemes import SearchEntityType, SearchListResponseSchema
+from src.api.schemes import (
+    PaginationParams,
+    Response400Schema,
+    Response500Schema,
+)
+from src.models.dbo.database_models import User
+from src.services.search.search import SearchService, get_search_service
+from src.utils.helpers import pagination_params
+
+search_router = APIRouter(
+    prefix="/search",
+    tags=["Search"],
+)
+
+
+@search_router.get(
+    "",
+    responses={
+        200: {
+            "model": SearchListResponseSchema,
+            "description": "Search completed successfully",
+        },
+        400: {
+            "model": Response400Schema,
+            "description": "Invalid request",
+        },
+        500: {
+            "model": Response500Schema,
+            "description": "Server error occurred",
+        },
+    },
+    summary="Full-text search across businesses, courses, lessons and quiz questions",
+)
+async def search(
+    user: Annotated[
+        User,
+        Depends(current_active_user),
+    ],
+    q: str = Query(..., min_length=1, max_length=256, description="Search query (websearch syntax)"),
+    types: Optional[list[SearchEntityType]] = Query(None, description="Entity types to search, all by default"),
+    pagination: PaginationParams = Depends(pagination_params),
+    service: SearchService = Depends(get_search_service),
+):
+    try:
+        return await service.search(
+            text=q,
+            user_id=user.id,
+            pagination=pagination,
+            types=types,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "detail": str(e),
+                "code": "validation_error",
+            },
+        )
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "detail": "Internal server error",
+                "code": "server_error",
+            },
+        )
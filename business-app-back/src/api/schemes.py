@@ -1,10 +1,12 @@
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from functools import cache
+from typing import Any, Callable, Generic, List, NamedTuple, Optional, TypeVar, Union, get_args
 from uuid import UUID
 
 from fastapi import Query
-from pydantic import BaseModel, Field
+from fastapi.responses import Response
+from pydantic import BaseModel, Field, TypeAdapter
 
 T = TypeVar("T")
 
@@ -136,15 +138,16 @@ class PaginationSchema(BaseModel):
         next_page (int | None): number of the next page
         prev_page (int | None): number of the previous page
         total_pages (int): number of total pages
+        next_cursor (str | None): cursor to request the next page with
     """
 
-    total_items: int = Field(
-        ...,
-        description="Total number of elements (must be positive)",
+    total_items: int | None = Field(
+        None,
+        description="Total number of elements (None in cursor mode)",
     )
-    page: int = Field(
-        ...,
-        description="Current page (must be at least 1)",
+    page: int | None = Field(
+        None,
+        description="Current page (None in cursor mode)",
     )
     items_per_page: int = Field(
         ...,
@@ -158,15 +161,38 @@ class PaginationSchema(BaseModel):
         None,
         description="Number of the previous page (can be None)",
     )
-    total_pages: int = Field(
-        ...,
-        description="Number of total pages (must be positive)",
+    total_pages: int | None = Field(
+        None,
+        description="Number of total pages (None in cursor mode)",
+    )
+    next_cursor: str | None = Field(
+        None,
+        description="Opaque cursor of the next page (None on the last page)",
     )
 
 
 class PaginationParams(BaseModel):
     page: int
     per_page: int
+    cursor: Optional[str] = None
+
+
+class SearchResult(NamedTuple):
+    """
+    A page of search results together with the total number of matching rows.
+
+    Attributes:
+        items (list): entities or rows of the current page
+        total (int | None): total number of matching rows (exact or estimated), None in cursor mode
+        next_cursor (str | None): cursor of the next page, None on the last page
+    """
+
+    items: list
+    total: int | None
+    next_cursor: str | None = None
+
+    def map(self, func: Callable[[Any], Any]) -> "SearchResult":
+        return self._replace(items=[func(item) for item in self.items])
 
 
 class SortOrderOptions(str, Enum):
@@ -174,6 +200,11 @@ class SortOrderOptions(str, Enum):
     desc = "desc"
 
 
+class ExportFormat(str, Enum):
+    ndjson = "ndjson"
+    csv = "csv"
+
+
 class BaseSortOptions(str, Enum):
     @classmethod
     def default(cls) -> str:
@@ -225,7 +256,7 @@ class ListDataResponseSchema(Response200Schema, Generic[T]):
     @classmethod
     def create(
         cls,
-        list_data: List[Dict[str, Any]],
+        list_data: Union[SearchResult, list],
         pagination: PaginationParams | None = None,
         total: int | None = None,
         message: str = "Success",
@@ -233,6 +264,11 @@ class ListDataResponseSchema(Response200Schema, Generic[T]):
     ):
         from src.utils.helpers import get_pagination_info
 
+        next_cursor = None
+        if isinstance(list_data, SearchResult):
+            total, next_cursor = list_data.total, list_data.next_cursor
+            list_data = list_data.items
+
         if not additional_data:
             additional_data = dict()
 
@@ -244,9 +280,47 @@ class ListDataResponseSchema(Response200Schema, Generic[T]):
 
         return cls(
             data=list_data,
-            pagination=get_pagination_info(pagination, total),
+            pagination=get_pagination_info(pagination, total, next_cursor),
+            message=message,
+        )
+
+    @classmethod
+    def create_response(
+        cls,
+        list_data: Union[SearchResult, list],
+        pagination: PaginationParams | None = None,
+        total: int | None = None,
+        message: str = "Success",
+    ) -> Response:
+        """
+        Fast path of `create` for rows that are not dicts yet: ORM entities or column rows.
+
+        The rows are validated into the item schema of `data` once, from their attributes, the
+        envelope is assembled without validating them again and the JSON bytes are written by
+        the pydantic-core serializer, so FastAPI returns the response as is.
+        """
+        from src.utils.helpers import get_pagination_info
+
+        next_cursor = None
+        if isinstance(list_data, SearchResult):
+            total, next_cursor = list_data.total, list_data.next_cursor
+            list_data = list_data.items
+
+        response = cls.model_construct(
+            data=get_list_adapter(get_args(cls.model_fields["data"].annotation)[0]).validate_python(
+                list_data, from_attributes=True
+            ),
             message=message,
         )
+        if pagination is not None or total is not None:
+            response.pagination = get_pagination_info(pagination, total, next_cursor)
+
+        return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+@cache
+def get_list_adapter(item_schema: type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[item_schema])  # type: ignore[valid-type]
 
 
 class NamedEntitySchema(BaseModel):
@@ -258,6 +332,42 @@ class IDSchema(BaseModel):
     id: Optional[UUID] = None
 
 
+class BatchItemErrorSchema(BaseModel):
+    """
+    Error of a single item of a batch write.
+
+    Attributes:
+        index (int): position of the item in the request batch
+        id (UUID | None): ID the item refers to
+        detail (str): reason the item was rejected
+    """
+
+    index: int
+    id: Optional[UUID] = None
+    detail: str
+
+
+class BatchDeleteResultSchema(BaseModel):
+    """
+    Result of a batch deletion.
+
+    Attributes:
+        deleted (list[UUID]): IDs of the deleted entities
+        missing (list[UUID]): requested IDs that did not exist
+    """
+
+    deleted: List[UUID]
+    missing: List[UUID]
+
+    @classmethod
+    def create(cls, requested_ids: List[UUID], deleted_ids: List[UUID]) -> "BatchDeleteResultSchema":
+        deleted = set(deleted_ids)
+        return cls(
+            deleted=deleted_ids,
+            missing=[entity_id for entity_id in dict.fromkeys(requested_ids) if entity_id not in deleted],
+        )
+
+
 class PositionBaseFilters(BaseModel):
     position_id: Optional[UUID] = Query(
         None,
@@ -0,0 +1,45 @@
+import asyncio
+
+from sqlalchemy import select
+
+from src.config.database_config import get_async_session
+from src.models.dbo.database_models import Business
+from src.models.managers import BusinessManager
+from src.services.logger import LoggerProvider
+from src.utils.constants import BATCH_SIZE
+
+log = LoggerProvider().get_logger(__name__)
+
+
+async def backfill_break_even(batch_size: int = BATCH_SIZE) -> int:
+    """
+    Recomputes `break_even_months` of all businesses.
+
+    Businesses are processed in batches of IDs, each updated with one statement
+    and committed separately, so the backfill never locks the whole table.
+
+    :param batch_size: Number of businesses per batch.
+    :return: Number of updated businesses.
+    """
+    updated = 0
+    last_id = None
+    async with get_async_session() as session:
+        manager = BusinessManager(session)
+        while True:
+            query = select(Business.id).order_by(Business.id).limit(batch_size)
+            if last_id is not None:
+                query = query.where(Business.id > last_id)
+            business_ids = list(await session.scalars(query))
+            if not business_ids:
+                break
+
+            updated += await manager.recalculate_break_even(business_ids)
+            await session.commit()
+            last_id = business_ids[-1]
+
+    log.info("Break-even recomputed, %s businesses updated", updated)
+    return updated
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill_break_even())
@@ -0,0 +1,39 @@
+import sys
+
+from sqlalchemy import MetaData, PrimaryKeyConstraint, UniqueConstraint
+
+from src.models.dbo.database_models import Base
+
+
+def get_unindexed_foreign_keys(metadata: MetaData) -> list[str]:
+    """
+    Lists the foreign keys of the models that no index can serve.
+
+    A foreign key is covered when its columns are the leading columns of an index,
+    a unique constraint or the primary key of its table.
+
+    :param metadata: Metadata of the models.
+    :return: Descriptions of the uncovered foreign keys.
+    """
+    unindexed = []
+    for table in metadata.sorted_tables:
+        covering = [[column.name for column in index.columns] for index in table.indexes]
+        covering.extend(
+            [column.name for column in constraint.columns]
+            for constraint in table.constraints
+            if isinstance(constraint, (PrimaryKeyConstraint, UniqueConstraint))
+        )
+
+        for foreign_key in table.foreign_key_constraints:
+            columns = [column.name for column in foreign_key.columns]
+            if not any(candidate[: len(columns)] == columns for candidate in covering):
+                unindexed.append(f"{table.name}({', '.join(columns)})")
+    return unindexed
+
+
+if __name__ == "__main__":
+    unindexed_foreign_keys = get_unindexed_foreign_keys(Base.metadata)
+    if unindexed_foreign_keys:
+        print("Foreign keys without an index:", *unindexed_foreign_keys, sep="\n  ")
+        sys.exit(1)
+    print("Every foreign key is indexed")
@@ -0,0 +1,23 @@
+from fastapi import Response, status
+from fastapi.responses import JSONResponse
+from fastapi_users.authentication import AuthenticationBackend
+
+from src.config.authentication.strategy import StatelessJWTStrategy
+from src.models.dbo.database_models import User
+
+
+class RefreshableAuthenticationBackend(AuthenticationBackend):
+    """
+    Authentication backend returning a refresh token along with the access token on login.
+    """
+
+    async def login(self, strategy: StatelessJWTStrategy, user: User) -> Response:  # type: ignore[override]
+        access_token, refresh_token = await strategy.write_tokens(user)
+        return JSONResponse(
+            status_code=status.HTTP_200_OK,
+            content={
+                "access_token": access_token,
+                "refresh_token": refresh_token,
+                "token_type": "bearer",
+            },
+        )
@@ -0,0 +1,245 @@
+import base64
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+import jwt
+from fastapi_users import BaseUserManager, exceptions
+from fastapi_users.authentication.strategy.db import AccessTokenDatabase, DatabaseStrategy
+from fastapi_users.authentication.strategy.jwt import JWTStrategy
+from fastapi_users.jwt import decode_jwt, generate_jwt
+from sqlalchemy import delete, inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.config.app_config import settings
+from src.config.database_config import release_connection
+from src.models.dbo.database_models import AccessToken, User
+from src.services.cache import AuthCache, SessionDenylist
+
+
+async def attach_user(user: User, user_manager: BaseUserManager[User, Any]) -> User:
+    """
+    Attaches a user rebuilt without a query to the session of the request as a persistent instance.
+
+    The columns that were not set are expired, and writes through the user database update
+    the existing row instead of inserting a new one.
+    """
+    make_transient_to_detached(user)
+    return await user_manager.user_db.session.merge(user, load=False)  # type: ignore[attr-defined]
+
+
+class CachedDatabaseStrategy(DatabaseStrategy):
+    """
+    Database strategy that resolves tokens through the auth cache first.
+
+    A cache hit authenticates the request without the access token and user
+    lookups. Users are cached as column snapshots and attached to the session of
+    the current request without a query, so every request works with its own
+    instance. Entries never outlive the token they were created for.
+    """
+
+    def __init__(self, *args, cache: AuthCache, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+
+    async def read_token(
+        self,
+        token: Optional[str],
+        user_manager: BaseUserManager[User, Any],
+    ) -> Optional[User]:
+        if token is None:
+            return None
+
+        snapshot = await self.cache.get_user(token)
+        if snapshot is not None:
+            return await self._restore_user(snapshot, user_manager)
+
+        now = datetime.now(timezone.utc)
+        max_age = None
+        if self.lifetime_seconds:
+            max_age = now - timedelta(seconds=self.lifetime_seconds)
+
+        access_token = await self.database.get_by_token(token, max_age)
+        if access_token is None:
+            return None
+
+        try:
+            parsed_id = user_manager.parse_id(access_token.user_id)
+            user = await user_manager.get(parsed_id)
+        except (exceptions.UserNotExists, exceptions.InvalidID):
+            return None
+        await release_connection(self.database.session)  # type: ignore[attr-defined]
+
+        ttl: float = settings.AUTH_CACHE_TTL_SECONDS
+        if self.lifetime_seconds:
+            expires_at = access_token.created_at + timedelta(seconds=self.lifetime_seconds)
+            ttl = min(ttl, (expires_at - now).total_seconds())
+
+        await self.cache.set_user(token, user.id, self._snapshot_user(user), ttl)
+        return user
+
+    async def destroy_token(self, token: str, user: User) -> None:
+        await self.cache.invalidate_token(token)
+        await super().destroy_token(token, user)
+
+    @staticmethod
+    def _snapshot_user(user: User) -> dict[str, Any]:
+        return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+    @staticmethod
+    async def _restore_user(snapshot: dict[str, Any], user_manager: BaseUserManager[User, Any]) -> User:
+        return await attach_user(User(**snapshot), user_manager)
+
+
+class StatelessJWTStrategy(JWTStrategy[User, Any]):
+    """
+    Strategy issuing short-lived signed access tokens and long-lived refresh tokens.
+
+    The access token embeds the user flags checked by the authentication
+    dependencies, so reading it needs no database access: the user is rebuilt from
+    the claims and attached to the request session without a query, holding only these
+    fields. Every login opens a session stored in the `accesstoken` table under the hash
+    of its refresh token; logging out deletes it, and the session denylist rejects its
+    access tokens. Refreshing replaces the session, so every refresh token is single-use.
+    """
+
+    token_type = "access"
+
+    def __init__(
+        self,
+        *args,
+        access_tokens_db: AccessTokenDatabase[AccessToken],
+        denylist: SessionDenylist,
+        refresh_lifetime_seconds: int,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.access_tokens_db = access_tokens_db
+        self.denylist = denylist
+        self.refresh_lifetime_seconds = refresh_lifetime_seconds
+
+    async def read_token(
+        self,
+        token: Optional[str],
+        user_manager: BaseUserManager[User, Any],
+    ) -> Optional[User]:
+        claims = self._decode(token)
+        if claims is None:
+            return None
+
+        try:
+            user_id = user_manager.parse_id(claims["sub"])
+        except exceptions.InvalidID:
+            return None
+
+        user = User(
+            id=user_id,
+            email=claims["email"],
+            is_active=claims["is_active"],
+            is_superuser=claims["is_superuser"],
+            is_verified=claims["is_verified"],
+        )
+        return await attach_user(user, user_manager)
+
+    async def write_token(self, user: User) -> str:
+        access_token, _ = await self.write_tokens(user)
+        return access_token
+
+    async def write_tokens(self, user: User) -> tuple[str, str]:
+        """
+        Opens a new session for the user.
+
+        :return: Access token and refresh token of the session.
+        """
+        refresh_token = secrets.token_urlsafe()
+        session_id = self._session_id(refresh_token)
+        await self.access_tokens_db.create({"token": session_id, "user_id": user.id})
+        return self._generate_access_token(user, session_id), refresh_token
+
+    async def refresh(
+        self,
+        refresh_token: str,
+        user_manager: BaseUserManager[User, Any],
+    ) -> Optional[tuple[str, str]]:
+        """
+        Rotates the session of the refresh token: the session is consumed and a new one is opened.
+
+        The session row is deleted with ``DELETE ... RETURNING``, so of concurrent refreshes
+        with the same token only one succeeds, and a refresh token can never be used twice.
+        The access tokens of the consumed session are denied. The user is loaded from the
+        database, so deactivated users can no longer refresh and changed flags are picked up.
+
+        :return: Access token and refresh token of the new session, or None if the session
+            does not exist, expired or belongs to an inactive user.
+        """
+        session_id = self._session_id(refresh_token)
+        max_age = datetime.now(timezone.utc) - timedelta(seconds=self.refresh_lifetime_seconds)
+        db_session = self.access_tokens_db.session  # type: ignore[attr-defined]
+        columns = AccessToken.__table__.c
+        user_id = await db_session.scalar(
+            delete(AccessToken)
+            .where(columns.token == session_id, columns.created_at >= max_age)
+            .returning(AccessToken.user_id)
+        )
+        await db_session.commit()
+        if user_id is None:
+            return None
+        self.denylist.deny(session_id)
+
+        try:
+            user = await user_manager.get(user_manager.parse_id(user_id))
+        except (exceptions.UserNotExists, exceptions.InvalidID):
+            return None
+        if not user.is_active:
+            return None
+
+        return await self.write_tokens(user)
+
+    async def destroy_token(self, token: str, user: User) -> None:
+        claims = self._decode(token)
+        if claims is None:
+            return
+
+        session_id = claims["sid"]
+        access_token = await self.access_tokens_db.get_by_token(session_id)
+        if access_token is not None:
+            await self.access_tokens_db.delete(access_token)
+        self.denylist.deny(session_id)
+
+    def _decode(self, token: Optional[str]) -> Optional[dict[str, Any]]:
+        if token is None:
+            return None
+
+        try:
+            claims = decode_jwt(token, self.decode_key, self.token_audience, algorithms=[self.algorithm])
+        except jwt.PyJWTError:
+            return None
+
+        if claims.get("type") != self.token_type or self.denylist.is_denied(claims["sid"]):
+            return None
+        self.denylist.track(claims["sid"], claims["exp"])
+        return claims
+
+    def _generate_access_token(self, user: User, session_id: str) -> str:
+        data = {
+            "sub": str(user.id),
+            "aud": self.token_audience,
+            "type": self.token_type,
+            "sid": session_id,
+            "email": user.email,
+            "is_active": user.is_active,
+            "is_superuser": user.is_superuser,
+            "is_verified": user.is_verified,
+        }
+        return generate_jwt(data, self.encode_key, self.lifetime_seconds, algorithm=self.algorithm)
+
+    @staticmethod
+    def _session_id(refresh_token: str) -> str:
+        """
+        Derives the session id stored in `accesstoken.token` from the refresh token.
+
+        The unpadded base64url form of the SHA-256 digest is 43 characters long, the length of the column.
+        """
+        digest = hashlib.sha256(refresh_token.encode()).digest()
+        return base64.urlsafe_b64encode(digest).decode().rstrip("=")
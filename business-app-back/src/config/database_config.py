@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 
 from src.config.app_config import settings
 from src.services.logger import LoggerProvider
+from src.services.metrics.instrumentation import InstrumentedAsyncAdaptedQueuePool, instrument_engine
 
 
 log = LoggerProvider().get_logger(__name__)
@@ -18,7 +19,9 @@ async_engine = create_async_engine(
     pool_size=15,
     max_overflow=30,
     pool_timeout=100.0,
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
 )
+instrument_engine(async_engine)
 async_session = async_sessionmaker(
     async_engine,
     expire_on_commit=False,
@@ -39,6 +42,19 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
-async def get_session():
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with get_async_session() as session:
         yield session
+
+
+async def release_connection(session: AsyncSession) -> None:
+    """
+    Ends the transaction begun by the reads of the session, so its connection goes back to the pool.
+
+    Loaded objects stay usable since the sessions do not expire on commit, and the next
+    statement checks out a connection again. Call it after the reads a request needs and
+    before long CPU-bound work, never while the transaction holds writes that may still
+    have to be rolled back.
+    """
+    if session.in_transaction():
+        await session.commit()
@@ -1,9 +1,9 @@
 import os
 
-from typing import Optional
+from typing import Literal, Optional
 from dotenv import load_dotenv
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, model_validator
 
 
 class Settings(BaseModel):
@@ -17,6 +17,47 @@ class Settings(BaseModel):
     RESET_PASSWORD_TOKEN_SECRET: str
     VERIFICATION_TOKEN_SECRET: str
 
+    AUTH_CACHE_BACKEND: str = "local"
+    AUTH_CACHE_MAX_SIZE: int = 10000
+    AUTH_CACHE_TTL_SECONDS: int = 60
+
+    CATALOG_CACHE_BACKEND: str = "local"
+    CATALOG_CACHE_MAX_SIZE: int = 2000
+    CATALOG_CACHE_TTL_SECONDS: int = 300
+
+    QUIZ_ANSWER_INDEX_MAX_LESSONS: int = 1000
+    QUIZ_ANSWER_INDEX_TTL_SECONDS: int = 300
+
+    AUTH_BACKEND: Literal["database", "jwt"] = "database"
+    JWT_TOKEN_SECRET: Optional[str] = None
+    JWT_LIFETIME_SECONDS: int = 300
+    JWT_REFRESH_LIFETIME_SECONDS: int = 14 * 24 * 3600
+    AUTH_DENYLIST_SYNC_SECONDS: int = 30
+
+    PASSWORD_HASHING_WORKERS: int = 2
+    PASSWORD_HASHING_MAX_PENDING: int = 64
+    PASSWORD_ARGON2_TIME_COST: int = 3
+    PASSWORD_ARGON2_MEMORY_COST: int = 65536
+    PASSWORD_ARGON2_PARALLELISM: int = 4
+
+    SIMULATION_WORKERS: int = 0
+    SIMULATION_CHUNK_PATHS: int = 2000
+    SIMULATION_TIME_BUDGET_SECONDS: float = 5.0
+
+    LOG_LEVEL: str = "INFO"
+    LOG_LEVELS: str = ""
+    LOG_FORMAT: Literal["json", "text"] = "json"
+    LOG_SAMPLE_RATE: float = 1.0
+
+    PROFILER_ENABLED: bool = False
+    PROFILER_PATHS: str = ""
+    PROFILER_TOKEN: Optional[str] = None
+    PROFILER_SAMPLE_RATE: float = 1.0
+    PROFILER_INTERVAL_MS: float = 5.0
+    PROFILER_WINDOW_SECONDS: int = 300
+
+    METRICS_TOKEN: Optional[str] = None
+
     DB_HOST: str
     DB_PORT: str
     DB_DRIVER_NAME: str
@@ -24,6 +65,12 @@ class Settings(BaseModel):
     DB_USERNAME: str
     DB_PASSWORD: str
 
+    @model_validator(mode="after")
+    def check_jwt_secret(self) -> "Settings":
+        if self.AUTH_BACKEND == "jwt" and not self.JWT_TOKEN_SECRET:
+            raise ValueError("JWT_TOKEN_SECRET is required for the jwt authentication backend")
+        return self
+
     @property
     def get_db_creds(self):
         return {
@@ -0,0 +1,26 @@
+"""add index on business break even months
+
+Revision ID: 3b7e2c9d41a6
+Revises: 9ff6f8a9bcbb
+Create Date: 2026-10-18 09:12:40.512318
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7e2c9d41a6"
+down_revision: Union[str, None] = "9ff6f8a9bcbb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f("ix_business_break_even_months"), "business", ["break_even_months"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_business_break_even_months"), table_name="business")
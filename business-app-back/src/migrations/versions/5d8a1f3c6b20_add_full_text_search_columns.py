@@ -0,0 +1,67 @@
+"""add full-text search columns
+
+Revision ID: 5d8a1f3c6b20
+Revises: 7c41d0e5a2f9
+Create Date: 2026-10-18 14:21:08.530417
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5d8a1f3c6b20"
+down_revision: Union[str, None] = "7c41d0e5a2f9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = {
+    "business": [("name", "A"), ("description", "B")],
+    "course": [("title", "A"), ("description", "B")],
+    "lesson": [("title", "A"), ("content", "B")],
+    "quiz_question": [("question_text", "A")],
+}
+
+
+def get_search_vector_expression(weighted_columns: list[tuple[str, str]]) -> str:
+    return " || ".join(
+        f"setweight(to_tsvector('russian', coalesce({column}, '')), '{weight}')" for column, weight in weighted_columns
+    )
+
+
+def upgrade() -> None:
+    for table, weighted_columns in SEARCH_COLUMNS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                "search_vector",
+                postgresql.TSVECTOR(),
+                sa.Computed(get_search_vector_expression(weighted_columns), persisted=True),
+                nullable=False,
+            ),
+        )
+
+    # Built concurrently so that the tables stay writable while the indexes are created
+    with op.get_context().autocommit_block():
+        for table in SEARCH_COLUMNS:
+            op.create_index(
+                f"ix_{table}_search_vector",
+                table,
+                ["search_vector"],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in SEARCH_COLUMNS:
+            op.drop_index(f"ix_{table}_search_vector", table_name=table, postgresql_concurrently=True)
+
+    for table in SEARCH_COLUMNS:
+        op.drop_column(table, "search_vector")
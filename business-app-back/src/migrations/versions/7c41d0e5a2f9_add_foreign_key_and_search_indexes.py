@@ -0,0 +1,73 @@
+"""add foreign key and search indexes
+
+Revision ID: 7c41d0e5a2f9
+Revises: 3b7e2c9d41a6
+Create Date: 2026-10-18 11:03:27.184562
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7c41d0e5a2f9"
+down_revision: Union[str, None] = "3b7e2c9d41a6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_accesstoken_user_id", "accesstoken", ["user_id"]),
+    ("ix_business_owner_id", "business", ["owner_id"]),
+    ("ix_business_business_type", "business", ["business_type"]),
+    ("ix_course_category_id", "course", ["category_id"]),
+    ("ix_lesson_course_id", "lesson", ["course_id"]),
+    ("ix_message_user_id", "message", ["user_id"]),
+    ("ix_notification_user_id_is_read", "notification", ["user_id", "is_read"]),
+    ("ix_profit_physical_business_settings_id", "profit_physical_business", ["settings_id"]),
+    ("ix_profit_virtual_business_settings_id", "profit_virtual_business", ["settings_id"]),
+    ("ix_quiz_question_lesson_id", "quiz_question", ["lesson_id"]),
+    ("ix_report_business_id", "report", ["business_id"]),
+    ("ix_stock_exchange_id", "stock", ["exchange_id"]),
+    ("ix_strategy_physical_business_settings_id", "strategy_physical_business", ["settings_id"]),
+    ("ix_transaction_business_id", "transaction", ["business_id"]),
+    ("ix_user_achievements_achievement_id", "user_achievements", ["achievement_id"]),
+    ("ix_user_briefcase_settings_id", "user_briefcase", ["settings_id"]),
+    ("ix_user_course_progress_user_id_course_id", "user_course_progress", ["user_id", "course_id"]),
+    ("ix_user_course_progress_course_id", "user_course_progress", ["course_id"]),
+    ("ix_user_roles_role_id", "user_roles", ["role_id"]),
+]
+
+TRIGRAM_INDEXES = [
+    ("ix_business_name_trgm", "business", "name"),
+    ("ix_course_title_trgm", "course", "title"),
+    ("ix_course_category_name_trgm", "course_category", "name"),
+    ("ix_lesson_title_trgm", "lesson", "title"),
+    ("ix_quiz_question_question_text_trgm", "quiz_question", "question_text"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Built concurrently so that the tables stay writable while the indexes are created
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        for name, table, column in TRIGRAM_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                unique=False,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in TRIGRAM_INDEXES + INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,66 @@
+"""unique user course progress
+
+Revision ID: 9a4e6b2d7f13
+Revises: 5d8a1f3c6b20
+Create Date: 2026-10-18 16:42:55.104829
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9a4e6b2d7f13"
+down_revision: Union[str, None] = "5d8a1f3c6b20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CONSTRAINT_NAME = "uq_user_course_progress_user_id_course_id"
+
+
+def upgrade() -> None:
+    # keep the most advanced row of every (user_id, course_id) pair
+    op.execute(
+        """
+        DELETE FROM user_course_progress
+        WHERE id IN (
+            SELECT id
+            FROM (
+                SELECT
+                    id,
+                    row_number() OVER (
+                        PARTITION BY user_id, course_id
+                        ORDER BY is_completed DESC, completed_lessons DESC, updated_at DESC
+                    ) AS position
+                FROM user_course_progress
+            ) AS ranked
+            WHERE position > 1
+        )
+        """
+    )
+
+    # the unique index is built concurrently and then attached as the constraint
+    with op.get_context().autocommit_block():
+        op.create_index(
+            CONSTRAINT_NAME,
+            "user_course_progress",
+            ["user_id", "course_id"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+    op.execute(
+        f"ALTER TABLE user_course_progress ADD CONSTRAINT {CONSTRAINT_NAME} UNIQUE USING INDEX {CONSTRAINT_NAME}"
+    )
+    op.drop_index("ix_user_course_progress_user_id_course_id", table_name="user_course_progress")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_user_course_progress_user_id_course_id",
+        "user_course_progress",
+        ["user_id", "course_id"],
+        unique=False,
+    )
+    op.drop_constraint(CONSTRAINT_NAME, "user_course_progress", type_="unique")
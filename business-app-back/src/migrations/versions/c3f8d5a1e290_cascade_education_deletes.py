@@ -0,0 +1,35 @@
+"""cascade education deletes
+
+Revision ID: c3f8d5a1e290
+Revises: 9a4e6b2d7f13
+Create Date: 2026-10-18 17:58:12.640193
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c3f8d5a1e290"
+down_revision: Union[str, None] = "9a4e6b2d7f13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FOREIGN_KEYS = [
+    ("lesson_course_id_fkey", "lesson", "course", "course_id"),
+    ("quiz_question_lesson_id_fkey", "quiz_question", "lesson", "lesson_id"),
+]
+
+
+def upgrade() -> None:
+    for name, source_table, referent_table, column in FOREIGN_KEYS:
+        op.drop_constraint(name, source_table, type_="foreignkey")
+        op.create_foreign_key(name, source_table, referent_table, [column], ["id"], ondelete="CASCADE")
+
+
+def downgrade() -> None:
+    for name, source_table, referent_table, column in FOREIGN_KEYS:
+        op.drop_constraint(name, source_table, type_="foreignkey")
+        op.create_foreign_key(name, source_table, referent_table, [column], ["id"])
@@ -0,0 +1,38 @@
+"""add lesson completion
+
+Revision ID: e7b2c4a9d105
+Revises: c3f8d5a1e290
+Create Date: 2026-10-18 19:05:41.218503
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7b2c4a9d105"
+down_revision: Union[str, None] = "c3f8d5a1e290"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # the lessons behind the existing counters are unknown, so they cannot be backfilled
+    op.create_table(
+        "lesson_completion",
+        sa.Column("user_id", sa.UUID(), nullable=False),
+        sa.Column("lesson_id", sa.UUID(), nullable=False),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=False, comment="Время завершения урока"),
+        sa.ForeignKeyConstraint(["lesson_id"], ["lesson.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "lesson_id"),
+    )
+    op.create_index(op.f("ix_lesson_completion_lesson_id"), "lesson_completion", ["lesson_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_lesson_completion_lesson_id"), table_name="lesson_completion")
+    op.drop_table("lesson_completion")
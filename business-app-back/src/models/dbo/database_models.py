@@ -25,9 +25,14 @@ from sqlalchemy import (
     Table,
     Column,
     Numeric,
+    Index,
+    Computed,
+    UniqueConstraint,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import (
     Mapped,
+    MappedColumn,
     relationship,
     DeclarativeBase,
     mapped_column,
@@ -38,6 +43,7 @@ from src.models.dbo.mixins import (
     TimestampMixin,
     ImageMixin,
 )
+from src.utils.constants import SEARCH_CONFIG
 
 
 if TYPE_CHECKING:
@@ -48,6 +54,35 @@ class Base(DeclarativeBase):
     pass
 
 
+def trigram_index(table_name: str, column_name: str) -> Index:
+    """
+    GIN trigram index serving substring (`__ilike`) searches on the column.
+    """
+    return Index(
+        f"ix_{table_name}_{column_name}_trgm",
+        column_name,
+        postgresql_using="gin",
+        postgresql_ops={column_name: "gin_trgm_ops"},
+    )
+
+
+def search_vector_column(*weighted_columns: tuple[str, str]) -> MappedColumn:
+    """
+    Generated full-text search column over the given (column, weight) pairs.
+
+    The column is deferred, so it is only loaded when explicitly selected.
+    """
+    expression = " || ".join(
+        f"setweight(to_tsvector('{SEARCH_CONFIG}', coalesce({column}, '')), '{weight}')"
+        for column, weight in weighted_columns
+    )
+    return mapped_column(TSVECTOR, Computed(expression, persisted=True), deferred=True)
+
+
+def search_vector_index(table_name: str) -> Index:
+    return Index(f"ix_{table_name}_search_vector", "search_vector", postgresql_using="gin")
+
+
 class BusinessType(str, Enum):
     PHYSICAL = "PHYSICAL"
     VIRTUAL = "VIRTUAL"
@@ -69,14 +104,14 @@ user_roles = Table(
     "user_roles",
     Base.metadata,
     Column("user_id", ForeignKey("user.id"), primary_key=True),
-    Column("role_id", ForeignKey("role.id"), primary_key=True),
+    Column("role_id", ForeignKey("role.id"), primary_key=True, index=True),
 )
 
 user_achievements = Table(
     "user_achievements",
     Base.metadata,
     Column("user_id", ForeignKey("user.id"), primary_key=True),
-    Column("achievement_id", ForeignKey("achievement.id"), primary_key=True),
+    Column("achievement_id", ForeignKey("achievement.id"), primary_key=True, index=True),
     Column("unlocked_at", DateTime(timezone=True), default=datetime.utcnow),
 )
 
@@ -99,6 +134,7 @@ class AccessToken(SQLAlchemyBaseAccessTokenTableUUID, Base):
     user_id: Mapped[UUID] = mapped_column(
         ForeignKey("user.id", ondelete="cascade"),
         nullable=False,
+        index=True,
     )
 
     @classmethod
@@ -141,6 +177,10 @@ class UserProfile(Base, IDMixin, TimestampMixin):
 
 class Business(Base, IDMixin, TimestampMixin):
     __tablename__ = "business"
+    __table_args__ = (
+        trigram_index("business", "name"),
+        search_vector_index("business"),
+    )
 
     name: Mapped[str] = mapped_column(
         String(100),
@@ -152,6 +192,7 @@ class Business(Base, IDMixin, TimestampMixin):
     )
     business_type: Mapped[BusinessType] = mapped_column(
         SqlEnum(BusinessType),
+        index=True,
         comment="Тип бизнеса: physical или virtual",
     )
     initial_investment: Mapped[Decimal] = mapped_column(
@@ -169,10 +210,12 @@ class Business(Base, IDMixin, TimestampMixin):
     )
     break_even_months: Mapped[Optional[Decimal]] = mapped_column(
         Numeric,
+        index=True,
         comment="Расчетный срок окупаемости в месяцах",
     )
+    search_vector: Mapped[str] = search_vector_column(("name", "A"), ("description", "B"))
 
-    owner_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"))
+    owner_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"), index=True)
     owner: Mapped["User"] = relationship(
         back_populates="businesses",
     )
@@ -322,7 +365,7 @@ class UserStats(Base, IDMixin):
 class StrategyPhysicalBusiness(Base, IDMixin):
     __tablename__ = "strategy_physical_business"
 
-    settings_id: Mapped[UUID] = mapped_column(ForeignKey("physical_business_settings.id"))
+    settings_id: Mapped[UUID] = mapped_column(ForeignKey("physical_business_settings.id"), index=True)
     name: Mapped[str] = mapped_column(String(100), comment="Название стратегии (например: 'Оптимизация логистики')")
     description: Mapped[str] = mapped_column(Text(), comment="Подробное описание стратегии")
     parameters: Mapped[JSON] = mapped_column(JSON, comment="Параметры стратегии в JSON-формате")
@@ -333,7 +376,7 @@ class StrategyPhysicalBusiness(Base, IDMixin):
 class UserBriefcase(Base, IDMixin):
     __tablename__ = "user_briefcase"
 
-    settings_id: Mapped[UUID] = mapped_column(ForeignKey("virtual_business_settings.id"))
+    settings_id: Mapped[UUID] = mapped_column(ForeignKey("virtual_business_settings.id"), index=True)
     assets: Mapped[JSON] = mapped_column(JSON, comment="Активы в портфеле (например: {'акции': ['AAPL', 'TSLA']})")
     balance: Mapped[Decimal] = mapped_column(Numeric, comment="Текущий баланс виртуальных средств")
 
@@ -352,7 +395,7 @@ class StockExchange(Base, IDMixin):
 class Stock(Base, IDMixin):
     __tablename__ = "stock"
 
-    exchange_id: Mapped[UUID] = mapped_column(ForeignKey("stock_exchange.id"))
+    exchange_id: Mapped[UUID] = mapped_column(ForeignKey("stock_exchange.id"), index=True)
     symbol: Mapped[str] = mapped_column(String(10), unique=True, comment="Тикер акции (например: 'AAPL')")
     name: Mapped[str] = mapped_column(String(100), comment="Полное название компании")
     current_price: Mapped[Decimal] = mapped_column(Numeric, comment="Текущая цена акции")
@@ -363,7 +406,7 @@ class Stock(Base, IDMixin):
 class Report(Base, IDMixin, TimestampMixin):
     __tablename__ = "report"
 
-    business_id: Mapped[UUID] = mapped_column(ForeignKey("business.id"))
+    business_id: Mapped[UUID] = mapped_column(ForeignKey("business.id"), index=True)
     period_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), comment="Начало отчетного периода")
     period_end: Mapped[datetime] = mapped_column(DateTime(timezone=True), comment="Конец отчетного периода")
     metrics: Mapped[JSON] = mapped_column(JSON, comment="Метрики в формате JSON (например: {'прибыль': 5000})")
@@ -404,7 +447,7 @@ class AppSettings(Base, IDMixin):
 class Message(Base, IDMixin, TimestampMixin):
     __tablename__ = "message"
 
-    user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"))
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"), index=True)
     content: Mapped[str] = mapped_column(Text(), comment="Текст сообщения")
     is_read: Mapped[bool] = mapped_column(Boolean, default=False, comment="Флаг прочтения сообщения")
 
@@ -413,6 +456,7 @@ class Message(Base, IDMixin, TimestampMixin):
 
 class Notification(Base, IDMixin, TimestampMixin):
     __tablename__ = "notification"
+    __table_args__ = (Index("ix_notification_user_id_is_read", "user_id", "is_read"),)
 
     user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"))
     title: Mapped[str] = mapped_column(String(100), comment="Заголовок уведомления")
@@ -425,7 +469,7 @@ class Notification(Base, IDMixin, TimestampMixin):
 class ProfitPhysicalBusiness(Base, IDMixin, TimestampMixin):
     __tablename__ = "profit_physical_business"
 
-    settings_id: Mapped[UUID] = mapped_column(ForeignKey("physical_business_settings.id"))
+    settings_id: Mapped[UUID] = mapped_column(ForeignKey("physical_business_settings.id"), index=True)
     amount: Mapped[Decimal] = mapped_column(
         Numeric,
         comment="Сумма прибыли",
@@ -443,7 +487,7 @@ class ProfitPhysicalBusiness(Base, IDMixin, TimestampMixin):
 class ProfitVirtualBusiness(Base, IDMixin, TimestampMixin):
     __tablename__ = "profit_virtual_business"
 
-    settings_id: Mapped[UUID] = mapped_column(ForeignKey("virtual_business_settings.id"))
+    settings_id: Mapped[UUID] = mapped_column(ForeignKey("virtual_business_settings.id"), index=True)
     amount: Mapped[Decimal] = mapped_column(
         Numeric,
         comment="Сумма прибыли в виртуальной валюте",
@@ -461,7 +505,7 @@ class ProfitVirtualBusiness(Base, IDMixin, TimestampMixin):
 class Transaction(Base, IDMixin, TimestampMixin):
     __tablename__ = "transaction"
 
-    business_id: Mapped[UUID] = mapped_column(ForeignKey("business.id"))
+    business_id: Mapped[UUID] = mapped_column(ForeignKey("business.id"), index=True)
     amount: Mapped[Decimal] = mapped_column(
         Numeric,
         comment="Сумма транзакции",
@@ -482,6 +526,7 @@ class Transaction(Base, IDMixin, TimestampMixin):
 
 class CourseCategory(Base, IDMixin):
     __tablename__ = "course_category"
+    __table_args__ = (trigram_index("course_category", "name"),)
 
     name: Mapped[str] = mapped_column(String(100), unique=True, comment="Название категории курса")
     description: Mapped[Optional[str]] = mapped_column(Text(), comment="Описание категории")
@@ -491,51 +536,89 @@ class CourseCategory(Base, IDMixin):
 
 class Course(Base, IDMixin, TimestampMixin, ImageMixin):
     __tablename__ = "course"
+    __table_args__ = (
+        trigram_index("course", "title"),
+        search_vector_index("course"),
+    )
 
     title: Mapped[str] = mapped_column(String(100), comment="Название курса")
     description: Mapped[Optional[str]] = mapped_column(Text(), comment="Описание курса")
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, comment="Флаг активности курса")
     category_id: Mapped[Optional[UUID]] = mapped_column(
-        ForeignKey("course_category.id", ondelete="SET NULL"), comment="Категория курса"
+        ForeignKey("course_category.id", ondelete="SET NULL"), index=True, comment="Категория курса"
     )
     lesson_url: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, comment="Ссылка на видео по курсу")
+    search_vector: Mapped[str] = search_vector_column(("title", "A"), ("description", "B"))
 
     category: Mapped["CourseCategory"] = relationship(back_populates="courses")
-    lessons: Mapped[List["Lesson"]] = relationship(back_populates="course", cascade="all, delete-orphan")
+    lessons: Mapped[List["Lesson"]] = relationship(
+        back_populates="course",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        order_by="Lesson.order",
+    )
     progress: Mapped[List["UserCourseProgress"]] = relationship(back_populates="course")
 
 
 class Lesson(Base, IDMixin, TimestampMixin, ImageMixin):
     __tablename__ = "lesson"
+    __table_args__ = (
+        trigram_index("lesson", "title"),
+        search_vector_index("lesson"),
+    )
 
-    course_id: Mapped[UUID] = mapped_column(ForeignKey("course.id"))
+    course_id: Mapped[UUID] = mapped_column(ForeignKey("course.id", ondelete="CASCADE"), index=True)
     title: Mapped[str] = mapped_column(String(100), comment="Название урока")
     content: Mapped[str] = mapped_column(Text(), comment="Контент урока")
     order: Mapped[int] = mapped_column(Integer, comment="Порядковый номер в курсе")
     lesson_url: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, comment="Ссылка на урок")
+    search_vector: Mapped[str] = search_vector_column(("title", "A"), ("content", "B"))
 
     course: Mapped["Course"] = relationship(back_populates="lessons")
-    quizzes: Mapped[List["QuizQuestion"]] = relationship(back_populates="lesson", cascade="all, delete-orphan")
+    quizzes: Mapped[List["QuizQuestion"]] = relationship(
+        back_populates="lesson",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
 
 
 class QuizQuestion(Base, IDMixin):
     __tablename__ = "quiz_question"
+    __table_args__ = (
+        trigram_index("quiz_question", "question_text"),
+        search_vector_index("quiz_question"),
+    )
 
-    lesson_id: Mapped[UUID] = mapped_column(ForeignKey("lesson.id"))
+    lesson_id: Mapped[UUID] = mapped_column(ForeignKey("lesson.id", ondelete="CASCADE"), index=True)
     question_text: Mapped[str] = mapped_column(Text(), comment="Текст вопроса")
     choices: Mapped[JSON] = mapped_column(JSON, comment="Список вариантов ответов в формате JSON")
     correct_answer: Mapped[str] = mapped_column(String(100), comment="Правильный ответ")
+    search_vector: Mapped[str] = search_vector_column(("question_text", "A"))
 
     lesson: Mapped["Lesson"] = relationship(back_populates="quizzes")
 
 
 class UserCourseProgress(Base, IDMixin, TimestampMixin):
     __tablename__ = "user_course_progress"
+    __table_args__ = (UniqueConstraint("user_id", "course_id", name="uq_user_course_progress_user_id_course_id"),)
 
     user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id"))
-    course_id: Mapped[UUID] = mapped_column(ForeignKey("course.id"))
+    course_id: Mapped[UUID] = mapped_column(ForeignKey("course.id"), index=True)
     completed_lessons: Mapped[int] = mapped_column(Integer, default=0, comment="Количество завершенных уроков")
     is_completed: Mapped[bool] = mapped_column(Boolean, default=False, comment="Флаг завершения курса")
 
     user: Mapped["User"] = relationship("User")
     course: Mapped["Course"] = relationship(back_populates="progress")
+
+
+class LessonCompletion(Base):
+    """
+    A lesson completed by a user. `UserCourseProgress.completed_lessons` counts these rows,
+    so completing the same lesson again does not advance the progress.
+    """
+
+    __tablename__ = "lesson_completion"
+
+    user_id: Mapped[UUID] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    lesson_id: Mapped[UUID] = mapped_column(ForeignKey("lesson.id", ondelete="CASCADE"), primary_key=True, index=True)
+    completed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), comment="Время завершения урока")
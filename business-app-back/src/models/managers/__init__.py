@@ -8,3 +8,5 @@ from .course import CourseManager
 from .quiz_question import QuizQuestionManager
 from .user_course_progress import UserCourseProgressManager
 from .user_profile import UserProfileManager
+from .search import SearchManager
+from .transaction import TransactionManager
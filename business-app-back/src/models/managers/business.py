@@ -1,5 +1,17 @@
+import typing
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import CursorResult, Numeric, and_, case, cast, func, select, update
+from sqlalchemy.orm import aliased, joinedload
+
 from src.services.logger import LoggerProvider
-from src.models.dbo.database_models import Business
+from src.models.dbo.database_models import (
+    Business,
+    BusinessType,
+    PhysicalBusinessSettings,
+    VirtualBusinessSettings,
+)
 
 from .common import BaseManager
 
@@ -8,3 +20,95 @@ log = LoggerProvider().get_logger(__name__)
 
 class BusinessManager(BaseManager):
     entity = Business
+
+    async def get_with_settings(self, business_id: UUID, owner_id: UUID) -> Optional[Business]:
+        """
+        Fetches a business of the owner together with its physical and virtual settings in one query.
+
+        :param business_id: ID of the business.
+        :param owner_id: ID of the owner.
+        :return: The business if found, else None.
+        """
+        query = (
+            select(Business)
+            .options(
+                joinedload(Business.physical_settings),
+                joinedload(Business.virtual_settings),
+            )
+            .where(Business.id == business_id, Business.owner_id == owner_id)
+        )
+        return await self.db.scalar(query)
+
+    @staticmethod
+    def get_monthly_net_income_query(business_ids: Optional[list[UUID]] = None):
+        """
+        Builds a query of the monthly net income of businesses.
+
+        The income is derived like the baseline of the projections: from the physical
+        or virtual settings when they exist, after taxes for physical businesses, and
+        from the revenue and costs declared on the business otherwise.
+
+        :param business_ids: IDs of the businesses, all businesses if not specified.
+        :return: A select of the `id` and `net_income` columns.
+        """
+        business = aliased(Business)
+        physical = aliased(PhysicalBusinessSettings)
+        virtual = aliased(VirtualBusinessSettings)
+
+        physical_costs = (
+            physical.rent_cost
+            + physical.average_salary * physical.employee_count
+            + physical.utilities_cost
+            + physical.marketing_budget
+            + physical.equipment_maintenance_cost
+        )
+        mining_revenue = cast(virtual.hashrate, Numeric) / virtual.mining_difficulty * virtual.crypto_price
+        net_income = case(
+            (
+                and_(business.business_type == BusinessType.PHYSICAL, physical.id.is_not(None)),
+                (business.expected_revenue - physical_costs) * (1 - physical.tax_rate),
+            ),
+            (
+                and_(business.business_type == BusinessType.VIRTUAL, virtual.id.is_not(None)),
+                mining_revenue * (1 - virtual.pool_fees) - virtual.electricity_cost - virtual.hardware_cost,
+            ),
+            else_=business.expected_revenue - func.coalesce(business.operational_costs, 0),
+        )
+
+        query = (
+            select(business.id, cast(net_income, Numeric).label("net_income"))
+            .outerjoin(physical, physical.business_id == business.id)
+            .outerjoin(virtual, virtual.business_id == business.id)
+        )
+        if business_ids is not None:
+            query = query.where(business.id.in_(business_ids))
+        return query
+
+    async def recalculate_break_even(self, business_ids: Optional[list[UUID]] = None) -> int:
+        """
+        Recomputes `break_even_months` of businesses with one UPDATE statement.
+
+        The break-even is the initial investment divided by the monthly net income,
+        and NULL for businesses that do not make a profit. Only businesses whose value
+        changes are written. The statement runs in the current transaction and is not
+        committed.
+
+        :param business_ids: IDs of the businesses, all businesses if not specified.
+        :return: Number of updated businesses.
+        """
+        income = self.get_monthly_net_income_query(business_ids).subquery()
+        break_even_months = case(
+            (income.c.net_income > 0, func.round(Business.initial_investment / income.c.net_income, 2)),
+            else_=None,
+        )
+        stmt = (
+            update(Business)
+            .where(
+                Business.id == income.c.id,
+                Business.break_even_months.is_distinct_from(break_even_months),
+            )
+            .values(break_even_months=break_even_months)
+            .execution_options(synchronize_session="fetch")
+        )
+        result = typing.cast(CursorResult, await self.db.execute(stmt))
+        return result.rowcount
@@ -1,26 +1,48 @@
-from typing import Any, List, Optional, Type, TypeVar, Union, Generic
+import json
+import operator
+from datetime import datetime
+from functools import lru_cache, partial
+from typing import Any, AsyncIterator, Callable, List, Optional, Sequence, Type, TypeVar, Union, Generic
 from uuid import UUID
 
-from sqlalchemy import Select, case, cast, delete, func, select, update
+from pydantic import BaseModel
+from sqlalchemy import Row, Select, and_, case, cast, delete, false, func, inspect, or_, select, update
 from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.sqltypes import DECIMAL
 from sqlalchemy.sql.sqltypes import String as StringType
 
-from src.api.schemes import PaginationParams
+from src.api.schemes import PaginationParams, SearchResult
 from src.models.dbo.database_models import Base
-from src.services.logger import LoggerProvider
-from src.utils.helpers import get_paginated_query
+from src.services.logger import SAMPLED, LoggerProvider
+from src.utils.constants import EXPORT_BATCH_SIZE, MAX_QUERY_PARAMS, STATEMENT_CACHE_SIZE
+from src.utils.helpers import decode_cursor, encode_cursor, get_paginated_query, split_into_batches
 
 T = TypeVar("T", bound=Base)
+ID = TypeVar("ID", int, UUID)
+
+TOTAL_COUNT_LABEL = "total_count"
 
 log = LoggerProvider().get_logger(__name__)
 
 
-class DictToObject:
-    def __init__(self, dictionary):
-        for key, value in dictionary.items():
-            setattr(self, key, value)
+FILTER_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "lt": operator.lt,
+    "le": operator.le,
+    "gt": operator.gt,
+    "ge": operator.ge,
+    "ne": operator.ne,
+    "gte": operator.ge,
+    "lte": operator.le,
+    "in": lambda column, value: column.in_(value),
+    "notin": lambda column, value: ~column.in_(value),
+    "is": lambda column, value: column.is_(value),
+    "isnot": lambda column, value: column.is_not(value),
+    "like": lambda column, value: column.like(value),
+    "ilike": lambda column, value: column.ilike(f"%{value}%"),
+    "isnotnull": lambda column, value: column.is_not(None),
+    "isnull": lambda column, value: column.is_(None),
+}
 
 
 class BaseManager(Generic[T]):
@@ -48,6 +70,19 @@ class BaseManager(Generic[T]):
         query = select(self.entity)
         return query
 
+    def get_schema_query(self, schema_cls: Type[BaseModel]) -> Select:
+        """
+        Returns a query selecting only the columns of the entity that are fields of the schema.
+
+        The rows can be validated into the schema directly (``from_attributes``); fields that are
+        not columns, like relationships, take their defaults. No ORM instances are built.
+
+        :param schema_cls: The schema the rows are validated into.
+        :return: A select query of the matching columns.
+        """
+        column_attributes = inspect(self.entity).column_attrs
+        return select(*(getattr(self.entity, field) for field in schema_cls.model_fields if field in column_attributes))
+
     async def create(self, payload: dict) -> T:
         """
         Creates a new entity and commits it to the database.
@@ -101,7 +136,55 @@ class BaseManager(Generic[T]):
             await self.db.delete(entity)
             await self.db.commit()
 
-    def _get_filter_bool_expression(self, filter_name: str, filter_value: Any, query: Select):
+    @classmethod
+    def _get_column(cls, name: str) -> Optional[Any]:
+        """
+        Resolves a column of the entity or, if listed in `join_columns`, of a joined entity.
+
+        Only mapped columns are resolved; relationships, hybrid properties and methods of the
+        entity return None like unknown names, so filtering by them fails with ValueError and
+        ordering by them is ignored.
+        """
+        if cls.join_columns and name in cls.join_columns:
+            return cls.join_columns[name]
+        if name not in inspect(cls.entity).column_attrs:
+            return None
+        return getattr(cls.entity, name)
+
+    @classmethod
+    @lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+    def _get_filter_factory(cls, filter_name: str) -> Callable[[Any], Any]:
+        """
+        Resolves a filter name to a function building its boolean expression from a value.
+
+        The resolution (splitting the condition suffix, looking up the column and the operator)
+        only depends on the manager and the filter name, so it is cached per manager class and
+        repeated requests only bind new values. Since the values are bound parameters,
+        statements built from the same filter signature also share SQLAlchemy's compiled cache.
+
+        Args:
+            filter_name (str): The name of the field to filter by, optionally including a condition
+                               suffix (e.g., "work_date__gt" for greater than) separated by "__".
+
+        Returns:
+            Callable: A function taking the filter value and returning the SQLAlchemy expression.
+
+        Raises:
+            ValueError: If the field or the filter suffix is unknown or unsupported.
+        """
+
+        column = cls._get_column(filter_name)
+        if column is not None:
+            return partial(operator.eq, column)
+
+        col_name, _, sign = filter_name.rpartition("__")
+        column = cls._get_column(col_name.split("__")[0]) if col_name else None
+        if column is None or sign not in FILTER_OPERATORS:
+            raise ValueError(f"Unknown filter name ({filter_name})")
+
+        return partial(FILTER_OPERATORS[sign], column)
+
+    def _get_filter_bool_expression(self, filter_name: str, filter_value: Any):
         """
         Constructs a boolean SQL expression for filtering based on the provided filter name and value.
 
@@ -109,7 +192,6 @@ class BaseManager(Generic[T]):
             filter_name (str): The name of the field to filter by, optionally including a condition
                                suffix (e.g., "work_date__gt" for greater than) separated by "__".
             filter_value (Any): The value to compare against the field in the filter.
-            query (Query): The SQLAlchemy query object that contains the columns available for filtering.
 
         Returns:
             BinaryExpression: A SQLAlchemy expression representing the boolean condition for filtering.
@@ -118,48 +200,7 @@ class BaseManager(Generic[T]):
             ValueError: If the filter suffix is unknown or unsupported.
         """
 
-        if filter_name in query.columns or (self.join_columns and filter_name in self.join_columns.keys()):
-            obj = self.join_columns if self.join_columns and filter_name in self.join_columns else self.entity
-            if isinstance(obj, dict):
-                obj = DictToObject(obj)  # type: ignore[assignment]
-
-            if not hasattr(obj, filter_name):
-                return None
-
-            return getattr(obj, filter_name).__eq__(filter_value)
-
-        split_by_double_underscore = filter_name.split("__")
-        sign = split_by_double_underscore.pop()
-        col_name = split_by_double_underscore[0]
-
-        obj = self.join_columns if self.join_columns and col_name in self.join_columns else self.entity
-        if isinstance(obj, dict):
-            obj = DictToObject(obj)  # type: ignore[assignment]
-
-        if sign in {"lt", "le", "gt", "ge", "ne"}:
-            return getattr(getattr(obj, col_name), f"__{sign}__")(filter_value)
-        elif sign == "gte":
-            return getattr(obj, col_name) >= filter_value
-        elif sign == "lte":
-            return getattr(obj, col_name) <= filter_value
-        elif sign == "in":
-            return getattr(obj, col_name).in_(filter_value)
-        elif sign == "notin":
-            return ~getattr(obj, col_name).in_(filter_value)
-        elif sign == "is":
-            return getattr(obj, col_name).is_(filter_value)
-        elif sign == "isnot":
-            return getattr(obj, col_name).is_not(filter_value)
-        elif sign == "like":
-            return getattr(obj, col_name).like(filter_value)
-        elif sign == "ilike":
-            return getattr(obj, col_name).ilike(f"%{filter_value}%")
-        elif sign == "isnotnull":
-            return getattr(obj, col_name).is_not(None)
-        elif sign == "isnull":
-            return getattr(obj, col_name).is_(None)
-
-        raise ValueError(f"Unknown filter name ({filter_name})")
+        return self._get_filter_factory(filter_name)(filter_value)
 
     def apply_filters(self, query: Select, **filters) -> Select:
         """
@@ -176,16 +217,59 @@ class BaseManager(Generic[T]):
         """
 
         filters = {key: value for key, value in filters.items() if value is not None}
-        for filter_name, filter_value in filters.items():
-            query = query.where(
+        if not filters:
+            return query
+
+        return query.where(
+            *(
                 self._get_filter_bool_expression(
                     filter_name=filter_name,
                     filter_value=filter_value,
-                    query=query,
                 )
+                for filter_name, filter_value in filters.items()
             )
+        )
 
-        return query
+    @classmethod
+    @lru_cache(maxsize=STATEMENT_CACHE_SIZE)
+    def _get_order_clauses(cls, order_by: str) -> tuple:
+        """
+        Resolves an ordering parameter to its ORDER BY clauses, cached per manager class.
+
+        Args:
+            order_by (str): The column name to order by, prefixed with '-' for descending order.
+
+        Returns:
+            tuple: The ORDER BY clauses, empty if the column is unknown.
+        """
+        if order_by.startswith("-"):
+            descending = True
+            order_by = order_by[1:]
+        else:
+            descending = False
+
+        order_by_column = cls._get_column(order_by)
+        if order_by_column is None:
+            return ()
+
+        apply_numeric_sorting_for_tables = ("floor", "section")
+        column_type = getattr(order_by_column, "type", None)
+        if cls.entity.__tablename__ in apply_numeric_sorting_for_tables and isinstance(column_type, StringType):
+            numeric_part = cast(func.substring(order_by_column, r"([0-9]+)"), DECIMAL)
+            sort_column = case(
+                (
+                    func.regexp_match(order_by_column, r"[0-9]+") is not None,
+                    numeric_part,
+                ),
+                else_=None,
+            )
+            if descending:
+                return sort_column.desc(), order_by_column.desc()
+            return sort_column.asc(), order_by_column.asc()
+
+        if descending:
+            return (order_by_column.desc(),)
+        return (order_by_column.asc(),)
 
     def add_order_to_query(self, query: Select, order_by: str) -> Select:
         """
@@ -205,40 +289,12 @@ class BaseManager(Generic[T]):
               the corresponding attribute from `join_columns`.
             - If `join_columns` is not specified or does not contain the `order_by` column,
               ordering will default to the `entity` attribute.
+            - Columns not selected by the query are ignored.
         """
-        if order_by.startswith("-"):
-            descending = True
-            order_by = order_by[1:]
-        else:
-            descending = False
+        if order_by.removeprefix("-") not in query.selected_columns:
+            return query
 
-        obj = self.join_columns if self.join_columns and order_by in self.join_columns else self.entity
-        if isinstance(obj, dict):
-            obj = DictToObject(obj)  # type: ignore[assignment]
-
-        apply_numeric_sorting_for_tables = ("floor", "section")
-        if order_by in query.columns:
-            order_by_column = getattr(obj, order_by)
-            column_type = getattr(order_by_column, "type", None)
-            if self.entity.__tablename__ in apply_numeric_sorting_for_tables and isinstance(column_type, StringType):
-                numeric_part = cast(func.substring(order_by_column, r"([0-9]+)"), DECIMAL)
-                sort_column = case(
-                    (
-                        func.regexp_match(order_by_column, r"[0-9]+") is not None,
-                        numeric_part,
-                    ),
-                    else_=None,
-                )
-                if descending:
-                    query = query.order_by(sort_column.desc(), order_by_column.desc())
-                else:
-                    query = query.order_by(sort_column.asc(), order_by_column.asc())
-            else:
-                if descending:
-                    query = query.order_by(order_by_column.desc())
-                else:
-                    query = query.order_by(order_by_column.asc())
-        return query
+        return query.order_by(*self._get_order_clauses(order_by))
 
     def apply_ordering(self, query: Select, order_by) -> Select:
         """
@@ -307,6 +363,27 @@ class BaseManager(Generic[T]):
                  according to the provided parameters.
         """
 
+        query = self.get_search_query(query, order_by, **filters)
+        if pagination:
+            query = get_paginated_query(query, pagination)
+        result = await self.fetch(query, with_scalars)
+        return result
+
+    def get_search_query(
+        self,
+        query: Optional[Select] = None,
+        order_by: Optional[list[str]] = None,
+        **filters,
+    ) -> Select:
+        """
+        Builds the filtered and ordered, but not paginated, query of `search`.
+
+        :param query: An optional SQLAlchemy query object to start from.
+                      If None, a base query is generated.
+        :param order_by: Ordering parameters, if specified, applied to the query.
+        :param filters: Additional keyword arguments used as filters in the query.
+        :return: The query.
+        """
         if query is None:
             query = self.get_base_query()
 
@@ -314,10 +391,244 @@ class BaseManager(Generic[T]):
 
         if order_by:
             query = self.apply_ordering(query, order_by)
+        return query
+
+    async def stream(self, query: Select, batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[Sequence[Row]]:
+        """
+        Execute a query on a server-side cursor and yield its rows in batches.
+
+        Only one batch is held in memory at a time, so the size of the result is not limited.
+        The cursor lives in the transaction of the session, which should not be used for
+        anything else until the iteration is over.
+
+        :param query: The SQLAlchemy query to execute.
+        :param batch_size: Number of rows fetched from the cursor at once.
+        :return: An async iterator over sequences of at most `batch_size` rows.
+        """
+        result = await self.db.stream(query.execution_options(yield_per=batch_size))
+        async for partition in result.partitions():
+            yield partition
+
+    async def search_with_total(
+        self,
+        query: Optional[Select] = None,
+        order_by: Optional[list[str]] = None,
+        pagination: Optional[PaginationParams] = None,
+        with_scalars: bool = True,
+        estimated_total: bool = False,
+        **filters,
+    ) -> SearchResult:
+        """
+        Perform a search like `search` and return the page together with the total number of
+        matching entities.
+
+        The exact total is computed in the same statement with a ``count(*) OVER ()`` window,
+        so a page request costs a single scan instead of a separate ``COUNT(*)`` query.
+        With `estimated_total` the total is taken from planner statistics instead, which is
+        much cheaper for very large tables but only approximate.
+
+        :param query: An optional SQLAlchemy query object to execute.
+                      If None, a base query is generated.
+        :param order_by: Ordering parameters, if specified, applied to the query results.
+        :param pagination: Pagination parameters, if specified, used to limit the result set.
+        :param with_scalars: If True, returns scalar results; if False, returns raw row data.
+        :param estimated_total: If True, estimates the total from planner statistics.
+        :param filters: Additional keyword arguments used as filters in the query.
+        :return: A SearchResult with the entities of the page, the total count and
+                 the cursor of the next page.
+
+        If `pagination.cursor` is set, keyset pagination is used instead (see `search_by_cursor`).
+        """
+
+        if query is None:
+            query = self.get_base_query()
+
+        query = self.apply_filters(query, **filters)
+
+        if pagination and pagination.cursor:
+            return await self.search_by_cursor(
+                query=query,
+                order_by=order_by,
+                pagination=pagination,
+                with_scalars=with_scalars,
+            )
+
+        keyset_order = self._get_keyset_order(query, order_by)
+
+        if estimated_total:
+            items = await self.search(
+                query=query,
+                order_by=keyset_order,
+                pagination=pagination,
+                with_scalars=with_scalars,
+            )
+            has_next_page = pagination is not None and len(items) == pagination.per_page
+            return SearchResult(
+                items=items,
+                total=await self.estimate_count(query),
+                next_cursor=self._get_next_cursor(items, keyset_order) if has_next_page else None,
+            )
+
+        page_query = query.add_columns(func.count().over().label(TOTAL_COUNT_LABEL))
+        page_query = self.apply_ordering(page_query, keyset_order)
         if pagination:
-            query = get_paginated_query(query, pagination)
-        result = await self.fetch(query, with_scalars)
-        return result
+            page_query = get_paginated_query(page_query, pagination)
+
+        result = await self.db.execute(page_query)
+        rows = list(result.unique().all()) if with_scalars else list(result.all())
+
+        if rows:
+            total = getattr(rows[0], TOTAL_COUNT_LABEL)
+        elif pagination and pagination.page > 1:
+            # the page is past the end, so the window has no row to report the total on
+            total = await self.count(query)
+        else:
+            total = 0
+
+        page_items = [row[0] for row in rows] if with_scalars else rows
+        has_next_page = pagination is not None and pagination.page * pagination.per_page < total
+        return SearchResult(
+            items=page_items,
+            total=total,
+            next_cursor=self._get_next_cursor(page_items, keyset_order) if has_next_page else None,
+        )
+
+    async def search_by_cursor(
+        self,
+        query: Select,
+        order_by: Optional[list[str]],
+        pagination: PaginationParams,
+        with_scalars: bool = True,
+    ) -> SearchResult:
+        """
+        Fetch the page following `pagination.cursor` using keyset pagination.
+
+        Instead of skipping rows with ``OFFSET``, the query continues strictly after the
+        sort-key tuple (ending with ``id``) encoded in the cursor, so the cost of a page does
+        not depend on how deep it is. The total is not computed in this mode.
+
+        :param query: The filtered SQLAlchemy query to paginate.
+        :param order_by: Ordering parameters; ``id`` is appended as a tie-breaker.
+        :param pagination: Pagination parameters with the cursor of the previous page.
+        :param with_scalars: If True, returns scalar results; if False, returns raw row data.
+        :return: A SearchResult with the entities of the page and the cursor of the next page.
+
+        Raises:
+            ValueError: If the cursor is malformed or does not match the ordering.
+        """
+
+        keyset_order = self._get_keyset_order(query, order_by)
+        query = query.where(self._get_keyset_expression(keyset_order, decode_cursor(pagination.cursor or "")))
+
+        items = await self.search(
+            query=query.limit(pagination.per_page + 1),
+            order_by=keyset_order,
+            with_scalars=with_scalars,
+        )
+
+        has_next_page = len(items) > pagination.per_page
+        items = items[: pagination.per_page]
+        return SearchResult(
+            items=items,
+            total=None,
+            next_cursor=self._get_next_cursor(items, keyset_order) if has_next_page else None,
+        )
+
+    def _get_keyset_order(self, query: Select, order_by: Optional[list[str]]) -> list[str]:
+        """
+        Returns the orderable part of `order_by` with ``id`` appended as a unique tie-breaker.
+        """
+        keyset_order = [
+            item
+            for item in order_by or []
+            if item.removeprefix("-") in query.selected_columns and self._get_column(item.removeprefix("-")) is not None
+        ]
+        if not any(item.removeprefix("-") == "id" for item in keyset_order):
+            keyset_order.append("id")
+        return keyset_order
+
+    def _get_keyset_expression(self, keyset_order: list[str], cursor_values: list):
+        """
+        Builds the condition selecting rows strictly after the cursor tuple in `keyset_order`.
+
+        The tuple comparison is expanded to ``(a > x) OR (a = x AND (b > y OR ...))`` so that
+        mixed ascending/descending keys and NULL values (last in ascending, first in descending
+        order, as in PostgreSQL) are handled.
+        """
+        if len(cursor_values) != len(keyset_order):
+            raise ValueError("Cursor does not match the requested ordering")
+
+        expression = None
+        for order_by, value in reversed(list(zip(keyset_order, cursor_values))):
+            descending = order_by.startswith("-")
+            column = self._get_column(order_by.removeprefix("-"))
+            if column is None:
+                raise ValueError("Cursor does not match the requested ordering")
+            value = self._coerce_cursor_value(column, value)
+
+            if value is None:
+                after = column.is_not(None) if descending else false()
+                equal = column.is_(None)
+            elif descending:
+                after = column < value
+                equal = column == value
+            else:
+                after = or_(column > value, column.is_(None))
+                equal = column == value
+
+            expression = after if expression is None else or_(after, and_(equal, expression))
+
+        return expression
+
+    @staticmethod
+    def _coerce_cursor_value(column, value: Any) -> Any:
+        if value is None:
+            return None
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+
+        try:
+            if python_type is datetime:
+                return datetime.fromisoformat(value)
+            return python_type(value)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid cursor")
+
+    @staticmethod
+    def _get_next_cursor(items: list, keyset_order: list[str]) -> Optional[str]:
+        if not items:
+            return None
+        last_item = items[-1]
+        return encode_cursor([getattr(last_item, order_by.removeprefix("-")) for order_by in keyset_order])
+
+    async def estimate_count(
+        self,
+        query: Optional[Select] = None,
+        **filters,
+    ) -> int:
+        """
+        Estimates the number of entities matching the query from planner statistics
+        (``EXPLAIN``) without scanning the table.
+
+        :param query: Optional base query to estimate results from.
+        :param filters: Additional filters to apply.
+        :return: The estimated number of entities matching the query.
+        """
+
+        if query is None:
+            query = self.get_base_query()
+
+        query = self.apply_filters(query, **filters)
+        compiled = query.compile(dialect=self.db.get_bind().dialect, compile_kwargs={"literal_binds": True})
+
+        connection = await self.db.connection()
+        result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")
+        plan = result.scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
 
     async def bulk_update(self, entities_to_update: list[dict[str, Union[int, UUID, str]]]):
         """
@@ -341,18 +652,42 @@ class BaseManager(Generic[T]):
 
         return updated_entities
 
-    async def bulk_delete(self, entity_ids: list[Union[int, UUID]]) -> None:
+    async def bulk_delete(
+        self,
+        entity_ids: Sequence[ID],
+        batch_size: int = MAX_QUERY_PARAMS,
+        commit: bool = True,
+    ) -> list[ID]:
         """
         Perform bulk deletion of entities by their IDs.
 
+        Every batch is a single ``DELETE ... WHERE id IN (...) RETURNING id`` statement and
+        all of them run in one transaction. Related rows are handled by the ``ON DELETE``
+        rules of the foreign keys, children are not loaded into the session.
+
         :param entity_ids: List of entity IDs to delete.
+        :param batch_size: Maximum number of IDs per statement.
+        :param commit: If True, the transaction is committed after the last batch.
+        :return: IDs of the deleted entities; IDs that did not exist are absent.
         """
         if not entity_ids:
-            return
+            return []
+
+        id_column = self.entity.__table__.c.id
+        deleted_ids: list[ID] = []
+        for batch_ids in split_into_batches(list(dict.fromkeys(entity_ids)), batch_size):
+            query = (
+                delete(self.entity)
+                .where(id_column.in_(batch_ids))
+                .returning(id_column)
+                .execution_options(synchronize_session=False)
+            )
+            deleted_ids.extend((await self.db.scalars(query)).all())
 
-        query = delete(self.entity).where(self.entity.id.in_(entity_ids))
+        if commit:
+            await self.db.commit()
 
-        await self.db.execute(query)
+        return deleted_ids
 
     async def bulk_insert(self, entities_data: list[dict]) -> None:
         """
@@ -383,26 +718,137 @@ class BaseManager(Generic[T]):
         updated_entities: list = []
         for entity in entities:
             if entity.id:
-                log.info(f"Updating entity with ID {entity.id}")
+                log.debug("Updating entity with ID %s", entity.id, extra=SAMPLED)
                 data_dict = {key: value for key, value in entity.model_dump().items() if key != "id"}
-                log.info(f"Update payload: {data_dict}")
+                log.debug("Update payload: %s", data_dict, extra=SAMPLED)
                 updated_entity = await self.update_by_id(
                     entity_id=entity.id,
                     payload=data_dict,
                 )  # type: ignore[func-returns-value]
-                log.info(f"Updated entity: {updated_entity}")
+                log.debug("Updated entity: %s", updated_entity, extra=SAMPLED)
                 updated_entities.append(updated_entity)
             else:
-                log.info("Creating new entity")
+                log.debug("Creating new entity", extra=SAMPLED)
                 payload = entity.model_dump()
-                log.info(f"Create payload: {payload}")
+                log.debug("Create payload: %s", payload, extra=SAMPLED)
                 created_entity: T = await self.create(payload=payload)
-                log.info(f"Created entity: {created_entity}")
+                log.debug("Created entity: %s", created_entity, extra=SAMPLED)
                 updated_entities.append(created_entity)
 
-        log.info(f"Total entities processed: {len(updated_entities)}")
+        log.info("Total entities processed: %d", len(updated_entities))
         return updated_entities
 
+    async def bulk_create_or_update(
+        self,
+        entities: list,
+        batch_size: Optional[int] = None,
+        commit: bool = True,
+        **update_filters,
+    ) -> list[T]:
+        """
+        Set-based variant of `create_or_update`. Entities without an ID are inserted, entities with
+        an ID are upserted by primary key. Each group is written with one
+        ``INSERT ... ON CONFLICT ... RETURNING`` statement per batch and the whole
+        operation is committed once.
+
+        Before anything is written, the IDs to update are checked with a single
+        ``id IN (...)`` query restricted by `update_filters` (for example the owner), and the
+        matching rows are locked until the transaction ends. Unknown IDs or IDs of rows outside
+        the filters are reported instead of being inserted with a client-chosen primary key.
+
+        Args:
+            entities (list): A list of entity objects to be created or updated.
+            batch_size (Optional[int]): Maximum number of rows per statement.
+            commit (bool): If False, the changes are left in the current transaction.
+            update_filters: Column filters every updated row has to match, e.g. ``owner_id=user_id``.
+
+        Returns:
+            list: A list of the created and updated entities, each representing the final state in the database.
+
+        Raises:
+            LookupError: If some of the IDs to update do not exist or do not match `update_filters`.
+        """
+
+        to_create: list[dict] = []
+        to_update: list[dict] = []
+        for entity in entities:
+            payload = entity.model_dump()
+            if payload.get("id"):
+                to_update.append(payload)
+            else:
+                payload.pop("id", None)
+                to_create.append(payload)
+
+        if to_update:
+            await self._lock_existing_ids([payload["id"] for payload in to_update], **update_filters)
+
+        processed_entities: list[T] = []
+        for data in (to_create, to_update):
+            if not data:
+                continue
+            processed_entities.extend(
+                await self.bulk_upsert(
+                    data=data,
+                    key_field="id",
+                    update_fields=self._get_upsert_update_fields(data, "id"),
+                    batch_size=batch_size,
+                    returning=True,
+                    commit=False,
+                )
+            )
+        if commit:
+            await self.db.commit()
+
+        log.info(
+            "Bulk processed %s entities of %s: %s created, %s updated",
+            len(processed_entities),
+            self.entity.__name__,
+            len(to_create),
+            len(to_update),
+        )
+        return processed_entities
+
+    async def _lock_existing_ids(self, ids: list, **filters) -> None:
+        """
+        Locks the rows with the given IDs that match `filters` and fails if any ID is missing.
+
+        :param ids: Primary keys that are about to be updated.
+        :param filters: Additional keyword arguments used as filters in the query.
+        :raises LookupError: If some of the IDs do not exist or do not match `filters`.
+        """
+        found: set = set()
+        for batch in split_into_batches(list(dict.fromkeys(ids)), MAX_QUERY_PARAMS):
+            query = self.get_search_query(select(self.entity.__table__.c.id), id__in=batch, **filters).with_for_update()
+            found.update(await self.fetch(query))
+
+        missing = [entity_id for entity_id in dict.fromkeys(ids) if entity_id not in found]
+        if missing:
+            raise LookupError(f"{self.entity.__name__} not found: {', '.join(str(entity_id) for entity_id in missing)}")
+
+    async def bulk_upsert_by_key(self, entities: list, key_field: str | list[str], commit: bool = True) -> list[T]:
+        """
+        Upserts entities by a unique column other than the primary key.
+
+        IDs of the entities are ignored, so existing rows keep theirs and new rows get
+        generated ones.
+
+        Args:
+            entities (list): A list of entity objects to be created or updated.
+            key_field (str | list[str]): Unique column(s) identifying the rows.
+            commit (bool): If False, the changes are left in the current transaction.
+
+        Returns:
+            list: The written entities.
+        """
+        data = [entity.model_dump(exclude={"id"}) for entity in entities]
+        return await self.bulk_upsert(
+            data=data,
+            key_field=key_field,
+            update_fields=self._get_upsert_update_fields(data, key_field),
+            returning=True,
+            commit=commit,
+        )
+
     async def fetch(self, query, with_scalars: bool = True):
         """
         Execute a database query and retrieve all matching results.
@@ -425,29 +871,44 @@ class BaseManager(Generic[T]):
         data: list[dict],
         key_field: str | list[str],
         update_fields: list[str],
-        batch_size: int = 5000,
-    ):
+        batch_size: Optional[int] = None,
+        returning: bool = False,
+        commit: bool = True,
+    ) -> list[T]:
+        """
+        Inserts or updates rows in batches using ``INSERT ... ON CONFLICT DO UPDATE``.
+
+        :param data: List of dictionaries representing the rows to write.
+        :param key_field: Column name(s) of the conflict target.
+        :param update_fields: Column names overwritten when a conflict occurs.
+        :param batch_size: Maximum number of rows per statement. If not specified, the largest
+                           batch fitting into the bind parameter limit is used.
+        :param returning: If True, the written entities are returned.
+        :param commit: If True, the transaction is committed after the last batch.
+        :return: A list of written entities if `returning` is True, else an empty list.
+        """
         if len(data) == 0:
-            return
+            return []
 
-        start, end = 0, batch_size
-        while end < len(data):
-            batch_data = data[start:end]
-            await self._execute_upsert(batch_data, key_field, update_fields)
+        if batch_size is None:
+            batch_size = max(1, MAX_QUERY_PARAMS // len(self.entity.__table__.columns))
 
-            start = end
-            end = end + batch_size
+        written_entities: list[T] = []
+        for batch_data in split_into_batches(data, batch_size):
+            written_entities.extend(await self._execute_upsert(batch_data, key_field, update_fields, returning))
 
-        batch_data = data[start : len(data)]
-        await self._execute_upsert(batch_data, key_field, update_fields)
-        await self.db.commit()
+        if commit:
+            await self.db.commit()
+
+        return written_entities
 
     async def _execute_upsert(
         self,
         batch_data: list[dict],
         key_field: str | list[str],
         update_fields: list[str],
-    ) -> None:
+        returning: bool = False,
+    ) -> list[T]:
         if isinstance(key_field, list):
             index_elements = [getattr(self.entity, item) for item in key_field]
         else:
@@ -458,4 +919,25 @@ class BaseManager(Generic[T]):
             index_elements=index_elements,
             set_={col.name: col for col in insert_stmt.excluded if col.name in update_fields},
         )
-        await self.db.execute(update_stmt)
+
+        if not returning:
+            await self.db.execute(update_stmt)
+            return []
+
+        result = await self.db.scalars(
+            update_stmt.returning(self.entity),
+            execution_options={"populate_existing": True},
+        )
+        return list(result.all())
+
+    def _get_upsert_update_fields(self, data: list[dict], key_field: str | list[str]) -> list[str]:
+        """
+        Collects the columns to overwrite on conflict: every written column except the conflict
+        target, plus ``updated_at`` for entities with timestamps, since ``onupdate`` is not
+        triggered by ``ON CONFLICT DO UPDATE``.
+        """
+        key_fields = set(key_field) if isinstance(key_field, list) else {key_field}
+        update_fields = {key for row in data for key in row if key not in key_fields}
+        if "updated_at" in self.entity.__table__.columns:
+            update_fields.add("updated_at")
+        return list(update_fields)
@@ -1,5 +1,11 @@
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import contains_eager, load_only, selectinload
+
 from src.services.logger import LoggerProvider
-from src.models.dbo.database_models import Course
+from src.models.dbo.database_models import Course, CourseCategory, Lesson, QuizQuestion
 
 from .common import BaseManager
 
@@ -8,3 +14,53 @@ log = LoggerProvider().get_logger(__name__)
 
 class CourseManager(BaseManager):
     entity = Course
+
+    @staticmethod
+    def _apply_tree_filters(query, category_id: Optional[UUID]):
+        query = query.where(Course.is_active.is_(True))
+        if category_id is not None:
+            query = query.where(Course.category_id == category_id)
+        return query
+
+    async def get_tree_courses(self, category_id: Optional[UUID] = None) -> list[Course]:
+        """
+        Load the active courses with their category and lessons (ordered by `Lesson.order`).
+
+        Lesson content is not loaded. The courses are ordered by category name
+        (uncategorized last) and title.
+
+        :param category_id: If given, only the courses of this category are loaded.
+        :return: The courses with `category` and `lessons` populated.
+        """
+        query = self._apply_tree_filters(
+            select(Course)
+            .outerjoin(CourseCategory, Course.category_id == CourseCategory.id)
+            .options(
+                load_only(Course.id, Course.title, Course.description, Course.lesson_url, Course.category_id),
+                contains_eager(Course.category),
+                selectinload(Course.lessons).load_only(Lesson.id, Lesson.title, Lesson.order, Lesson.lesson_url),
+            )
+            .order_by(CourseCategory.name.asc().nulls_last(), Course.title, Course.id),
+            category_id,
+        )
+
+        result = await self.db.execute(query)
+        return list(result.unique().scalars().all())
+
+    async def get_tree_quiz_counts(self, category_id: Optional[UUID] = None) -> dict[UUID, int]:
+        """
+        Count the quiz questions of every lesson of the courses loaded by `get_tree_courses`.
+
+        :param category_id: If given, only the lessons of this category's courses are counted.
+        :return: Mapping of lesson ID to its number of questions; lessons without questions are absent.
+        """
+        query = self._apply_tree_filters(
+            select(QuizQuestion.lesson_id, func.count())
+            .join(Lesson, QuizQuestion.lesson_id == Lesson.id)
+            .join(Course, Lesson.course_id == Course.id)
+            .group_by(QuizQuestion.lesson_id),
+            category_id,
+        )
+
+        result = await self.db.execute(query)
+        return dict(result.tuples().all())
@@ -1,5 +1,9 @@
+from uuid import UUID
+
+from sqlalchemy import select
+
 from src.services.logger import LoggerProvider
-from src.models.dbo.database_models import QuizQuestion
+from src.models.dbo.database_models import Lesson, QuizQuestion
 
 from .common import BaseManager
 
@@ -8,3 +12,24 @@ log = LoggerProvider().get_logger(__name__)
 
 class QuizQuestionManager(BaseManager):
     entity = QuizQuestion
+
+    async def get_answer_keys(self, lesson_ids: list[UUID]) -> dict[UUID, tuple[UUID, dict[UUID, str]]]:
+        """
+        Load the correct answers of the quizzes of the given lessons in one query.
+
+        :param lesson_ids: IDs of the lessons.
+        :return: Mapping of lesson ID to its course ID and the correct answers by question ID.
+                 Lessons without questions map to an empty dict, unknown lessons are absent.
+        """
+        query = (
+            select(Lesson.id, Lesson.course_id, QuizQuestion.id, QuizQuestion.correct_answer)
+            .outerjoin(QuizQuestion, QuizQuestion.lesson_id == Lesson.id)
+            .where(Lesson.id.in_(lesson_ids))
+        )
+
+        answer_keys: dict[UUID, tuple[UUID, dict[UUID, str]]] = {}
+        for lesson_id, course_id, question_id, correct_answer in (await self.db.execute(query)).tuples():
+            _, answers = answer_keys.setdefault(lesson_id, (course_id, {}))
+            if question_id is not None:
+                answers[question_id] = correct_answer
+        return answer_keys
@@ -0,0 +1,156 @@
+from typing import NamedTuple, Optional, Union
+from uuid import UUID
+
+from sqlalchemy import Select, and_, case, cast, func, literal, or_, select, tuple_, union_all
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.schemes import PaginationParams, SearchResult
+from src.models.dbo.database_models import Business, Course, Lesson, QuizQuestion
+from src.services.logger import LoggerProvider
+from src.utils.constants import SEARCH_CONFIG
+from src.utils.helpers import decode_cursor, encode_cursor
+
+log = LoggerProvider().get_logger(__name__)
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+
+# the models with a ``search_vector`` column
+SearchableEntity = Union[type[Business], type[Course], type[Lesson], type[QuizQuestion]]
+
+
+class SearchSource(NamedTuple):
+    """
+    A searchable entity type.
+
+    Attributes:
+        entity: one of the searchable models
+        title: column shown as the title of a hit
+        body: column the highlight is taken from
+    """
+
+    entity: SearchableEntity
+    title: object
+    body: object
+
+
+SEARCH_SOURCES: dict[str, SearchSource] = {
+    "business": SearchSource(Business, Business.name, func.coalesce(Business.description, Business.name)),
+    "course": SearchSource(Course, Course.title, func.coalesce(Course.description, Course.title)),
+    "lesson": SearchSource(Lesson, Lesson.title, Lesson.content),
+    "quiz_question": SearchSource(QuizQuestion, QuizQuestion.question_text, QuizQuestion.question_text),
+}
+
+
+class SearchManager:
+    """
+    Full-text search over the generated ``search_vector`` columns of several entity types.
+
+    Matches are found through the GIN indexes on ``search_vector``, ranked with
+    ``ts_rank_cd`` and paged by the (rank, type, id) keyset. Highlights are built
+    only for the rows of the returned page.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def search(
+        self,
+        text: str,
+        user_id: UUID,
+        pagination: PaginationParams,
+        types: Optional[list[str]] = None,
+    ) -> SearchResult:
+        """
+        Search the entities of `types` (all sources by default) for the web-search style query `text`.
+
+        :param text: The search query, in ``websearch_to_tsquery`` syntax.
+        :param user_id: The current user; only their own businesses are searched.
+        :param pagination: Pagination parameters; `cursor` takes precedence over `page`.
+        :param types: Names of the sources in `SEARCH_SOURCES` to search.
+        :return: A SearchResult with rows of (type, id, title, highlight, rank) and the
+                 cursor of the next page. The total is not computed.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        tsquery = func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), text)
+        hits = union_all(
+            *(self._get_source_query(name, tsquery, user_id) for name in types or SEARCH_SOURCES)
+        ).subquery("hits")
+
+        page_query = select(hits).order_by(hits.c.rank.desc(), hits.c.type, hits.c.id)
+        if pagination.cursor:
+            page_query = page_query.where(self._get_keyset_expression(hits, pagination.cursor))
+        else:
+            page_query = page_query.offset((pagination.page - 1) * pagination.per_page)
+        page = page_query.limit(pagination.per_page + 1).subquery("page")
+
+        rows = list((await self.db.execute(self._get_page_query(page, tsquery))).all())
+
+        has_next_page = len(rows) > pagination.per_page
+        rows = rows[: pagination.per_page]
+        next_cursor = None
+        if has_next_page:
+            last = rows[-1]
+            next_cursor = encode_cursor([last.rank, last.type, last.id])
+
+        return SearchResult(items=rows, total=None, next_cursor=next_cursor)
+
+    @staticmethod
+    def _get_source_query(name: str, tsquery, user_id: UUID) -> Select:
+        entity = SEARCH_SOURCES[name].entity
+        query = select(
+            literal(name).label("type"),
+            entity.id.label("id"),
+            func.ts_rank_cd(entity.search_vector, tsquery).label("rank"),
+        ).where(entity.search_vector.bool_op("@@")(tsquery))
+
+        if entity is Business:
+            query = query.where(Business.owner_id == user_id)
+        elif entity is Course:
+            query = query.where(Course.is_active.is_(True))
+        elif entity is Lesson:
+            query = query.join(Course, Course.id == Lesson.course_id).where(Course.is_active.is_(True))
+        elif entity is QuizQuestion:
+            query = (
+                query.join(Lesson, Lesson.id == QuizQuestion.lesson_id)
+                .join(Course, Course.id == Lesson.course_id)
+                .where(Course.is_active.is_(True))
+            )
+        return query
+
+    @staticmethod
+    def _get_keyset_expression(hits, cursor: str):
+        """
+        Builds the condition selecting hits strictly after the cursor in (rank DESC, type, id) order.
+        """
+        try:
+            rank, type_name, entity_id = decode_cursor(cursor)
+            rank, entity_id = float(rank), UUID(entity_id)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid cursor")
+
+        return or_(
+            hits.c.rank < rank,
+            and_(hits.c.rank == rank, tuple_(hits.c.type, hits.c.id) > tuple_(type_name, entity_id)),
+        )
+
+    @staticmethod
+    def _get_page_query(page, tsquery) -> Select:
+        """
+        Joins the page back to the source tables to fetch titles and build highlights.
+        """
+        config = cast(SEARCH_CONFIG, REGCONFIG)
+        query = select(page.c.type, page.c.id, page.c.rank)
+        titles, highlights = [], []
+        for name, source in SEARCH_SOURCES.items():
+            is_source = page.c.type == name
+            query = query.outerjoin(source.entity, and_(is_source, source.entity.id == page.c.id))
+            titles.append((is_source, source.title))
+            highlights.append((is_source, func.ts_headline(config, source.body, tsquery, HEADLINE_OPTIONS)))
+
+        return query.add_columns(
+            case(*titles).label("title"),
+            case(*highlights).label("highlight"),
+        ).order_by(page.c.rank.desc(), page.c.type, page.c.id)
@@ -0,0 +1,10 @@
+from src.services.logger import LoggerProvider
+from src.models.dbo.database_models import Transaction
+
+from .common import BaseManager
+
+log = LoggerProvider().get_logger(__name__)
+
+
+class TransactionManager(BaseManager):
+    entity = Transaction
@@ -1,6 +1,7 @@
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import JSON, func, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 
 from src.services.logger import LoggerProvider
 from src.models.dbo.database_models import (
@@ -30,16 +31,49 @@ class UserManager(BaseManager):
         "user_stats_total_business": UserStats.total_businesses,
         "user_stats_total_capital": UserStats.total_capital,
         "user_stats_success_rate": UserStats.success_rate,
-        "role_id": Role.id,
-        "role_name": Role.name,
-        "achievement_id": Achievement.id,
-        "achievement_name": Achievement.name,
     }
 
+    @staticmethod
+    def get_named_entities_subquery(entity, association_table, foreign_key):
+        """
+        Correlated sub-select aggregating the entities linked to the user into a JSON
+        array of ``{"id", "name"}`` objects (an empty array if there are none).
+        """
+        return (
+            select(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            func.json_build_object(
+                                literal_column("'id'"),
+                                entity.id,
+                                literal_column("'name'"),
+                                entity.name,
+                            ),
+                            entity.name,
+                        )
+                    ),
+                    literal_column("'[]'::json"),
+                    type_=JSON,
+                )
+            )
+            .select_from(association_table)
+            .join(entity, foreign_key == entity.id)
+            .where(association_table.c.user_id == User.id)
+            .scalar_subquery()
+        )
+
     def get_user_info_query(
         self,
         user_id: UUID,
     ):
+        """
+        Build the query of the user profile: one row per user, with the profile and stats
+        joined (both one-to-one) and the roles and achievements aggregated into JSON arrays.
+
+        :param user_id: The ID of the user.
+        :return: The query selecting the profile row of the user.
+        """
         query = (
             select(
                 User.email,
@@ -55,21 +89,15 @@ class UserManager(BaseManager):
                 UserStats.total_businesses.label("user_stats_total_business"),
                 UserStats.total_capital.label("user_stats_total_capital"),
                 UserStats.success_rate.label("user_stats_success_rate"),
-                Role.id.label("role_id"),
-                Role.name.label("role_name"),
-                Achievement.id.label("achievement_id"),
-                Achievement.name.label("achievement_name"),
+                self.get_named_entities_subquery(Role, user_roles, user_roles.c.role_id).label("roles"),
+                self.get_named_entities_subquery(
+                    Achievement,
+                    user_achievements,
+                    user_achievements.c.achievement_id,
+                ).label("achievements"),
             )
             .join(UserProfile, User.id == UserProfile.user_id, isouter=True)
             .join(UserStats, User.id == UserStats.user_id, isouter=True)
-            .join(user_roles, User.id == user_roles.c.user_id, isouter=True)
-            .join(Role, user_roles.c.role_id == Role.id, isouter=True)
-            .join(user_achievements, User.id == user_achievements.c.user_id, isouter=True)
-            .join(
-                Achievement,
-                user_achievements.c.achievement_id == Achievement.id,
-                isouter=True,
-            )
             .where(User.id == user_id)
         )
 
@@ -1,25 +1,154 @@
 from uuid import UUID
 from typing import (
+    Any,
     Optional,
     TYPE_CHECKING,
 )
 
-from fastapi_users import BaseUserManager, UUIDIDMixin
+import jwt
+from fastapi import HTTPException, status
+from fastapi_users import BaseUserManager, UUIDIDMixin, exceptions, schemas
+from fastapi_users.jwt import decode_jwt, generate_jwt
 
 from src.config.app_config import settings
 from src.models.dbo.database_models import User
+from src.services.cache import auth_cache
 from src.services.logger import LoggerProvider
+from src.services.passwords.hashing import PasswordHashingBusy, password_hashing_executor
 
 if TYPE_CHECKING:
     from fastapi import Request
+    from fastapi.security import OAuth2PasswordRequestForm
 
 log = LoggerProvider().get_logger(__name__)
 
 
 class UserAuthManager(UUIDIDMixin, BaseUserManager[User, UUID]):
+    """
+    User manager running all password hashing on the hashing executor.
+
+    The flows of fastapi-users that hash or verify passwords are overridden only to
+    await the executor instead of calling the synchronous password helper.
+    """
+
     reset_password_token_secret = settings.RESET_PASSWORD_TOKEN_SECRET
     verification_token_secret = settings.RESET_PASSWORD_TOKEN_SECRET
 
+    async def create(
+        self,
+        user_create: schemas.BaseUserCreate,
+        safe: bool = False,
+        request: Optional["Request"] = None,
+    ) -> User:
+        await self.validate_password(user_create.password, user_create)
+
+        existing_user = await self.user_db.get_by_email(user_create.email)
+        if existing_user is not None:
+            raise exceptions.UserAlreadyExists()
+
+        user_dict = user_create.create_update_dict() if safe else user_create.create_update_dict_superuser()
+        password = user_dict.pop("password")
+        user_dict["hashed_password"] = await self._hash_password(password)
+
+        created_user = await self.user_db.create(user_dict)
+        await self.on_after_register(created_user, request)
+        return created_user
+
+    async def authenticate(self, credentials: "OAuth2PasswordRequestForm") -> Optional[User]:
+        try:
+            user = await self.get_by_email(credentials.username)
+        except exceptions.UserNotExists:
+            # Hash anyway so that unknown emails take as long as wrong passwords
+            await self._hash_password(credentials.password)
+            return None
+
+        verified, updated_password_hash = await self._verify_and_update_password(
+            credentials.password,
+            user.hashed_password,
+        )
+        if not verified:
+            return None
+
+        if updated_password_hash is not None:
+            await self.user_db.update(user, {"hashed_password": updated_password_hash})
+            log.info("Password hash of user %r upgraded", user.id)
+
+        return user
+
+    async def forgot_password(self, user: User, request: Optional["Request"] = None) -> None:
+        if not user.is_active:
+            raise exceptions.UserInactive()
+
+        token_data = {
+            "sub": str(user.id),
+            "password_fgpt": await self._hash_password(user.hashed_password),
+            "aud": self.reset_password_token_audience,
+        }
+        token = generate_jwt(
+            token_data,
+            self.reset_password_token_secret,
+            self.reset_password_token_lifetime_seconds,
+        )
+        await self.on_after_forgot_password(user, token, request)
+
+    async def reset_password(self, token: str, password: str, request: Optional["Request"] = None) -> User:
+        try:
+            data = decode_jwt(
+                token,
+                self.reset_password_token_secret,
+                [self.reset_password_token_audience],
+            )
+            parsed_id = self.parse_id(data["sub"])
+            password_fingerprint = data["password_fgpt"]
+        except (jwt.PyJWTError, KeyError, exceptions.InvalidID):
+            raise exceptions.InvalidResetPasswordToken()
+
+        user = await self.get(parsed_id)
+
+        valid_password_fingerprint, _ = await self._verify_and_update_password(
+            user.hashed_password,
+            password_fingerprint,
+        )
+        if not valid_password_fingerprint:
+            raise exceptions.InvalidResetPasswordToken()
+
+        if not user.is_active:
+            raise exceptions.UserInactive()
+
+        updated_user = await self._update(user, {"password": password})
+        await self.on_after_reset_password(user, request)
+        return updated_user
+
+    async def _update(self, user: User, update_dict: dict[str, Any]) -> User:
+        update_dict = dict(update_dict)
+        password = update_dict.pop("password", None)
+        if password is not None:
+            await self.validate_password(password, user)
+            update_dict["hashed_password"] = await self._hash_password(password)
+        return await super()._update(user, update_dict)
+
+    @staticmethod
+    async def _hash_password(password: str) -> str:
+        try:
+            return await password_hashing_executor.hash(password)
+        except PasswordHashingBusy:
+            raise UserAuthManager._hashing_busy_error()
+
+    @staticmethod
+    async def _verify_and_update_password(password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        try:
+            return await password_hashing_executor.verify_and_update(password, hashed_password)
+        except PasswordHashingBusy:
+            raise UserAuthManager._hashing_busy_error()
+
+    @staticmethod
+    def _hashing_busy_error() -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many password operations in progress, try again later",
+            headers={"Retry-After": "1"},
+        )
+
     async def on_after_register(
         self,
         user: User,
@@ -53,3 +182,25 @@ class UserAuthManager(UUIDIDMixin, BaseUserManager[User, UUID]):
             user.id,
             token,
         )
+
+    async def on_after_update(
+        self,
+        user: User,
+        update_dict: dict[str, Any],
+        request: Optional["Request"] = None,
+    ):
+        await auth_cache.invalidate_user(user.id)
+
+    async def on_after_reset_password(
+        self,
+        user: User,
+        request: Optional["Request"] = None,
+    ):
+        await auth_cache.invalidate_user(user.id)
+
+    async def on_after_delete(
+        self,
+        user: User,
+        request: Optional["Request"] = None,
+    ):
+        await auth_cache.invalidate_user(user.id)
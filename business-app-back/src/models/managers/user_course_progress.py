@@ -1,5 +1,13 @@
+import uuid
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+
 from src.services.logger import LoggerProvider
-from src.models.dbo.database_models import UserCourseProgress
+from src.models.dbo.database_models import Lesson, LessonCompletion, UserCourseProgress
 
 from .common import BaseManager
 
@@ -8,3 +16,86 @@ log = LoggerProvider().get_logger(__name__)
 
 class UserCourseProgressManager(BaseManager):
     entity = UserCourseProgress
+
+    async def complete_lessons(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        lesson_ids: list[UUID],
+        commit: bool = True,
+    ) -> Optional[UserCourseProgress]:
+        """
+        Atomically record the given lessons as completed by the user and advance the progress in the course.
+
+        One statement inserts the completions of the given lessons that belong to the course
+        with ``ON CONFLICT DO NOTHING``, so a lesson is recorded once however often it is
+        completed, and upserts the progress with ``ON CONFLICT (user_id, course_id) DO UPDATE``,
+        incrementing the counter by the number of completions actually inserted. Concurrent
+        completions of the same lesson wait on the completion key and only one of them counts,
+        while completions of different lessons all count. The counter is capped at the number
+        of lessons of the course, counted in the same statement, and `is_completed` is derived
+        from it.
+
+        :param user_id: ID of the user.
+        :param course_id: ID of the course.
+        :param lesson_ids: IDs of the completed lessons.
+        :param commit: Whether to commit the transaction.
+        :return: The updated progress, or None if none of the lessons belongs to the course.
+        """
+        lesson_ids = list(dict.fromkeys(lesson_ids))
+        now = datetime.utcnow()
+
+        new_completions = (
+            insert(LessonCompletion)
+            .from_select(
+                ["user_id", "lesson_id", "completed_at"],
+                select(literal(user_id), Lesson.id, literal(now)).where(
+                    Lesson.course_id == course_id,
+                    Lesson.id.in_(lesson_ids),
+                ),
+            )
+            .on_conflict_do_nothing()
+            .returning(LessonCompletion.lesson_id)
+            .cte("new_completions")
+        )
+        lesson_counts = (
+            select(
+                func.count().label("total"),
+                func.count().filter(Lesson.id.in_(lesson_ids)).label("matched"),
+            )
+            .where(Lesson.course_id == course_id)
+            .cte("lesson_counts")
+        )
+        added = select(func.count()).select_from(new_completions).scalar_subquery()
+
+        insert_stmt = insert(UserCourseProgress).from_select(
+            ["id", "user_id", "course_id", "completed_lessons", "is_completed", "created_at", "updated_at"],
+            select(
+                literal(uuid.uuid4()),
+                literal(user_id),
+                literal(course_id),
+                added,
+                added >= lesson_counts.c.total,
+                literal(now),
+                literal(now),
+            ).where(lesson_counts.c.matched > 0),
+        )
+        total = select(lesson_counts.c.total).scalar_subquery()
+        completed_lessons = UserCourseProgress.completed_lessons + insert_stmt.excluded.completed_lessons
+        upsert_stmt = insert_stmt.on_conflict_do_update(
+            constraint="uq_user_course_progress_user_id_course_id",
+            set_={
+                "completed_lessons": func.least(completed_lessons, total),
+                "is_completed": completed_lessons >= total,
+                "updated_at": now,
+            },
+        )
+
+        progress = await self.db.scalar(
+            upsert_stmt.returning(UserCourseProgress),
+            execution_options={"populate_existing": True},
+        )
+
+        if commit:
+            await self.db.commit()
+        return progress
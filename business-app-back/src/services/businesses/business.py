@@ -1,6 +1,8 @@
+from datetime import datetime
 from uuid import UUID
-from typing import Optional, List
+from typing import AsyncIterator, Optional, List
 
+import numpy as np
 import sqlalchemy
 from fastapi import (
     Depends,
@@ -9,37 +11,62 @@ from fastapi import (
 )
 from pydantic import BaseModel
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 import src.models.managers as managers
-from src.api.schemes import PaginationParams
+from src.api.schemes import BatchItemErrorSchema, ExportFormat, PaginationParams
 from src.api.routes.businesses.business_schemes import (
     BusinessBaseSchema,
     BusinessListResponseSchema,
+    BusinessResponseSchema,
     BusinessCreateSchema,
     BusinessCreateWithUserSchema,
+    BusinessProjectionSchema,
     BusinessType,
 )
 from src.api.routes.businesses.physical_business_settings_schemes import (
     PhysicalBusinessSettingsCreateSchema,
     PhysicalBusinessSettingsBaseSchema,
+    PhysicalBusinessSettingsBatchResultSchema,
 )
 from src.api.routes.businesses.virtual_business_settings_schemes import (
     VirtualBusinessSettingsCreateSchema,
     VirtualBusinessSettingsBaseSchema,
+    VirtualBusinessSettingsBatchResultSchema,
+    VirtualBusinessSimulationSchema,
 )
-from src.config.database_config import get_session
+from src.config.database_config import get_session, release_connection
+from src.models.dbo.database_models import Business
+from src.models.managers.common import BaseManager
+from src.services.businesses.projection import (
+    get_break_even_month,
+    get_monthly_figures,
+    project,
+)
+from src.services.businesses.simulation import (
+    MiningParameters,
+    monte_carlo_simulator,
+)
+from src.api.routes.businesses.transaction_schemes import TransactionSchema, TransactionType
 from src.services.common import BaseService
+from src.services.common.export import stream_export
 from src.services.logger import LoggerProvider
 
 log = LoggerProvider().get_logger(__name__)
 
+BUSINESS_TYPE_NAMES = {
+    BusinessType.PHYSICAL: "физическим",
+    BusinessType.VIRTUAL: "виртуальным",
+}
+
 
 class BusinessService(BaseService):
     def __init__(self, db: AsyncSession):
         self.business_manager = managers.BusinessManager(db)
         self.physical_business_manager = managers.PhysicalBusinessManager(db)
         self.virtual_business_manager = managers.VirtualBusinessManager(db)
+        self.transaction_manager = managers.TransactionManager(db)
 
     async def get_businesses(
         self,
@@ -49,6 +76,7 @@ class BusinessService(BaseService):
         order_by: list[str],
         pagination: PaginationParams,
         user_id: Optional[UUID] = None,
+        estimated_total: bool = False,
         **filters,
     ):
         """
@@ -62,32 +90,99 @@ class BusinessService(BaseService):
             sort (SortParams): Defines the sorting field and order (e.g., ascending or descending) for the result set.
             pagination (PaginationParams): Contains pagination settings such as the page number and page size to limit
                                             the number of results returned.
+            estimated_total (bool): If True, the total count is estimated from planner statistics.
             **filters: Additional keyword arguments used to apply custom filters on construction records (e.g.,
                         filtering by specific attributes).
 
         Returns:
-            ConstructionListResponseSchema: A response schema object containing the list of constructions that match
-            the provided criteria, as well as pagination details and the total count of records.
+            Response: The JSON of a BusinessListResponseSchema with the businesses that match the provided
+            criteria, as well as pagination details and the total count of records.
         """
-        filters["name_ilike"] = search
-        businesses: list = await self.business_manager.search(
+        filters["name__ilike"] = search
+        result = await self.business_manager.search_with_total(
+            query=self.business_manager.get_schema_query(BusinessResponseSchema),
             order_by=order_by,
             pagination=pagination,
+            with_scalars=False,
+            estimated_total=estimated_total,
             business_type=business_type,
             owner_id=user_id,
             id=business_id,
             **filters,
         )
-        total = await self.business_manager.count(**filters)
-        businesses_mapped = [
-            self.map_obj_to_schema(business, BusinessBaseSchema).model_dump() for business in businesses
-        ]
 
-        return BusinessListResponseSchema.create(
-            list_data=businesses_mapped,
-            pagination=pagination,
-            total=total,
+        return BusinessListResponseSchema.create_response(list_data=result, pagination=pagination)
+
+    def export_businesses(
+        self,
+        user_id: UUID,
+        business_type: Optional[str],
+        search: Optional[str],
+        order_by: list[str],
+        export_format: ExportFormat,
+    ) -> AsyncIterator[bytes]:
+        """
+        Exports the businesses of the user matching the same filters as `get_businesses`, without pagination.
+
+        Parameters:
+            user_id (UUID): ID of the owner.
+            business_type (Optional[str]): filter by business_type.
+            search (Optional[str]): case-insensitive partial match on business names.
+            order_by (list[str]): Fields to order by.
+            export_format (ExportFormat): NDJSON or CSV.
+
+        Returns:
+            AsyncIterator[bytes]: The chunks of the export, streamed from a server-side cursor.
+        """
+        query = self.business_manager.get_search_query(
+            query=self.business_manager.get_schema_query(BusinessBaseSchema),
+            order_by=order_by,
+            business_type=business_type,
+            owner_id=user_id,
+            name__ilike=search,
         )
+        return stream_export(managers.BusinessManager, query, BusinessBaseSchema, export_format)
+
+    async def export_transactions(
+        self,
+        business_id: UUID,
+        user_id: UUID,
+        transaction_type: Optional[TransactionType],
+        created_from: Optional[datetime],
+        created_to: Optional[datetime],
+        order_by: list[str],
+        export_format: ExportFormat,
+    ) -> AsyncIterator[bytes]:
+        """
+        Exports the transactions of a business of the user.
+
+        Parameters:
+            business_id (UUID): ID of the business.
+            user_id (UUID): ID of the owner.
+            transaction_type (Optional[TransactionType]): filter by transaction_type.
+            created_from (Optional[datetime]): only transactions created at or after this time.
+            created_to (Optional[datetime]): only transactions created before this time.
+            order_by (list[str]): Fields to order by, creation time by default.
+            export_format (ExportFormat): NDJSON or CSV.
+
+        Returns:
+            AsyncIterator[bytes]: The chunks of the export, streamed from a server-side cursor.
+
+        Raises:
+            LookupError: If the user has no business with this ID.
+        """
+        if not await self.business_manager.count(id=business_id, owner_id=user_id):
+            raise LookupError("Business not found")
+
+        query = self.transaction_manager.get_search_query(
+            query=self.transaction_manager.get_schema_query(TransactionSchema),
+            order_by=order_by or ["created_at"],
+            business_id=business_id,
+            transaction_type=transaction_type,
+            created_at__gte=created_from,
+            created_at__lt=created_to,
+        )
+        return stream_export(managers.TransactionManager, query, TransactionSchema, export_format)
 
     async def get_business_details(
         self,
@@ -126,6 +221,103 @@ class BusinessService(BaseService):
 
         return self.map_obj_to_schema(businesses[0], BusinessBaseSchema)
 
+    async def get_projection(
+        self,
+        business_id: UUID,
+        user_id: UUID,
+        horizon: int,
+        seed: Optional[int] = None,
+        growth_rate: float = 0.03,
+        seasonality: float = 0.15,
+        volatility: float = 0.1,
+    ) -> BusinessProjectionSchema:
+        """
+        Projects the monthly results of a business of the user from its settings.
+
+        Parameters:
+            business_id (UUID): ID of the business.
+            user_id (UUID): ID of the owner.
+            horizon (int): Number of months to project.
+            seed (Optional[int]): Seed of the random deviations. A random one is drawn and returned if not provided,
+                                  so that any projection can be reproduced.
+            growth_rate (float): Monthly revenue growth (0.03 for 3%).
+            seasonality (float): Amplitude of the yearly revenue wave (0.15 for 15%).
+            volatility (float): Maximum random deviation of revenue and costs (0.1 for 10%).
+
+        Returns:
+            BusinessProjectionSchema: Monthly metrics over the whole horizon.
+        """
+        business = await self.business_manager.get_with_settings(business_id, owner_id=user_id)
+        if business is None:
+            raise LookupError("Business not found")
+
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
+
+        figures = get_monthly_figures(business)
+        projection = project(
+            figures,
+            horizon=horizon,
+            seed=seed,
+            growth_rate=growth_rate,
+            seasonality=seasonality,
+            volatility=volatility,
+        )
+
+        return BusinessProjectionSchema(
+            business_id=business_id,
+            horizon=horizon,
+            seed=seed,
+            break_even_month=get_break_even_month(projection["cumulative_profit"], figures.investment),
+            **{name: np.round(values, 2).tolist() for name, values in projection.items()},
+        )
+
+    async def simulate_virtual_business(
+        self,
+        business_id: UUID,
+        user_id: UUID,
+        paths: int,
+        horizon: int,
+        seed: Optional[int] = None,
+    ) -> VirtualBusinessSimulationSchema:
+        """
+        Runs a Monte Carlo simulation of crypto price and mining difficulty for a virtual business of the user.
+
+        Parameters:
+            business_id (UUID): ID of the business.
+            user_id (UUID): ID of the owner.
+            paths (int): Number of simulated paths.
+            horizon (int): Number of simulated months.
+            seed (Optional[int]): Seed of the simulation. A random one is drawn and returned if not provided.
+
+        Returns:
+            VirtualBusinessSimulationSchema: Break-even distribution, profit bands and ruin probability.
+        """
+        business = await self.business_manager.get_with_settings(business_id, owner_id=user_id)
+        if business is None or business.virtual_settings is None:
+            raise LookupError("Virtual business settings not found")
+
+        params = MiningParameters.from_business(business)
+        await release_connection(self.business_manager.db)
+
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
+
+        summary = await monte_carlo_simulator.run(
+            params,
+            paths=paths,
+            horizon=horizon,
+            seed=seed,
+        )
+
+        return VirtualBusinessSimulationSchema(
+            business_id=business_id,
+            horizon=horizon,
+            seed=seed,
+            paths_requested=paths,
+            **summary,
+        )
+
     async def create_or_update_business(
         self,
         businesses: List[BusinessCreateSchema],
@@ -141,7 +333,14 @@ class BusinessService(BaseService):
             )
 
         try:
-            updated_businesses = await self.business_manager.create_or_update(businesses_with_user)
+            updated_businesses = await self.business_manager.bulk_create_or_update(
+                businesses_with_user,
+                commit=False,
+                owner_id=user_id,
+            )
+            await self._commit_with_break_even([business.id for business in updated_businesses])
+        except LookupError:
+            raise
         except sqlalchemy.exc.IntegrityError as e:
             log.error(f"Integrity error while creating businesses: {e}")
             raise HTTPException(
@@ -207,74 +406,103 @@ class BusinessService(BaseService):
     async def create_or_update_physical_business_settings(
         self,
         businesses: List[PhysicalBusinessSettingsCreateSchema],
-    ):
-        physical_businesses_settings = []
-        for business in businesses:
-            db_business = await self.business_manager.get_by_id(business.business_id)
-
-            if not db_business:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Бизнес с id {business.business_id} не найден",
-                )
-
-            if db_business.business_type != BusinessType.PHYSICAL:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Бизнес с id {business.business_id} не является физическим",
-                )
-
-            physical_businesses_settings.append(
-                PhysicalBusinessSettingsCreateSchema(
-                    **business.model_dump(),
-                )
-            )
+        user_id: UUID,
+    ) -> PhysicalBusinessSettingsBatchResultSchema:
+        """
+        Creates or updates physical settings of businesses of the user.
 
-        try:
-            updated_businesses = await self.physical_business_manager.create_or_update(physical_businesses_settings)
-        except sqlalchemy.exc.IntegrityError as e:
-            log.error(f"Integrity error while creating businesses: {e}")
-            raise HTTPException(
-                status_code=400,
-                detail="Business creation failed due to database constraints",
-            )
-        except Exception as e:
-            log.error(f"Unexpected error while creating businesses: {e}")
-            raise HTTPException(
-                status_code=500,
-                detail="Internal server error occurred",
-            )
+        Parameters:
+            businesses (List[PhysicalBusinessSettingsCreateSchema]): Settings, one per business.
+            user_id (UUID): ID of the owner.
 
-        return updated_businesses
+        Returns:
+            PhysicalBusinessSettingsBatchResultSchema: The written settings and the rejected items.
+        """
+        valid_settings, errors = await self._validate_settings_batch(businesses, user_id, BusinessType.PHYSICAL)
+        updated_settings = await self._upsert_settings(self.physical_business_manager, valid_settings)
+
+        return PhysicalBusinessSettingsBatchResultSchema(
+            data=[
+                self.map_obj_to_schema(settings, PhysicalBusinessSettingsBaseSchema) for settings in updated_settings
+            ],
+            errors=errors,
+        )
 
     async def create_or_update_virtual_business_settings(
         self,
         businesses: List[VirtualBusinessSettingsCreateSchema],
-    ):
-        virtual_businesses_settings = []
-        for business in businesses:
-            db_business = await self.business_manager.get_by_id(business.business_id)
+        user_id: UUID,
+    ) -> VirtualBusinessSettingsBatchResultSchema:
+        """
+        Creates or updates virtual settings of businesses of the user.
 
-            if not db_business:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Бизнес с id {business.business_id} не найден",
-                )
+        Parameters:
+            businesses (List[VirtualBusinessSettingsCreateSchema]): Settings, one per business.
+            user_id (UUID): ID of the owner.
 
-            if db_business.business_type != BusinessType.VIRTUAL:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Бизнес с id {business.business_id} не является виртуальным",
-                )
+        Returns:
+            VirtualBusinessSettingsBatchResultSchema: The written settings and the rejected items.
+        """
+        valid_settings, errors = await self._validate_settings_batch(businesses, user_id, BusinessType.VIRTUAL)
+        updated_settings = await self._upsert_settings(self.virtual_business_manager, valid_settings)
 
-            virtual_businesses_settings.append(
-                VirtualBusinessSettingsCreateSchema(
-                    **business.model_dump(),
-                )
-            )
+        return VirtualBusinessSettingsBatchResultSchema(
+            data=[self.map_obj_to_schema(settings, VirtualBusinessSettingsBaseSchema) for settings in updated_settings],
+            errors=errors,
+        )
+
+    async def _validate_settings_batch(
+        self,
+        batch: list,
+        user_id: UUID,
+        business_type: BusinessType,
+    ) -> tuple[list, List[BatchItemErrorSchema]]:
+        """
+        Checks with one query that the businesses of the settings exist, belong to the user and have the type.
+
+        Returns:
+            tuple: The valid settings and the errors of the rejected ones.
+        """
+        if not batch:
+            return [], []
+
+        businesses = await self.business_manager.search(
+            query=select(Business.id, Business.business_type),
+            with_scalars=False,
+            id__in=list({settings.business_id for settings in batch}),
+            owner_id=user_id,
+        )
+        business_types = {business.id: business.business_type for business in businesses}
+
+        valid_settings = []
+        errors = []
+        seen_ids = set()
+        for index, settings in enumerate(batch):
+            business_id = settings.business_id
+            if business_id not in business_types:
+                detail = f"Бизнес с id {business_id} не найден"
+            elif business_types[business_id] != business_type:
+                detail = f"Бизнес с id {business_id} не является {BUSINESS_TYPE_NAMES[business_type]}"
+            elif business_id in seen_ids:
+                detail = f"Настройки бизнеса с id {business_id} переданы несколько раз"
+            else:
+                seen_ids.add(business_id)
+                valid_settings.append(settings)
+                continue
+            errors.append(BatchItemErrorSchema(index=index, id=business_id, detail=detail))
+
+        return valid_settings, errors
+
+    async def _upsert_settings(self, manager: BaseManager, settings: list) -> list:
+        """
+        Writes the settings with one upsert keyed on `business_id` and recomputes the break-even in the same commit.
+        """
+        if not settings:
+            return []
 
         try:
-            updated_businesses = await self.virtual_business_manager.create_or_update(virtual_businesses_settings)
+            updated_settings = await manager.bulk_upsert_by_key(settings, key_field="business_id", commit=False)
+            await self._commit_with_break_even([item.business_id for item in updated_settings])
         except sqlalchemy.exc.IntegrityError as e:
             log.error(f"Integrity error while creating businesses: {e}")
             raise HTTPException(
@@ -288,7 +516,14 @@ class BusinessService(BaseService):
                 detail="Internal server error occurred",
             )
 
-        return updated_businesses
+        return updated_settings
+
+    async def _commit_with_break_even(self, business_ids: List[UUID]) -> None:
+        """
+        Recomputes the break-even of the written businesses and commits it together with the pending changes.
+        """
+        await self.business_manager.recalculate_break_even(business_ids)
+        await self.business_manager.db.commit()
 
 
 async def get_business_service(
@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+from src.api.routes.businesses.business_schemes import BusinessType
+from src.models.dbo.database_models import (
+    Business,
+    PhysicalBusinessSettings,
+    VirtualBusinessSettings,
+)
+
+MONTHS_IN_YEAR = 12
+
+
+@dataclass(frozen=True)
+class MonthlyFigures:
+    """
+    Baseline monthly figures of a business the projections start from.
+    """
+
+    revenue: float
+    costs: float
+    tax_rate: float
+    investment: float
+
+
+def get_physical_costs(settings: PhysicalBusinessSettings) -> float:
+    """
+    Monthly costs of a physical business: rent, salaries, utilities, marketing and maintenance.
+    """
+    return float(
+        settings.rent_cost
+        + settings.average_salary * settings.employee_count
+        + settings.utilities_cost
+        + settings.marketing_budget
+        + settings.equipment_maintenance_cost
+    )
+
+
+def get_mining_revenue(settings: VirtualBusinessSettings) -> float:
+    """
+    Monthly mining revenue of a virtual business.
+
+    The amount of mined coins per month is taken as the hashrate to difficulty
+    ratio, valued at the current price, net of the pool fees.
+    """
+    coins = settings.hashrate / settings.mining_difficulty
+    return coins * float(settings.crypto_price) * (1 - float(settings.pool_fees))
+
+
+def get_virtual_costs(settings: VirtualBusinessSettings) -> float:
+    """
+    Monthly costs of a virtual business: electricity and hardware amortization.
+    """
+    return float(settings.electricity_cost + settings.hardware_cost)
+
+
+def get_monthly_figures(business: Business) -> MonthlyFigures:
+    """
+    Derives the baseline figures from the business and its settings.
+
+    The settings take precedence over the revenue and costs declared on the business,
+    which are used when the settings are not filled in yet.
+    """
+    revenue = float(business.expected_revenue)
+    costs = float(business.operational_costs or 0)
+    tax_rate = 0.0
+
+    if business.business_type == BusinessType.PHYSICAL and business.physical_settings is not None:
+        costs = get_physical_costs(business.physical_settings)
+        tax_rate = float(business.physical_settings.tax_rate)
+    elif business.business_type == BusinessType.VIRTUAL and business.virtual_settings is not None:
+        revenue = get_mining_revenue(business.virtual_settings)
+        costs = get_virtual_costs(business.virtual_settings)
+
+    return MonthlyFigures(
+        revenue=revenue,
+        costs=costs,
+        tax_rate=tax_rate,
+        investment=float(business.initial_investment),
+    )
+
+
+def get_break_even_month(cumulative_profit: np.ndarray, investment: float) -> Optional[int]:
+    """
+    Returns the 1-based month in which the cumulative profit covers the investment, if it does.
+    """
+    reached = np.flatnonzero(cumulative_profit >= investment)
+    return int(reached[0]) + 1 if reached.size else None
+
+
+def project(
+    figures: MonthlyFigures,
+    horizon: int,
+    seed: int,
+    growth_rate: float = 0.03,
+    seasonality: float = 0.15,
+    volatility: float = 0.1,
+) -> dict[str, np.ndarray]:
+    """
+    Projects the monthly results of a business over the horizon.
+
+    Revenue compounds by `growth_rate` a month, follows a yearly sine wave of
+    amplitude `seasonality` and, like the costs, deviates uniformly by up to
+    `volatility`. Taxes apply to positive monthly results only. All months are
+    computed at once, and the same seed always gives the same projection.
+
+    :param figures: Baseline monthly figures.
+    :param horizon: Number of months to project.
+    :param seed: Seed of the random deviations.
+    :return: Arrays of `horizon` values by metric name.
+    """
+    rng = np.random.default_rng(seed)
+    months = np.arange(horizon)
+
+    seasonal_factor = 1 + seasonality * np.sin(2 * np.pi * months / MONTHS_IN_YEAR)
+    growth_factor = (1 + growth_rate) ** months
+    revenue_noise, costs_noise = rng.uniform(1 - volatility, 1 + volatility, size=(2, horizon))
+
+    revenue = figures.revenue * seasonal_factor * growth_factor * revenue_noise
+    costs = figures.costs * costs_noise
+    taxes = np.maximum(revenue - costs, 0) * figures.tax_rate
+    profit = revenue - costs - taxes
+    cumulative_profit = np.cumsum(profit)
+    roi = cumulative_profit / figures.investment * 100 if figures.investment else np.zeros(horizon)
+
+    return {
+        "month": months + 1,
+        "revenue": revenue,
+        "costs": costs,
+        "taxes": taxes,
+        "profit": profit,
+        "cumulative_profit": cumulative_profit,
+        "roi": roi,
+    }
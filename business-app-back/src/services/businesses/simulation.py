@@ -0,0 +1,237 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from src.config.app_config import settings
+from src.services.businesses.projection import get_mining_revenue, get_virtual_costs
+
+if TYPE_CHECKING:
+    from src.models.dbo.database_models import Business
+
+BASE_PRICE_VOLATILITY = 0.15
+DIFFICULTY_GROWTH = 0.02
+DIFFICULTY_VOLATILITY = 0.05
+DEFAULT_RISK_LEVEL = 3
+PERCENTILES = (5, 50, 95)
+THREAD_WORKERS = min(4, os.cpu_count() or 1)
+
+
+@dataclass(frozen=True)
+class MiningParameters:
+    """
+    Inputs of the Monte Carlo simulation of a mining business.
+    """
+
+    revenue: float
+    costs: float
+    investment: float
+    initial_capital: float
+    price_volatility: float
+    difficulty_growth: float = DIFFICULTY_GROWTH
+    difficulty_volatility: float = DIFFICULTY_VOLATILITY
+
+    @classmethod
+    def from_business(cls, business: "Business") -> "MiningParameters":
+        """
+        Builds the parameters from a virtual business with its settings.
+
+        The monthly price volatility scales with the risk multiplier and the risk level.
+        """
+        settings = business.virtual_settings
+        return cls(
+            revenue=get_mining_revenue(settings),
+            costs=get_virtual_costs(settings),
+            investment=float(business.initial_investment),
+            initial_capital=float(settings.initial_capital),
+            price_volatility=(
+                BASE_PRICE_VOLATILITY * float(settings.risk_multiplier) * settings.risk_level / DEFAULT_RISK_LEVEL
+            ),
+        )
+
+
+@dataclass
+class ChunkResult:
+    break_even_months: npt.NDArray[np.int16]
+    ruined: npt.NDArray[np.bool_]
+    cumulative_profit: npt.NDArray[np.float32]
+
+
+def simulate_chunk(params: MiningParameters, horizon: int, paths: int, seed: np.random.SeedSequence) -> ChunkResult:
+    """
+    Simulates a chunk of price and difficulty paths.
+
+    Both follow monthly geometric Brownian motions: the price without drift, the
+    difficulty growing by `difficulty_growth`. Revenue moves with the price to
+    difficulty ratio, the costs are fixed. A path breaks even in the first month its
+    cumulative profit covers the investment (0 if it never does) and is ruined if
+    the initial capital plus the cumulative profit ever drops to zero.
+    """
+    rng = np.random.default_rng(seed)
+    price_shocks, difficulty_shocks = rng.standard_normal((2, paths, horizon))
+
+    log_price = np.cumsum(params.price_volatility * price_shocks - params.price_volatility**2 / 2, axis=1)
+    log_difficulty = np.cumsum(
+        params.difficulty_volatility * difficulty_shocks
+        + params.difficulty_growth
+        - params.difficulty_volatility**2 / 2,
+        axis=1,
+    )
+
+    profit = params.revenue * np.exp(log_price - log_difficulty) - params.costs
+    cumulative_profit = np.cumsum(profit, axis=1)
+
+    reached = cumulative_profit >= params.investment
+    break_even_months = np.where(reached.any(axis=1), reached.argmax(axis=1) + 1, 0)
+    ruined = np.any(params.initial_capital + cumulative_profit <= 0, axis=1)
+
+    return ChunkResult(
+        break_even_months=break_even_months.astype(np.int16),
+        ruined=ruined,
+        cumulative_profit=cumulative_profit.astype(np.float32),
+    )
+
+
+def summarize(chunks: list[ChunkResult], horizon: int) -> dict:
+    """
+    Aggregates the simulated paths into break-even, profit and ruin statistics.
+    """
+    break_even_months = np.concatenate([chunk.break_even_months for chunk in chunks])
+    ruined = np.concatenate([chunk.ruined for chunk in chunks])
+    cumulative_profit = np.concatenate([chunk.cumulative_profit for chunk in chunks])
+
+    reached = break_even_months[break_even_months > 0]
+    break_even_percentiles = np.percentile(reached, PERCENTILES) if reached.size else [None] * len(PERCENTILES)
+    profit_bands = np.percentile(cumulative_profit, PERCENTILES, axis=0)
+
+    return {
+        "paths_simulated": int(break_even_months.size),
+        "break_even": {
+            "probability": float(reached.size / break_even_months.size),
+            **{
+                f"p{percentile}": None if value is None else float(value)
+                for percentile, value in zip(PERCENTILES, break_even_percentiles)
+            },
+            "histogram": np.bincount(reached, minlength=horizon + 1)[1:].tolist(),
+        },
+        "profit_bands": {
+            f"p{percentile}": np.round(band, 2).tolist() for percentile, band in zip(PERCENTILES, profit_bands)
+        },
+        "ruin_probability": float(ruined.mean()),
+    }
+
+
+class MonteCarloSimulator:
+    """
+    Runs simulations chunk by chunk within a time budget.
+
+    Chunks bound the size of the intermediate matrices and are evaluated on a
+    dedicated process pool when `max_workers` is set, or on a dedicated thread pool
+    otherwise, so the event loop and the default executor are never blocked. At most
+    one chunk per worker is in flight across all requests; the others wait for a slot
+    and are dropped without being submitted once the budget runs out. Every chunk has
+    its own seed spawned from the simulation seed, so results do not depend on the
+    number of workers.
+    """
+
+    def __init__(self, max_workers: int, chunk_paths: int, time_budget: float):
+        self.max_workers = max_workers
+        self.chunk_paths = chunk_paths
+        self.time_budget = time_budget
+        self._executor: Optional[Executor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    @property
+    def concurrency(self) -> int:
+        return self.max_workers or THREAD_WORKERS
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.max_workers > 0:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=THREAD_WORKERS,
+                    thread_name_prefix="simulation",
+                )
+        return self._executor
+
+    @property
+    def slots(self) -> asyncio.Semaphore:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.concurrency)
+        return self._slots
+
+    async def _run_chunk(self, params: MiningParameters, horizon: int, size: int, seed) -> ChunkResult:
+        """
+        Waits for a free worker slot and evaluates one chunk.
+
+        The slot is released when the chunk actually finishes, not when the caller stops
+        waiting for it, so dropped chunks still running on a worker keep their slot.
+        """
+        await self.slots.acquire()
+        future = asyncio.get_running_loop().run_in_executor(self.executor, simulate_chunk, params, horizon, size, seed)
+        future.add_done_callback(lambda _: self.slots.release())
+        return await asyncio.shield(future)
+
+    async def run(
+        self,
+        params: MiningParameters,
+        paths: int,
+        horizon: int,
+        seed: int,
+        time_budget: Optional[float] = None,
+    ) -> dict:
+        """
+        Simulates the paths and summarizes them.
+
+        Chunks not finished when the time budget (the simulator's one by default)
+        runs out are dropped and the summary covers the completed ones. The budget is
+        soft for chunks already running on a worker: they cannot be interrupted and
+        finish in the background, which bounds the overrun to one chunk per worker.
+
+        :raises TimeoutError: If no chunk completed within the time budget.
+        """
+        started_at = time.perf_counter()
+
+        chunk_sizes = [min(self.chunk_paths, paths - start) for start in range(0, paths, self.chunk_paths)]
+        seeds = np.random.SeedSequence(seed).spawn(len(chunk_sizes))
+        tasks = [
+            asyncio.ensure_future(self._run_chunk(params, horizon, size, chunk_seed))
+            for size, chunk_seed in zip(chunk_sizes, seeds)
+        ]
+
+        done, pending = await asyncio.wait(tasks, timeout=time_budget or self.time_budget)
+        for task in pending:
+            task.cancel()
+        if not done:
+            raise TimeoutError("Simulation time budget exceeded")
+
+        chunks = [task.result() for task in tasks if task in done]
+        return {
+            **summarize(chunks, horizon),
+            "truncated": bool(pending),
+            "elapsed_seconds": round(time.perf_counter() - started_at, 3),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+
+monte_carlo_simulator = MonteCarloSimulator(
+    max_workers=settings.SIMULATION_WORKERS,
+    chunk_paths=settings.SIMULATION_CHUNK_PATHS,
+    time_budget=settings.SIMULATION_TIME_BUDGET_SECONDS,
+)
@@ -0,0 +1,4 @@
+from .backends import CacheBackend, LocalTTLCache, SerializingTTLCache, get_cache_backend
+from .auth import AuthCache, auth_cache
+from .denylist import SessionDenylist, session_denylist
+from .catalog import CatalogCache, CatalogEntry, catalog_cache
@@ -0,0 +1,83 @@
+import hashlib
+from typing import Any, Optional
+from uuid import UUID
+
+from src.config.app_config import settings
+from src.services.cache.backends import CacheBackend, get_cache_backend
+from src.services.logger import LoggerProvider
+
+log = LoggerProvider().get_logger(__name__)
+
+
+class AuthCache:
+    """
+    Token to user cache of the authentication path.
+
+    Entries are keyed by a hash of the access token, so raw tokens never reach the
+    backend, and every user keeps an index of their cached tokens so that all of
+    them can be dropped at once when the user changes.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _token_key(token: str) -> str:
+        return "auth:token:" + hashlib.sha256(token.encode()).hexdigest()
+
+    @staticmethod
+    def _user_key(user_id: UUID) -> str:
+        return f"auth:user:{user_id}"
+
+    async def get_user(self, token: str) -> Optional[dict[str, Any]]:
+        """
+        Returns the cached user snapshot for the token, if any.
+        """
+        user = await self.backend.get(self._token_key(token))
+        if user is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return user
+
+    async def set_user(self, token: str, user_id: UUID, user: dict[str, Any], ttl: Optional[float] = None) -> None:
+        """
+        Caches the user snapshot for the token.
+        """
+        token_key = self._token_key(token)
+        await self.backend.set(token_key, user, ttl)
+
+        user_key = self._user_key(user_id)
+        token_keys = await self.backend.get(user_key) or set()
+        await self.backend.set(user_key, token_keys | {token_key}, settings.AUTH_CACHE_TTL_SECONDS)
+
+    async def invalidate_token(self, token: str) -> None:
+        await self.backend.delete(self._token_key(token))
+
+    async def invalidate_user(self, user_id: UUID) -> None:
+        """
+        Drops every cached token of the user.
+        """
+        user_key = self._user_key(user_id)
+        token_keys = await self.backend.get(user_key) or set()
+        await self.backend.delete(user_key, *token_keys)
+        log.info("Auth cache invalidated for user %s (%s tokens)", user_id, len(token_keys))
+
+    def stats(self) -> dict[str, int | float]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+auth_cache = AuthCache(
+    backend=get_cache_backend(
+        settings.AUTH_CACHE_BACKEND,
+        max_size=settings.AUTH_CACHE_MAX_SIZE,
+        ttl=settings.AUTH_CACHE_TTL_SECONDS,
+    )
+)
@@ -0,0 +1,124 @@
+import pickle
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+class CacheBackend(ABC):
+    """
+    Interface of a key-value cache with per-entry expiration.
+
+    The methods are asynchronous so that a backend talking to a shared cache
+    over the network can be swapped in without changing the callers.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[Any]:
+        """
+        Returns the cached value, or None if it is missing or expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Stores the value for `ttl` seconds (the backend default if not specified).
+        """
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        """
+        Removes the given keys, ignoring missing ones.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Removes all entries.
+        """
+
+
+class LocalTTLCache(CacheBackend):
+    """
+    In-process LRU cache with a bounded size and per-entry TTL.
+
+    Values are stored by reference, so they must not be mutated by the callers.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 60.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return self._load(value)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        self._entries[key] = (time.monotonic() + ttl, self._dump(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def _dump(self, value: Any) -> Any:
+        return value
+
+    def _load(self, value: Any) -> Any:
+        return value
+
+
+class SerializingTTLCache(LocalTTLCache):
+    """
+    Local stand-in for a shared cache.
+
+    Stores values serialized like a network cache would, so every reader gets its
+    own copy and values that cannot be shared between workers fail early.
+    """
+
+    def _dump(self, value: Any) -> bytes:
+        return pickle.dumps(value)
+
+    def _load(self, value: bytes) -> Any:
+        return pickle.loads(value)
+
+
+CACHE_BACKENDS: dict[str, type[LocalTTLCache]] = {
+    "local": LocalTTLCache,
+    "serializing": SerializingTTLCache,
+}
+
+
+def get_cache_backend(name: str, max_size: int, ttl: float) -> CacheBackend:
+    """
+    Creates a cache backend by its configured name.
+
+    :raises ValueError: If the backend name is unknown.
+    """
+    try:
+        backend_cls = CACHE_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown cache backend ({name})")
+    return backend_cls(max_size=max_size, ttl=ttl)
@@ -0,0 +1,110 @@
+import hashlib
+import json
+import uuid
+from typing import Any, Awaitable, Callable, NamedTuple
+
+from pydantic import BaseModel
+
+from src.config.app_config import settings
+from src.services.cache.backends import CacheBackend, get_cache_backend
+from src.services.logger import LoggerProvider
+from src.utils.helpers import json_serializer
+
+log = LoggerProvider().get_logger(__name__)
+
+
+class CatalogEntry(NamedTuple):
+    """
+    A pre-serialized response of the education catalog.
+
+    Attributes:
+        body (bytes): the JSON body
+        etag (str): strong entity tag derived from the body
+    """
+
+    body: bytes
+    etag: str
+
+
+class CatalogCache:
+    """
+    Cache of the education catalog list responses.
+
+    Responses are stored as JSON bytes keyed by the section and the request parameters.
+    Every key also contains the current catalog generation, a random token replaced on
+    each write, so that a single write invalidates all the sections at once (lessons and
+    quiz questions go away together with their course) without enumerating the keys.
+
+    The ETag is a hash of the body, so it does not depend on the worker that built it.
+    With a per-process backend, writes made in another worker become visible after the TTL.
+    """
+
+    GENERATION_KEY = "catalog:generation"
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    async def _get_generation(self) -> str:
+        generation = await self.backend.get(self.GENERATION_KEY)
+        if generation is None:
+            # evicted or never set: any new token makes the entries of the lost one unreachable
+            generation = uuid.uuid4().hex
+            await self.backend.set(self.GENERATION_KEY, generation)
+        return generation
+
+    @staticmethod
+    def _entry_key(generation: str, section: str, params: dict[str, Any]) -> str:
+        payload = json.dumps(params, default=json_serializer, sort_keys=True, separators=(",", ":"))
+        return f"catalog:{generation}:{section}:" + hashlib.sha256(payload.encode()).hexdigest()
+
+    async def get_or_load(
+        self,
+        section: str,
+        params: dict[str, Any],
+        load: Callable[[], Awaitable[BaseModel]],
+    ) -> CatalogEntry:
+        """
+        Returns the cached response for the request parameters, loading and caching it on a miss.
+
+        The generation is read before loading, so a response loaded concurrently with a write
+        is stored under the superseded generation and never served.
+        """
+        generation = await self._get_generation()
+        key = self._entry_key(generation, section, params)
+
+        entry = await self.backend.get(key)
+        if entry is not None:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        body = (await load()).model_dump_json().encode()
+        entry = CatalogEntry(body=body, etag='"' + hashlib.sha256(body).hexdigest()[:32] + '"')
+        await self.backend.set(key, entry)
+        return entry
+
+    async def invalidate(self) -> None:
+        """
+        Invalidates every cached catalog response.
+        """
+        await self.backend.set(self.GENERATION_KEY, uuid.uuid4().hex)
+        log.info("Catalog cache invalidated")
+
+    def stats(self) -> dict[str, int | float]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / total if total else 0.0,
+        }
+
+
+catalog_cache = CatalogCache(
+    backend=get_cache_backend(
+        settings.CATALOG_CACHE_BACKEND,
+        max_size=settings.CATALOG_CACHE_MAX_SIZE,
+        ttl=settings.CATALOG_CACHE_TTL_SECONDS,
+    )
+)
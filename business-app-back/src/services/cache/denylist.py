@@ -0,0 +1,90 @@
+import asyncio
+import time
+
+from sqlalchemy import select
+
+from src.config.app_config import settings
+from src.config.database_config import get_async_session
+from src.models.dbo.database_models import AccessToken
+from src.services.logger import LoggerProvider
+from src.utils.constants import BATCH_SIZE
+from src.utils.helpers import split_into_batches
+
+log = LoggerProvider().get_logger(__name__)
+
+
+class SessionDenylist:
+    """
+    In-memory denylist of revoked sessions of the stateless JWT backend.
+
+    Every signed access token carries the id of its session, which is stored in the
+    `accesstoken` table until the user logs out. The denylist only remembers the
+    sessions seen by this process while their access tokens may still be valid, and
+    a periodic sync checks which of them were removed from the table, so revocation
+    reaches all workers within one sync interval without a query per request.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._active: dict[str, float] = {}
+        self._denied: dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self._denied)
+
+    def track(self, session_id: str, expires_at: float) -> None:
+        """
+        Remembers a session of a valid token until the token expires.
+        """
+        if expires_at > self._active.get(session_id, 0):
+            self._active[session_id] = expires_at
+
+    def deny(self, session_id: str) -> None:
+        """
+        Rejects the tokens of the session until the last of them expires.
+        """
+        self._active.pop(session_id, None)
+        self._denied[session_id] = time.time() + self.ttl
+
+    def is_denied(self, session_id: str) -> bool:
+        expires_at = self._denied.get(session_id)
+        return expires_at is not None and expires_at > time.time()
+
+    def _purge(self) -> None:
+        now = time.time()
+        for entries in (self._active, self._denied):
+            for session_id in [key for key, expires_at in entries.items() if expires_at <= now]:
+                del entries[session_id]
+
+    async def sync(self, session) -> None:
+        """
+        Denies the tracked sessions that no longer exist in the `accesstoken` table.
+        """
+        self._purge()
+        session_ids = list(self._active)
+
+        existing = set()
+        for batch in split_into_batches(session_ids, BATCH_SIZE):
+            token = AccessToken.__table__.c.token
+            existing.update(await session.scalars(select(token).where(token.in_(batch))))
+
+        revoked = [session_id for session_id in session_ids if session_id not in existing]
+        for session_id in revoked:
+            self.deny(session_id)
+        if revoked:
+            log.info("Denied %s revoked sessions", len(revoked))
+
+    async def run(self, interval: float) -> None:
+        """
+        Syncs the denylist every `interval` seconds until cancelled.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                async with get_async_session() as session:
+                    await self.sync(session)
+            except Exception as e:
+                log.warning("Session denylist sync failed: %s", e)
+
+
+session_denylist = SessionDenylist(ttl=settings.JWT_LIFETIME_SECONDS)
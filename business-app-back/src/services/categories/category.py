@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException
 
 import src.models.managers as managers
-from src.api.schemes import PaginationParams
+from src.api.schemes import BatchDeleteResultSchema, PaginationParams
 from src.api.routes.education.category.schemes import (
     CourseCategoryReadSchema,
     CourseCategoryListResponseSchema,
@@ -15,6 +15,7 @@ from src.api.routes.education.category.schemes import (
     CourseCategoryDeleteSchema,
 )
 from src.config.database_config import get_session
+from src.services.cache import CatalogEntry, catalog_cache
 from src.services.common import BaseService
 from src.services.logger import LoggerProvider
 
@@ -32,24 +33,25 @@ class CourseCategoryService(BaseService):
         order_by: list[str],
         pagination: PaginationParams,
         **filters,
-    ):
+    ) -> CatalogEntry:
         filters["name__ilike"] = search
-        categories: list = await self.category_manager.search(
-            order_by=order_by,
-            pagination=pagination,
-            id=category_id,
-            **filters,
-        )
-        total = await self.category_manager.count(
-            id=category_id,
-            **filters,
-        )
-
-        categories_mapped = [
-            self.map_obj_to_schema(category, CourseCategoryReadSchema).model_dump() for category in categories
-        ]
-
-        return CourseCategoryListResponseSchema.create(list_data=categories_mapped, pagination=pagination, total=total)
+
+        async def load() -> CourseCategoryListResponseSchema:
+            result = await self.category_manager.search_with_total(
+                order_by=order_by,
+                pagination=pagination,
+                id=category_id,
+                **filters,
+            )
+
+            categories_mapped = result.map(
+                lambda category: self.map_obj_to_schema(category, CourseCategoryReadSchema).model_dump()
+            )
+
+            return CourseCategoryListResponseSchema.create(list_data=categories_mapped, pagination=pagination)
+
+        params = dict(filters, id=category_id, order_by=order_by, pagination=pagination.model_dump())
+        return await catalog_cache.get_or_load("categories", params, load)
 
     async def create_or_update_categories(
         self,
@@ -68,32 +70,40 @@ class CourseCategoryService(BaseService):
             )
 
         try:
-            updated_category = await self.category_manager.create_or_update(category_create_update)
+            updated_category = await self.category_manager.bulk_create_or_update(category_create_update)
+        except LookupError as e:
+            raise HTTPException(
+                status_code=404,
+                detail=str(e),
+            )
         except sqlalchemy.exc.IntegrityError as e:
             raise HTTPException(
                 status_code=400,
                 detail=str(e),
             )
 
+        await catalog_cache.invalidate()
         return updated_category
 
     async def delete_categories(
         self,
         categories: list[CourseCategoryDeleteSchema],
-    ) -> None:
+    ) -> BatchDeleteResultSchema:
         """
-        Delete course categories based on the provided list of IDs.
+        Delete course categories based on the provided list of IDs; their courses become uncategorized.
         """
+        category_ids = [category.id for category in categories if category.id is not None]
         try:
-            for category in categories:
-                if category.id is not None:
-                    await self.category_manager.delete_by_id(category.id)
+            deleted_ids = await self.category_manager.bulk_delete(category_ids)
         except sqlalchemy.exc.IntegrityError as e:
             raise HTTPException(
                 status_code=400,
                 detail=str(e),
             )
 
+        await catalog_cache.invalidate()
+        return BatchDeleteResultSchema.create(category_ids, deleted_ids)
+
 
 async def get_course_category_service(
     db: AsyncSession = Depends(get_session),
@@ -1,8 +1,10 @@
 import re
-from typing import Any, Type
+from typing import Any, Type, TypeVar
 
 from pydantic import BaseModel
 
+S = TypeVar("S", bound=BaseModel)
+
 
 class BaseService:
     """
@@ -10,7 +12,7 @@ class BaseService:
     """
 
     @staticmethod
-    def map_obj_to_schema(obj, schema_cls: Type[BaseModel]) -> BaseModel:
+    def map_obj_to_schema(obj, schema_cls: Type[S]) -> S:
         """
         Maps an object to a schema instance based on the schema's fields.
 
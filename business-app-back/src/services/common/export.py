@@ -0,0 +1,85 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Type
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+from sqlalchemy import Select
+
+from src.api.schemes import ExportFormat, get_list_adapter
+from src.config.database_config import get_async_session
+from src.models.managers.common import BaseManager
+from src.services.logger import LoggerProvider
+
+log = LoggerProvider().get_logger(__name__)
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.ndjson: "application/x-ndjson",
+    ExportFormat.csv: "text/csv; charset=utf-8",
+}
+
+
+def encode_csv_rows(rows: list[list]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
+async def stream_export(
+    manager_cls: Type[BaseManager],
+    query: Select,
+    schema_cls: Type[BaseModel],
+    export_format: ExportFormat,
+) -> AsyncIterator[bytes]:
+    """
+    Streams the rows of a query as NDJSON lines or CSV records, one chunk per cursor batch.
+
+    The export runs on its own session: the request session is closed as soon as the
+    handler returns, while the body is still being sent. Rows are read from a server-side
+    cursor and validated into `schema_cls` batch by batch, so at most one batch is in memory.
+
+    Parameters:
+        manager_cls (Type[BaseManager]): Manager of the exported entity.
+        query (Select): The filtered and ordered query, selecting the columns of `schema_cls`.
+        schema_cls (Type[BaseModel]): Schema defining the exported fields and their encoding.
+        export_format (ExportFormat): NDJSON or CSV (with a header record).
+
+    Returns:
+        AsyncIterator[bytes]: The chunks of the export.
+    """
+    adapter = get_list_adapter(schema_cls)
+    fields = list(schema_cls.model_fields)
+    exported = 0
+
+    async with get_async_session() as db:
+        if export_format == ExportFormat.csv:
+            yield encode_csv_rows([fields])
+
+        async for rows in manager_cls(db=db).stream(query):
+            items = adapter.validate_python(rows, from_attributes=True)
+            exported += len(items)
+
+            if export_format == ExportFormat.ndjson:
+                yield b"".join(to_json(item) + b"\n" for item in items)
+            else:
+                yield encode_csv_rows(
+                    [
+                        [
+                            json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value
+                            for value in item.values()
+                        ]
+                        for item in adapter.dump_python(items, mode="json")
+                    ]
+                )
+
+    log.info("Exported %d %s rows as %s", exported, manager_cls.entity.__tablename__, export_format.value)
+
+
+def get_export_response(chunks: AsyncIterator[bytes], export_format: ExportFormat, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'},
+    )
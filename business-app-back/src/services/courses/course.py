@@ -7,7 +7,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException
 
 import src.models.managers as managers
-from src.api.schemes import PaginationParams
+from src.api.schemes import BatchDeleteResultSchema, PaginationParams
+from src.api.routes.education.tree.schemes import (
+    CourseCategoryTreeSchema,
+    CourseTreeSchema,
+    EducationTreeResponseSchema,
+    LessonTreeSchema,
+)
 from src.api.routes.education.course.schemes import (
     CourseReadSchema,
     CourseListResponseSchema,
@@ -15,7 +21,9 @@ from src.api.routes.education.course.schemes import (
     CourseDeleteSchema,
 )
 from src.config.database_config import get_session
+from src.services.cache import CatalogEntry, catalog_cache
 from src.services.common import BaseService
+from src.services.quiz_questions.answer_index import quiz_answer_index
 from src.services.logger import LoggerProvider
 
 log = LoggerProvider().get_logger(__name__)
@@ -32,22 +40,67 @@ class CourseService(BaseService):
         order_by: list[str],
         pagination: PaginationParams,
         **filters,
-    ):
+    ) -> CatalogEntry:
         filters["title__ilike"] = search
-        courses = await self.course_manager.search(
-            order_by=order_by,
-            pagination=pagination,
-            id=course_id,
-            **filters,
-        )
-        total = await self.course_manager.count(
-            id=course_id,
-            **filters,
-        )
 
-        course_mapped = [self.map_obj_to_schema(course, CourseReadSchema).model_dump() for course in courses]
+        async def load() -> CourseListResponseSchema:
+            result = await self.course_manager.search_with_total(
+                order_by=order_by,
+                pagination=pagination,
+                id=course_id,
+                **filters,
+            )
+
+            course_mapped = result.map(lambda course: self.map_obj_to_schema(course, CourseReadSchema).model_dump())
+
+            return CourseListResponseSchema.create(list_data=course_mapped, pagination=pagination)
+
+        params = dict(filters, id=course_id, order_by=order_by, pagination=pagination.model_dump())
+        return await catalog_cache.get_or_load("courses", params, load)
+
+    async def get_tree(self, category_id: Optional[UUID] = None) -> CatalogEntry:
+        """
+        Build the category -> course -> lesson tree of the active courses, with the number
+        of quiz questions of every lesson.
+
+        The tree is loaded with three queries (courses with categories, their lessons and the
+        grouped question counts) and cached with the rest of the catalog.
+        """
+
+        async def load() -> EducationTreeResponseSchema:
+            courses = await self.course_manager.get_tree_courses(category_id)
+            quiz_counts = await self.course_manager.get_tree_quiz_counts(category_id)
+
+            categories: dict[Optional[UUID], CourseCategoryTreeSchema] = {}
+            for course in courses:
+                if course.category_id not in categories:
+                    categories[course.category_id] = CourseCategoryTreeSchema(
+                        id=course.category_id,
+                        name=course.category.name if course.category else None,
+                        courses=[],
+                    )
+                categories[course.category_id].courses.append(
+                    CourseTreeSchema(
+                        id=course.id,
+                        title=course.title,
+                        description=course.description,
+                        lesson_url=course.lesson_url,
+                        lessons=[
+                            LessonTreeSchema(
+                                id=lesson.id,
+                                title=lesson.title,
+                                order=lesson.order,
+                                lesson_url=lesson.lesson_url,
+                                quiz_count=quiz_counts.get(lesson.id, 0),
+                            )
+                            for lesson in course.lessons
+                        ],
+                    )
+                )
 
-        return CourseListResponseSchema.create(list_data=course_mapped, pagination=pagination, total=total)
+            return EducationTreeResponseSchema.create(list_data=list(categories.values()))
+
+        return await catalog_cache.get_or_load("tree", {"category_id": category_id}, load)
 
     async def create_or_update_courses(
         self,
@@ -59,32 +112,41 @@ class CourseService(BaseService):
         course_create_update = [CourseCreateSchema(**course.model_dump()) for course in courses]
 
         try:
-            updated_courses = await self.course_manager.create_or_update(course_create_update)
+            updated_courses = await self.course_manager.bulk_create_or_update(course_create_update)
+        except LookupError as e:
+            raise HTTPException(
+                status_code=404,
+                detail=str(e),
+            )
         except sqlalchemy.exc.IntegrityError as e:
             raise HTTPException(
                 status_code=400,
                 detail=str(e),
             )
 
+        await catalog_cache.invalidate()
         return updated_courses
 
     async def delete_courses(
         self,
         courses: list[CourseDeleteSchema],
-    ) -> None:
+    ) -> BatchDeleteResultSchema:
         """
-        Delete courses based on the provided list of IDs.
+        Delete courses based on the provided list of IDs, together with their lessons and quiz questions.
         """
+        course_ids = [course.id for course in courses if course.id is not None]
         try:
-            for course in courses:
-                if course.id is not None:
-                    await self.course_manager.delete_by_id(course.id)
+            deleted_ids = await self.course_manager.bulk_delete(course_ids)
         except sqlalchemy.exc.IntegrityError as e:
             raise HTTPException(
                 status_code=400,
                 detail=str(e),
             )
 
+        await catalog_cache.invalidate()
+        await quiz_answer_index.invalidate()
+        return BatchDeleteResultSchema.create(course_ids, deleted_ids)
+
 
 async def get_course_service(
     db: AsyncSession = Depends(get_session),
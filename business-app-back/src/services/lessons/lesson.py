@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException
 
 import src.models.managers as managers
-from src.api.schemes import PaginationParams
+from src.api.schemes import BatchDeleteResultSchema, PaginationParams
 from src.api.routes.education.lesson.schemes import (
     LessonReadSchema,
     LessonListResponseSchema,
@@ -15,7 +15,9 @@ from src.api.routes.education.lesson.schemes import (
     LessonDeleteSchema,
 )
 from src.config.database_config import get_session
+from src.services.cache import CatalogEntry, catalog_cache
 from src.services.common import BaseService
+from src.services.quiz_questions.answer_index import quiz_answer_index
 from src.services.logger import LoggerProvider
 
 log = LoggerProvider().get_logger(__name__)
@@ -32,22 +34,23 @@ class LessonService(BaseService):
         order_by: list[str],
         pagination: PaginationParams,
         **filters,
-    ):
-        filters["name__ilike"] = search
-        lessons: list = await self.lesson_manager.search(
-            order_by=order_by,
-            pagination=pagination,
-            id=lesson_id,
-            **filters,
-        )
-        total = await self.lesson_manager.count(
-            id=lesson_id,
-            **filters,
-        )
-
-        lessons_mapped = [self.map_obj_to_schema(lesson, LessonReadSchema).model_dump() for lesson in lessons]
-
-        return LessonListResponseSchema.create(list_data=lessons_mapped, pagination=pagination, total=total)
+    ) -> CatalogEntry:
+        filters["title__ilike"] = search
+
+        async def load() -> LessonListResponseSchema:
+            result = await self.lesson_manager.search_with_total(
+                order_by=order_by,
+                pagination=pagination,
+                id=lesson_id,
+                **filters,
+            )
+
+            lessons_mapped = result.map(lambda lesson: self.map_obj_to_schema(lesson, LessonReadSchema).model_dump())
+
+            return LessonListResponseSchema.create(list_data=lessons_mapped, pagination=pagination)
+
+        params = dict(filters, id=lesson_id, order_by=order_by, pagination=pagination.model_dump())
+        return await catalog_cache.get_or_load("lessons", params, load)
 
     async def create_or_update_lessons(
         self,
@@ -66,32 +69,42 @@ class LessonService(BaseService):
             )
 
         try:
-            updated_lesson = await self.lesson_manager.create_or_update(lesson_create_update)
+            updated_lesson = await self.lesson_manager.bulk_create_or_update(lesson_create_update)
+        except LookupError as e:
+            raise HTTPException(
+                status_code=404,
+                detail=str(e),
+            )
         except sqlalchemy.exc.IntegrityError as e:
             raise HTTPException(
                 status_code=400,
                 detail=str(e),
             )
 
+        await catalog_cache.invalidate()
+        await quiz_answer_index.invalidate()
         return updated_lesson
 
     async def delete_lessons(
         self,
         lessons: list[LessonDeleteSchema],
-    ) -> None:
+    ) -> BatchDeleteResultSchema:
         """
-        Delete lessons based on the provided list of IDs.
+        Delete lessons based on the provided list of IDs, together with their quiz questions.
         """
+        lesson_ids = [lesson.id for lesson in lessons if lesson.id is not None]
         try:
-            for lesson in lessons:
-                if lesson.id is not None:
-                    await self.lesson_manager.delete_by_id(lesson.id)
+            deleted_ids = await self.lesson_manager.bulk_delete(lesson_ids)
         except sqlalchemy.exc.IntegrityError as e:
             raise HTTPException(
                 status_code=400,
                 detail=str(e),
             )
 
+        await catalog_cache.invalidate()
+        await quiz_answer_index.invalidate()
+        return BatchDeleteResultSchema.create(lesson_ids, deleted_ids)
+
 
 async def get_lesson_service(
     db: AsyncSession = Depends(get_session),
@@ -1,31 +1,143 @@
+import atexit
+import json
+import logging
 import os
+import queue
+import random
+import sys
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from logging import Formatter, Logger, LogRecord, StreamHandler
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
 
-import logging
-from logging import Formatter, Logger, StreamHandler
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# pass as ``extra`` to let a high-volume message be sampled at LOG_SAMPLE_RATE
+SAMPLED = {"sampled": True}
+
+LINEAR_FORMAT = "%(asctime)s: %(levelname)s [%(threadName)s] %(funcName)s(%(lineno)d): %(message)s"
+
+RECORD_ATTRIBUTES = frozenset(vars(LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+
+class RequestContextFilter(logging.Filter):
+    """
+    Attaches the ID of the current request to the records and drops a part of the sampled ones.
+
+    It runs in the thread that logs, where the request context is visible.
+    """
+
+    def __init__(self, sample_rate: float = 1.0):
+        super().__init__()
+        self.sample_rate = sample_rate
+
+    def filter(self, record: LogRecord) -> bool:
+        if getattr(record, "sampled", False) and random.random() >= self.sample_rate:
+            return False
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(Formatter):
+    """
+    Formats records as one JSON object per line, with the extra attributes of the record as fields.
+    """
+
+    def format(self, record: LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "request_id": getattr(record, "request_id", None),
+            "function": record.funcName,
+            "line": record.lineno,
+            "thread": record.threadName,
+        }
+        for key, value in vars(record).items():
+            if key not in RECORD_ATTRIBUTES and key not in entry and key != "sampled":
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RenderingQueueHandler(QueueHandler):
+    """
+    Queue handler that only renders the message and the traceback in the logging thread.
+
+    The message arguments are interpolated here, while the objects they refer to are
+    still consistent, but the formatting of the output and the I/O are left to the
+    listener thread.
+    """
+
+    def prepare(self, record: LogRecord) -> LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
 
 
 class LoggerProvider:
     """
     Вспомогательный класс для получения логгера.
-    Применяет базовые настройки к встроенному логгеру и
-    возвращает инстранцию логгера с указанным названием.
+    Возвращает зарегистрированный логгер с указанным названием; записи всех логгеров
+    передаются через очередь в фоновый поток, который пишет их в stdout.
     """
 
-    def __init__(self):
-        linear_formatter = Formatter(
-            "%(asctime)s: %(levelname)s [%(threadName)s] %(funcName)s(%(lineno)d): %(message)s", "%Y-%m-%d %H:%M:%S"
-        )
+    listener: Optional[QueueListener] = None
 
-        self.console_handler = StreamHandler()
-        self.console_handler.setFormatter(linear_formatter)
+    def __init__(self):
+        if LoggerProvider.listener is None:
+            LoggerProvider.configure()
 
     def get_logger(self, name: str) -> Logger:
-        logger = Logger(name)
-        logger.setLevel(logging.INFO)
-        if self.console_handler not in logger.handlers:
-            logger.addHandler(self.console_handler)
+        return logging.getLogger(name)
+
+    @classmethod
+    def configure(cls) -> None:
+        """
+        Sets up the queue-based pipeline from the settings:
+
+        - LOG_LEVEL: level of the root logger
+        - LOG_LEVELS: per-module levels, as ``module=LEVEL,other.module=LEVEL``
+        - LOG_FORMAT: ``json`` or ``text``
+        - LOG_SAMPLE_RATE: share of the messages logged with ``extra=SAMPLED`` that are kept
+        """
+        from src.config.app_config import settings
+
+        output_handler = StreamHandler(sys.stdout)
+        if settings.LOG_FORMAT == "json":
+            output_handler.setFormatter(JsonFormatter())
+        else:
+            output_handler.setFormatter(Formatter(LINEAR_FORMAT + " [%(request_id)s]", "%Y-%m-%d %H:%M:%S"))
+
+        queue_handler = RenderingQueueHandler(queue.SimpleQueue())
+        queue_handler.addFilter(RequestContextFilter(settings.LOG_SAMPLE_RATE))
+
+        root = logging.getLogger()
+        root.handlers = [queue_handler]
+        root.setLevel(settings.LOG_LEVEL.upper())
+        for item in filter(None, settings.LOG_LEVELS.split(",")):
+            module, _, level = item.partition("=")
+            logging.getLogger(module.strip()).setLevel(level.strip().upper())
+
+        cls.listener = QueueListener(queue_handler.queue, output_handler, respect_handler_level=True)
+        cls.listener.start()
+        atexit.register(cls.shutdown)
 
-        return logger
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Writes out the queued records and stops the listener thread.
+        """
+        if cls.listener is not None and cls.listener._thread is not None:
+            cls.listener.stop()
 
 
 def tail(file_path: str, lines: int) -> list:
@@ -0,0 +1,160 @@
+import time
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.services.metrics.registry import Counter, Gauge, Histogram, LabelValues, MetricsRegistry
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+POOL_WAIT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+# label of the statements executed outside of any request
+BACKGROUND_ROUTE = "background"
+
+
+class RequestStats:
+    """
+    Database activity of one request, accumulated by the engine events.
+    """
+
+    __slots__ = ("statements", "db_seconds", "rows")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.rows = 0
+
+
+request_stats_var: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+registry = MetricsRegistry()
+
+request_duration = registry.register(
+    Histogram(
+        "http_request_duration_seconds",
+        "Time from the start of the request to the end of the response body",
+        LATENCY_BUCKETS,
+        ("method", "route", "status"),
+    )
+)
+request_statements = registry.register(
+    Histogram(
+        "http_request_sql_statements",
+        "Number of SQL statements executed per request",
+        STATEMENT_BUCKETS,
+        ("method", "route"),
+    )
+)
+db_statements = registry.register(Counter("db_statements_total", "SQL statements executed", ("method", "route")))
+db_seconds = registry.register(
+    Counter("db_statement_seconds_total", "Time spent executing SQL statements", ("method", "route"))
+)
+db_rows = registry.register(
+    Counter("db_rows_total", "Rows returned or affected by SQL statements", ("method", "route"))
+)
+pool_checkout_wait = registry.register(
+    Histogram(
+        "db_pool_checkout_wait_seconds",
+        "Time spent waiting for a pooled connection, including opening a new one",
+        POOL_WAIT_BUCKETS,
+    )
+)
+
+
+def observe_request(method: str, route: str, status: int, duration: float, stats: RequestStats) -> None:
+    labels = (method, route)
+    request_duration.observe(duration, (method, route, str(status)))
+    request_statements.observe(stats.statements, labels)
+    if stats.statements:
+        db_statements.inc(labels, stats.statements)
+        db_seconds.inc(labels, stats.db_seconds)
+        db_rows.inc(labels, stats.rows)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Queue pool recording how long each checkout waits for a connection.
+    """
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            pool_checkout_wait.observe(time.perf_counter() - start)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if context is not None:
+        context._metrics_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    start = getattr(context, "_metrics_start", None)
+    if start is None:
+        return
+
+    elapsed = time.perf_counter() - start
+    rows = max(cursor.rowcount, 0)
+    stats = request_stats_var.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.db_seconds += elapsed
+        stats.rows += rows
+    else:
+        labels = ("", BACKGROUND_ROUTE)
+        db_statements.inc(labels)
+        db_seconds.inc(labels, elapsed)
+        db_rows.inc(labels, rows)
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Hooks the statement metrics into `engine` and registers the gauges of its pool.
+
+    Hooks the statement metrics into `engine` and registers the gauges of its pool if it is a queue pool.
+    checkout wait times to be recorded.
+    """
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, QueuePool):
+        return
+
+    registry.register(
+        Gauge(
+            "db_pool_connections",
+            "Connections of the pool by state",
+            lambda: {
+                ("in_use",): pool.checkedout(),
+                ("idle",): pool.checkedin(),
+                ("overflow",): max(pool.overflow(), 0),
+            },
+            ("state",),
+        )
+    )
+    registry.register(Gauge("db_pool_size", "Configured size of the pool", lambda: {(): pool.size()}))
+
+
+def register_stats(component: str, documentation: str, get_stats: Callable[[], dict[str, Any]]) -> None:
+    """
+    Exposes the numeric values of a ``stats()`` dictionary as gauges named ``<component>_<key>``.
+    """
+
+    def collect(key: str) -> dict[LabelValues, float]:
+        return {(): get_stats()[key]}
+
+    for key in get_stats():
+        registry.register(
+            Gauge(
+                f"{component}_{key}",
+                f"{documentation}: {key.replace('_', ' ')}",
+                partial(collect, key),
+            )
+        )
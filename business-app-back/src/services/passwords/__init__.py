@@ -0,0 +1,8 @@
+"""
+Password hashing on a process pool.
+
+The package deliberately re-exports nothing: the spawned workers import
+`src.services.passwords.workers`, and anything imported here would be loaded
+(with the app config and the logging listener) in every worker process.
+Import the executor from `src.services.passwords.hashing`.
+"""
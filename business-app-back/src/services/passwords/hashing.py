@@ -0,0 +1,137 @@
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from src.config.app_config import settings
+from src.services.logger import LoggerProvider
+from src.services.passwords import workers
+
+log = LoggerProvider().get_logger(__name__)
+
+
+class PasswordHashingBusy(Exception):
+    """
+    Raised when the hashing executor already holds the maximum number of pending jobs.
+    """
+
+
+class PasswordHashingExecutor:
+    """
+    Runs password hashing and verification on a bounded process pool.
+
+    Hashing takes tens of milliseconds of CPU, so running it on the event loop
+    stalls every other request of the worker. Jobs are handed over to a pool of
+    processes instead, and once `max_pending` jobs are queued or running new ones
+    fail immediately rather than waiting behind a burst.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        time_cost: int,
+        memory_cost: int,
+        parallelism: int,
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self._initargs = (time_cost, memory_cost, parallelism)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        self.pending = 0
+        self.peak_pending = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.rejected = 0
+        self.upgraded = 0
+        self.total_seconds = 0.0
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=workers.init_worker,
+                initargs=self._initargs,
+            )
+        return self._pool
+
+    async def hash(self, password: str) -> str:
+        return await self._run(workers.hash_password, password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+        """
+        Verifies the password against the hash.
+
+        :return: Whether the password matches, and a new hash if the given one was made
+            by a legacy hasher or with outdated parameters.
+        """
+        verified, updated_hash = await self._run(workers.verify_and_update_password, password, hashed_password)
+        if updated_hash is not None:
+            self.upgraded += 1
+        return verified, updated_hash
+
+    async def _run(self, func: Callable, *args: Any) -> Any:
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise PasswordHashingBusy()
+
+        self.pending += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        started_at = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        future = self.pool.submit(func, *args)
+        future.add_done_callback(lambda done: loop.call_soon_threadsafe(self._on_done, started_at, done))
+        return await asyncio.wrap_future(future)
+
+    def _on_done(self, started_at: float, future: Future) -> None:
+        """
+        Accounts a finished job.
+
+        The job is counted as pending until the pool is done with it, even if the caller
+        stopped waiting, so `max_pending` bounds the work queued in the pool. The pool
+        reports completion from its own thread, so the accounting is handed over to the
+        event loop that updates the other counters.
+        """
+        self.pending -= 1
+        self.total_seconds += time.perf_counter() - started_at
+        if future.cancelled() or future.exception() is not None:
+            self.failed += 1
+        else:
+            self.succeeded += 1
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def stats(self) -> dict[str, int | float]:
+        """
+        Returns the executor counters.
+
+        The latency is measured from submission, so it includes the time a job waited for a free worker.
+        """
+        finished = self.succeeded + self.failed
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "peak_pending": self.peak_pending,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "rejected": self.rejected,
+            "upgraded": self.upgraded,
+            "avg_latency_seconds": self.total_seconds / finished if finished else 0.0,
+        }
+
+
+password_hashing_executor = PasswordHashingExecutor(
+    max_workers=settings.PASSWORD_HASHING_WORKERS,
+    max_pending=settings.PASSWORD_HASHING_MAX_PENDING,
+    time_cost=settings.PASSWORD_ARGON2_TIME_COST,
+    memory_cost=settings.PASSWORD_ARGON2_MEMORY_COST,
+    parallelism=settings.PASSWORD_ARGON2_PARALLELISM,
+)
@@ -0,0 +1,45 @@
+"""
+Functions executed in the password hashing worker processes.
+
+The module and its package `__init__` only depend on pwdlib, so a spawned worker
+does not load the app config or start a logging listener.
+"""
+
+from typing import Optional
+
+from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+from pwdlib.hashers.bcrypt import BcryptHasher
+
+_password_hash: Optional[PasswordHash] = None
+
+
+def init_worker(time_cost: int, memory_cost: int, parallelism: int) -> None:
+    """
+    Configures the hasher of the worker process.
+
+    Argon2 with the configured parameters is used for new hashes. Hashes made by
+    bcrypt or with other Argon2 parameters still verify and are reported as
+    needing an update.
+    """
+    global _password_hash
+    _password_hash = PasswordHash(
+        (
+            Argon2Hasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism),
+            BcryptHasher(),
+        )
+    )
+
+
+def get_password_hash() -> PasswordHash:
+    if _password_hash is None:
+        raise RuntimeError("The password hashing worker is not initialized")
+    return _password_hash
+
+
+def hash_password(password: str) -> str:
+    return get_password_hash().hash(password)
+
+
+def verify_and_update_password(password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    return get_password_hash().verify_and_update(password, hashed_password)
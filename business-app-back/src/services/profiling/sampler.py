@@ -0,0 +1,221 @@
+import asyncio
+import marshal
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from types import CodeType, FrameType
+from typing import Any, MutableMapping, Optional
+
+from src.config.app_config import settings
+from src.services.logger import LoggerProvider
+
+log = LoggerProvider().get_logger(__name__)
+
+MAX_STACK_DEPTH = 128
+
+
+class ProfileWindow:
+    """
+    Stack samples collected during one aggregation window.
+
+    Attributes:
+        started_at (float): UNIX time the window was opened at
+        ended_at (Optional[float]): UNIX time the window was closed at, None while it is open
+        requests (int): number of profiled requests started in the window
+        samples (Counter): sample counts keyed by (route label, stack of code objects from the root)
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self.ended_at: Optional[float] = None
+        self.requests = 0
+        self.samples: Counter[tuple[str, tuple[CodeType, ...]]] = Counter()
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler of the requests served on the event loop.
+
+    While at least one profiled request is in progress, a background thread takes the
+    stack of the event loop thread every `interval` seconds and keeps it if the running
+    task belongs to a profiled request. Nothing is traced between the samples, so the
+    cost does not depend on the number of calls made by the request.
+
+    Samples measure the CPU time spent on the event loop: time a request spends awaiting
+    I/O and code run in worker threads or processes are not sampled. They are aggregated
+    per route over windows of `window_seconds`; the last completed window is kept for
+    download.
+    """
+
+    def __init__(self, interval: float, window_seconds: float):
+        self.interval = interval
+        self.window_seconds = window_seconds
+
+        self._active: dict[asyncio.Task, MutableMapping[str, Any]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread: Optional[threading.Thread] = None
+
+        self._lock = threading.Lock()
+        self._current = ProfileWindow()
+        self._previous: Optional[ProfileWindow] = None
+
+    def begin(self, scope: MutableMapping[str, Any]) -> Optional[asyncio.Task]:
+        """
+        Registers the current task as a profiled request. Must be called on the event loop.
+
+        :param scope: The ASGI scope of the request; the route is read from it when sampling.
+        :return: The task to pass to `end`.
+        """
+        task = asyncio.current_task()
+        if task is None or self._stopped:
+            return None
+
+        if self._thread is None:
+            self._loop = task.get_loop()
+            self._loop_thread_id = threading.get_ident()
+            self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+            self._thread.start()
+
+        with self._lock:
+            self._rotate(time.time())
+            self._current.requests += 1
+        self._active[task] = scope
+        self._wake.set()
+        return task
+
+    def end(self, task: Optional[asyncio.Task]) -> None:
+        if task is None:
+            return
+        self._active.pop(task, None)
+        if not self._active:
+            self._wake.clear()
+
+    def shutdown(self) -> None:
+        self._stopped = True
+        self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stopped:
+            self._wake.wait()
+            time.sleep(self.interval)
+
+            # a plain lookup of the task the loop is running; None while the loop waits for I/O
+            task = asyncio.current_task(self._loop)
+            scope = self._active.get(task) if task is not None else None
+            if scope is None or self._loop_thread_id is None:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+
+            sample = (self._get_label(scope), self._get_stack(frame))
+            with self._lock:
+                self._rotate(time.time())
+                self._current.samples[sample] += 1
+
+    @staticmethod
+    def _get_label(scope: MutableMapping[str, Any]) -> str:
+        route = scope.get("route")
+        return f"{scope['method']} {route.path if route is not None else scope['path']}"
+
+    @staticmethod
+    def _get_stack(frame: Optional[FrameType]) -> tuple[CodeType, ...]:
+        stack: list[CodeType] = []
+        while frame is not None and len(stack) < MAX_STACK_DEPTH:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        return tuple(reversed(stack))
+
+    def _rotate(self, now: float) -> None:
+        if now - self._current.started_at >= self.window_seconds:
+            self._current.ended_at = now
+            self._previous, self._current = self._current, ProfileWindow()
+
+    def get_window(self, current: bool = False) -> Optional[ProfileWindow]:
+        """
+        Returns the window being collected if `current`, otherwise the last completed one.
+        """
+        with self._lock:
+            self._rotate(time.time())
+            window = self._current if current else self._previous
+            if window is None:
+                return None
+            snapshot = ProfileWindow()
+            snapshot.started_at, snapshot.ended_at = window.started_at, window.ended_at
+            snapshot.requests = window.requests
+            snapshot.samples = window.samples.copy()
+        return snapshot
+
+    @staticmethod
+    def _get_function_key(code: CodeType) -> tuple[str, int, str]:
+        return code.co_filename, code.co_firstlineno, code.co_name
+
+    def to_collapsed(self, window: ProfileWindow) -> str:
+        """
+        Renders the samples as collapsed stacks (``root;...;leaf count`` lines), the input
+        format of flamegraph.pl, speedscope and similar flame graph tools.
+        """
+        cwd = os.getcwd() + os.sep
+        names: dict[CodeType, str] = {}
+        lines = []
+        for (label, stack), count in window.samples.items():
+            frames = [label]
+            for code in stack:
+                if code not in names:
+                    filename = code.co_filename.removeprefix(cwd)
+                    names[code] = f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ":")
+                frames.append(names[code])
+            lines.append(f"{';'.join(frames)} {count}")
+        return "\n".join(sorted(lines)) + "\n"
+
+    def to_pstats(self, window: ProfileWindow) -> bytes:
+        """
+        Renders the samples as a marshalled pstats profile, readable with ``pstats.Stats`` and
+        the tools built on it.
+
+        Times are estimated as the number of samples times the interval and call counts are
+        sample counts. Each route is added as a root function named after the route.
+        """
+        stats: dict[tuple, list] = {}
+        callers: dict[tuple, dict[tuple, list]] = {}
+
+        for (label, stack), count in window.samples.items():
+            elapsed = count * self.interval
+            keys = [("~", 0, f"<{label}>")] + [self._get_function_key(code) for code in stack]
+
+            seen = set()
+            for depth, key in enumerate(keys):
+                is_leaf = depth == len(keys) - 1
+                entry = stats.setdefault(key, [0, 0, 0.0, 0.0])
+                if is_leaf:
+                    entry[2] += elapsed
+                # recursive calls are counted once per sample in the cumulative time
+                if key not in seen:
+                    seen.add(key)
+                    entry[0] += count
+                    entry[1] += count
+                    entry[3] += elapsed
+                if depth:
+                    edge = callers.setdefault(key, {}).setdefault(keys[depth - 1], [0, 0, 0.0, 0.0])
+                    edge[0] += count
+                    edge[1] += count
+                    edge[2] += elapsed if is_leaf else 0.0
+                    edge[3] += elapsed
+
+        return marshal.dumps(
+            {
+                key: (*entry, {caller: tuple(edge) for caller, edge in callers.get(key, {}).items()})
+                for key, entry in stats.items()
+            }
+        )
+
+
+sampling_profiler = SamplingProfiler(
+    interval=settings.PROFILER_INTERVAL_MS / 1000,
+    window_seconds=settings.PROFILER_WINDOW_SECONDS,
+)
@@ -0,0 +1,75 @@
+from typing import NamedTuple
+from uuid import UUID
+
+import src.models.managers as managers
+from src.config.app_config import settings
+from src.services.cache.backends import CacheBackend, get_cache_backend
+from src.services.logger import LoggerProvider
+
+log = LoggerProvider().get_logger(__name__)
+
+
+class LessonAnswerKey(NamedTuple):
+    """
+    Correct answers of the quiz of a lesson.
+
+    Attributes:
+        course_id (UUID): course of the lesson
+        answers (dict[UUID, str]): correct answer by question ID
+    """
+
+    course_id: UUID
+    answers: dict[UUID, str]
+
+
+class QuizAnswerIndex:
+    """
+    In-memory index of the correct quiz answers, loaded per lesson.
+
+    Lessons missing from the index are loaded together with one query and evicted in
+    LRU order. The index is cleared by the quiz question and lesson writes; with a
+    per-process backend other workers pick the changes up after the TTL.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+
+    @staticmethod
+    def _lesson_key(lesson_id: UUID) -> str:
+        return f"quiz:answers:{lesson_id}"
+
+    async def get_lessons(
+        self,
+        quiz_manager: "managers.QuizQuestionManager",
+        lesson_ids: list[UUID],
+    ) -> dict[UUID, LessonAnswerKey]:
+        """
+        Returns the answer keys of the given lessons; unknown lessons are absent from the result.
+        """
+        answer_keys, missing = {}, []
+        for lesson_id in lesson_ids:
+            answer_key = await self.backend.get(self._lesson_key(lesson_id))
+            if answer_key is None:
+                missing.append(lesson_id)
+            else:
+                answer_keys[lesson_id] = answer_key
+
+        if missing:
+            for lesson_id, answer_key in (await quiz_manager.get_answer_keys(missing)).items():
+                answer_key = LessonAnswerKey(*answer_key)
+                await self.backend.set(self._lesson_key(lesson_id), answer_key)
+                answer_keys[lesson_id] = answer_key
+
+        return answer_keys
+
+    async def invalidate(self) -> None:
+        await self.backend.clear()
+
+
+quiz_answer_index = QuizAnswerIndex(
+    backend=get_cache_backend(
+        "local",
+        max_size=settings.QUIZ_ANSWER_INDEX_MAX_LESSONS,
+        ttl=settings.QUIZ_ANSWER_INDEX_TTL_SECONDS,
+    )
+)
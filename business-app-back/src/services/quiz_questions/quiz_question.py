@@ -7,15 +7,21 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException
 
 import src.models.managers as managers
-from src.api.schemes import PaginationParams
+from src.api.schemes import BatchDeleteResultSchema, PaginationParams
 from src.api.routes.education.quiz.schemes import (
     QuizQuestionReadSchema,
     QuizQuestionListResponseSchema,
     QuizQuestionCreateSchema,
     QuizQuestionDeleteSchema,
+    QuizGradeResponseSchema,
+    QuizLessonResultSchema,
+    QuizQuestionResultSchema,
+    QuizSubmissionSchema,
 )
 from src.config.database_config import get_session
+from src.services.cache import CatalogEntry, catalog_cache
 from src.services.common import BaseService
+from src.services.quiz_questions.answer_index import quiz_answer_index
 from src.services.logger import LoggerProvider
 
 log = LoggerProvider().get_logger(__name__)
@@ -29,6 +35,7 @@ class QuizQuestionService(BaseService):
 
     def __init__(self, db: AsyncSession):
         self.quiz_manager = managers.QuizQuestionManager(db)
+        self.progress_manager = managers.UserCourseProgressManager(db)
 
     async def get_questions(
         self,
@@ -38,7 +45,7 @@ class QuizQuestionService(BaseService):
         order_by: list[str],
         pagination: PaginationParams,
         **filters,
-    ):
+    ) -> CatalogEntry:
         """
         Retrieve quiz questions with optional filters like lesson ID, question ID, or text search.
 
@@ -47,24 +54,30 @@ class QuizQuestionService(BaseService):
         :param search: Search term to filter by question text (ILIKE).
         :param order_by: List of fields to order the results by.
         :param pagination: Pagination parameters (limit/offset).
-        :return: Paginated list of matching quiz questions with total count.
+        :return: Cached JSON of the paginated list of matching quiz questions with total count.
         """
         filters["question_text__ilike"] = search
-        questions = await self.quiz_manager.search(
-            order_by=order_by,
-            pagination=pagination,
-            id=question_id,
-            lesson_id=lesson_id,
-            **filters,
-        )
-        total = await self.quiz_manager.count(
+
+        async def load() -> QuizQuestionListResponseSchema:
+            result = await self.quiz_manager.search_with_total(
+                order_by=order_by,
+                pagination=pagination,
+                id=question_id,
+                lesson_id=lesson_id,
+                **filters,
+            )
+
+            mapped = result.map(lambda q: self.map_obj_to_schema(q, QuizQuestionReadSchema).model_dump())
+            return QuizQuestionListResponseSchema.create(list_data=mapped, pagination=pagination)
+
+        params = dict(
+            filters,
             id=question_id,
             lesson_id=lesson_id,
-            **filters,
+            order_by=order_by,
+            pagination=pagination.model_dump(),
         )
-
-        mapped = [self.map_obj_to_schema(q, QuizQuestionReadSchema).model_dump() for q in questions]
-        return QuizQuestionListResponseSchema.create(list_data=mapped, pagination=pagination, total=total)
+        return await catalog_cache.get_or_load("quiz_questions", params, load)
 
     async def create_or_update_questions(
         self,
@@ -79,28 +92,112 @@ class QuizQuestionService(BaseService):
         """
         try:
             data = [QuizQuestionCreateSchema(**q.model_dump()) for q in questions]
-            return await self.quiz_manager.create_or_update(data)
+            saved = await self.quiz_manager.bulk_create_or_update(data)
+        except LookupError as e:
+            raise HTTPException(status_code=404, detail=str(e))
         except sqlalchemy.exc.IntegrityError as e:
             log.error(f"Integrity error during create/update: {e}")
             raise HTTPException(status_code=400, detail=str(e))
 
+        await catalog_cache.invalidate()
+        await quiz_answer_index.invalidate()
+        return saved
+
     async def delete_questions(
         self,
         questions: list[QuizQuestionDeleteSchema],
-    ) -> None:
+    ) -> BatchDeleteResultSchema:
         """
         Delete quiz questions based on their IDs.
 
         :param questions: List of QuizQuestionDeleteSchema, each containing an ID.
+        :return: IDs of the deleted questions and of the requested ones that did not exist.
         """
+        question_ids = [q.id for q in questions if q.id]
         try:
-            for q in questions:
-                if q.id:
-                    await self.quiz_manager.delete_by_id(q.id)
+            deleted_ids = await self.quiz_manager.bulk_delete(question_ids)
         except sqlalchemy.exc.IntegrityError as e:
             log.error(f"Error deleting quiz question: {e}")
             raise HTTPException(status_code=400, detail=str(e))
 
+        await catalog_cache.invalidate()
+        await quiz_answer_index.invalidate()
+        return BatchDeleteResultSchema.create(question_ids, deleted_ids)
+
+    async def grade(
+        self,
+        user_id: UUID,
+        submission: QuizSubmissionSchema,
+    ) -> QuizGradeResponseSchema:
+        """
+        Grade the answers to the quizzes of one or more lessons of a course and add the
+        passed lessons to the progress of the user with a single atomic upsert.
+
+        A lesson is passed when it has a quiz and every question of it is answered correctly;
+        lessons without questions cannot be passed by grading. Passing a lesson again does not
+        advance the progress (see `UserCourseProgressManager.complete_lessons`).
+        The correct answers are never returned.
+
+        :param user_id: ID of the user submitting the answers.
+        :param submission: The course and the answers grouped by lesson.
+        :return: Per-question and per-lesson results with the updated progress.
+        :raises LookupError: If a lesson does not exist or is not a lesson of the course.
+        :raises ValueError: If a lesson is submitted twice or an answer refers to a question
+                            of another lesson.
+        """
+        lesson_ids = [lesson.lesson_id for lesson in submission.lessons]
+        if len(set(lesson_ids)) != len(lesson_ids):
+            raise ValueError("Each lesson can be submitted only once")
+
+        answer_keys = await quiz_answer_index.get_lessons(self.quiz_manager, lesson_ids)
+
+        results = []
+        for lesson in submission.lessons:
+            answer_key = answer_keys.get(lesson.lesson_id)
+            if answer_key is None or answer_key.course_id != submission.course_id:
+                raise LookupError(f"Lesson {lesson.lesson_id} not found in course {submission.course_id}")
+
+            answers = {answer.question_id: answer.answer.strip() for answer in lesson.answers}
+            unknown = answers.keys() - answer_key.answers.keys()
+            if unknown:
+                raise ValueError(f"Questions {sorted(map(str, unknown))} are not in lesson {lesson.lesson_id}")
+
+            questions = [
+                QuizQuestionResultSchema(
+                    question_id=question_id,
+                    is_correct=answers.get(question_id) == correct_answer.strip(),
+                )
+                for question_id, correct_answer in answer_key.answers.items()
+            ]
+            correct_answers = sum(question.is_correct for question in questions)
+            results.append(
+                QuizLessonResultSchema(
+                    lesson_id=lesson.lesson_id,
+                    total_questions=len(questions),
+                    correct_answers=correct_answers,
+                    passed=bool(questions) and correct_answers == len(questions),
+                    questions=questions,
+                )
+            )
+
+        passed_lesson_ids = [result.lesson_id for result in results if result.passed]
+        if passed_lesson_ids:
+            progress = await self.progress_manager.complete_lessons(
+                user_id=user_id,
+                course_id=submission.course_id,
+                lesson_ids=passed_lesson_ids,
+            )
+        else:
+            progresses = await self.progress_manager.search(user_id=user_id, course_id=submission.course_id)
+            progress = progresses[0] if progresses else None
+
+        return QuizGradeResponseSchema(
+            course_id=submission.course_id,
+            lessons=results,
+            completed_lessons=progress.completed_lessons if progress else 0,
+            is_completed=progress.is_completed if progress else False,
+        )
+
 
 async def get_quiz_question_service(
     db: AsyncSession = Depends(get_session),
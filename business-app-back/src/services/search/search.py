@@ -0,0 +1,68 @@
+from typing import Optional
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+import src.models.managers as managers
+from src.api.routes.search.schemes import (
+    SearchEntityType,
+    SearchHitSchema,
+    SearchListResponseSchema,
+)
+from src.api.schemes import PaginationParams
+from src.config.database_config import get_session
+from src.services.common import BaseService
+from src.services.logger import LoggerProvider
+
+log = LoggerProvider().get_logger(__name__)
+
+
+class SearchService(BaseService):
+    def __init__(self, db: AsyncSession):
+        self.search_manager = managers.SearchManager(db)
+
+    async def search(
+        self,
+        text: str,
+        user_id: UUID,
+        pagination: PaginationParams,
+        types: Optional[list[SearchEntityType]] = None,
+    ) -> SearchListResponseSchema:
+        """
+        Full-text search across businesses of the user, courses, lessons and quiz questions.
+
+        Parameters:
+            text (str): The search query.
+            user_id (UUID): The ID of the current user.
+            pagination (PaginationParams): Pagination parameters, `cursor` takes precedence over `page`.
+            types (Optional[list[SearchEntityType]]): Entity types to search, all by default.
+
+        Returns:
+            SearchListResponseSchema: Hits ordered by relevance with the cursor of the next page.
+
+        Raises:
+            ValueError: If the query is empty or the cursor is malformed.
+        """
+        if not text.strip():
+            raise ValueError("Search query must not be empty")
+
+        result = await self.search_manager.search(
+            text=text,
+            user_id=user_id,
+            pagination=pagination,
+            types=[entity_type.value for entity_type in dict.fromkeys(types)] if types else None,
+        )
+
+        hits = result.map(lambda row: SearchHitSchema.model_validate(row).model_dump())
+
+        return SearchListResponseSchema.create(list_data=hits, pagination=pagination)
+
+
+async def get_search_service(
+    db: AsyncSession = Depends(get_session),
+) -> SearchService:
+    """
+    Dependency injection function that provides an instance of SearchService with a database session.
+    """
+    return SearchService(db=db)
@@ -1,5 +1,5 @@
 from uuid import UUID
-from typing import Optional
+from typing import AsyncIterator, Optional
 
 import sqlalchemy.exc
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -7,7 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import Depends, HTTPException
 
 import src.models.managers as managers
-from src.api.schemes import PaginationParams
+from src.api.schemes import BatchDeleteResultSchema, ExportFormat, PaginationParams
 from src.api.routes.education.user_course_progress.schemes import (
     UserCourseProgressReadSchema,
     UserCourseProgressListResponseSchema,
@@ -16,6 +16,7 @@ from src.api.routes.education.user_course_progress.schemes import (
 )
 from src.config.database_config import get_session
 from src.services.common import BaseService
+from src.services.common.export import stream_export
 from src.services.logger import LoggerProvider
 
 log = LoggerProvider().get_logger(__name__)
@@ -51,27 +52,52 @@ class UserCourseProgressService(BaseService):
         if course_id:
             filters["course_id"] = course_id
 
-        progress_records = await self.progress_manager.search(
+        result = await self.progress_manager.search_with_total(
             order_by=order_by,
             pagination=pagination,
             **filters,
         )
-        total = await self.progress_manager.count(**filters)
 
-        mapped = [self.map_obj_to_schema(obj, UserCourseProgressReadSchema).model_dump() for obj in progress_records]
+        mapped = result.map(lambda obj: self.map_obj_to_schema(obj, UserCourseProgressReadSchema).model_dump())
 
         return UserCourseProgressListResponseSchema.create(
             list_data=mapped,
             pagination=pagination,
-            total=total,
         )
 
+    def export_progress(
+        self,
+        user_id: Optional[UUID],
+        course_id: Optional[UUID],
+        order_by: list[str],
+        export_format: ExportFormat,
+    ) -> AsyncIterator[bytes]:
+        """
+        Export the progress records matching the same filters as `get_user_progress`, without pagination.
+
+        Parameters:
+            user_id (UUID): Optional filter to export progress of a specific user.
+            course_id (UUID): Optional filter to export progress in a specific course.
+            order_by (list[str]): List of fields to order by.
+            export_format (ExportFormat): NDJSON or CSV.
+
+        Returns:
+            AsyncIterator[bytes]: The chunks of the export, streamed from a server-side cursor.
+        """
+        query = self.progress_manager.get_search_query(
+            query=self.progress_manager.get_schema_query(UserCourseProgressReadSchema),
+            order_by=order_by,
+            user_id=user_id,
+            course_id=course_id,
+        )
+        return stream_export(managers.UserCourseProgressManager, query, UserCourseProgressReadSchema, export_format)
+
     async def create_or_update_progress(
         self,
         progress_list: list[UserCourseProgressCreateSchema],
     ) -> list:
         """
-        Create or update user course progress records.
+        Create or update user course progress records, matched by user and course.
 
         Parameters:
             progress_list (list): List of progress schemas to create or update.
@@ -79,30 +105,70 @@ class UserCourseProgressService(BaseService):
         Returns:
             list: List of updated or created progress objects.
         """
+        # one row per (user_id, course_id): the last item of the batch wins
+        unique_progress = {(item.user_id, item.course_id): item for item in progress_list}
         try:
-            return await self.progress_manager.create_or_update(progress_list)
+            return await self.progress_manager.bulk_upsert_by_key(
+                list(unique_progress.values()),
+                key_field=["user_id", "course_id"],
+            )
         except sqlalchemy.exc.IntegrityError as e:
             log.error(f"Integrity error while creating/updating progress: {e}")
             raise HTTPException(status_code=400, detail=str(e))
 
+    async def complete_lesson(
+        self,
+        user_id: UUID,
+        course_id: UUID,
+        lesson_id: UUID,
+    ) -> UserCourseProgressReadSchema:
+        """
+        Atomically record a completed lesson in the progress of the user in the course.
+        Completing a lesson again leaves the progress unchanged.
+
+        Parameters:
+            user_id (UUID): ID of the user.
+            course_id (UUID): ID of the course.
+            lesson_id (UUID): ID of the completed lesson.
+
+        Returns:
+            UserCourseProgressReadSchema: The updated progress.
+
+        Raises:
+            LookupError: If the lesson is not a lesson of the course.
+        """
+        progress = await self.progress_manager.complete_lessons(
+            user_id=user_id,
+            course_id=course_id,
+            lesson_ids=[lesson_id],
+        )
+        if progress is None:
+            raise LookupError(f"Lesson {lesson_id} not found in course {course_id}")
+
+        return self.map_obj_to_schema(progress, UserCourseProgressReadSchema)
+
     async def delete_progress(
         self,
         progress_list: list[UserCourseProgressDeleteSchema],
-    ) -> None:
+    ) -> BatchDeleteResultSchema:
         """
         Delete user course progress records by ID.
 
         Parameters:
             progress_list (list): List of progress records to delete.
+
+        Returns:
+            BatchDeleteResultSchema: IDs of the deleted records and of the requested ones that did not exist.
         """
+        progress_ids = [item.id for item in progress_list if item.id is not None]
         try:
-            for item in progress_list:
-                if item.id is not None:
-                    await self.progress_manager.delete_by_id(item.id)
+            deleted_ids = await self.progress_manager.bulk_delete(progress_ids)
         except sqlalchemy.exc.IntegrityError as e:
             log.error(f"Error while deleting progress: {e}")
             raise HTTPException(status_code=400, detail=str(e))
 
+        return BatchDeleteResultSchema.create(progress_ids, deleted_ids)
+
 
 async def get_user_course_progress_service(
     db: AsyncSession = Depends(get_session),
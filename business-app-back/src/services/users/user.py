@@ -45,26 +45,7 @@ class UserService(BaseService):
         self,
         user,
     ) -> UserProfileOutSchema:
-        achievements = []
-        roles = []
         user_stats = []
-
-        if user.achievement_id and user.achievement_name:
-            achievements.append(
-                AchievementSchema(
-                    id=user.achievement_id,
-                    name=user.achievement_name,
-                )
-            )
-
-        if user.role_id and user.role_name:
-            roles.append(
-                RoleSchema(
-                    id=user.role_id,
-                    name=user.role_name,
-                )
-            )
-
         if user.user_stats_total_business is not None:
             user_stats.append(
                 UserStatsSchema(
@@ -88,8 +69,8 @@ class UserService(BaseService):
                 bio=user.user_profile_bio,
             ),
             user_stats=user_stats,
-            role=roles,
-            achievement=achievements,
+            role=[RoleSchema(**role) for role in user.roles],
+            achievement=[AchievementSchema(**achievement) for achievement in user.achievements],
         )
 
     async def get_user_profile_info(
@@ -105,47 +86,8 @@ class UserService(BaseService):
             **filters,
         )
 
-        user_profiles = {}
-        for user in users:
-            if user.id not in user_profiles:
-                user_profiles[user.id] = self.map_user_info(user)
-            else:
-                current_achievements = user_profiles[user.id].achievement or []
-                current_roles = user_profiles[user.id].role or []
-                current_stats = user_profiles[user.id].user_stats or []
-
-                if user.achievement_id and user.achievement_name:
-                    if not any(ach.id == user.achievement_id for ach in current_achievements):
-                        current_achievements.append(
-                            AchievementSchema(
-                                id=user.achievement_id,
-                                name=user.achievement_name,
-                            )
-                        )
-
-                if user.role_id and user.role_name:
-                    if not any(role.id == user.role_id for role in current_roles):
-                        current_roles.append(
-                            RoleSchema(
-                                id=user.role_id,
-                                name=user.role_name,
-                            )
-                        )
-
-                if user.user_stats_total_business is not None:
-                    current_stats.append(
-                        UserStatsSchema(
-                            total_business=user.user_stats_total_business,
-                            total_capital=user.user_stats_total_capital,
-                            success_rate=user.user_stats_success_rate,
-                        )
-                    )
-
-                user_profiles[user.id].achievement = current_achievements
-                user_profiles[user.id].role = current_roles
-                user_profiles[user.id].user_stats = current_stats
-
-        return UserProfileResponse(data=list(user_profiles.values()))
+        # the query returns one row per user with roles and achievements already aggregated
+        return UserProfileResponse(data=[self.map_user_info(user) for user in users])
 
     async def get_user_email(
         self,
@@ -196,7 +138,15 @@ class UserService(BaseService):
             )
 
         try:
-            updated_category = await self.user_profile_manager.create_or_update(profiles_create_update)
+            updated_category = await self.user_profile_manager.bulk_create_or_update(
+                profiles_create_update,
+                user_id=user_id,
+            )
+        except LookupError as e:
+            raise HTTPException(
+                status_code=404,
+                detail=str(e),
+            )
         except sqlalchemy.exc.IntegrityError as e:
             raise HTTPException(
                 status_code=400,
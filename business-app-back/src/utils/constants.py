@@ -3,3 +3,10 @@ DATETIME_VALIDATOR = "%Y-%m-%d"
 BATCH_SIZE = 3276
 TOKEN_URL = "auth/login"
 LIFETIME_SECONDS = 360
+MAX_QUERY_PARAMS = 32767
+STATEMENT_CACHE_SIZE = 1024
+MAX_PROJECTION_HORIZON = 600
+MAX_SIMULATION_PATHS = 50000
+MAX_SIMULATION_HORIZON = 120
+SEARCH_CONFIG = "russian"
+EXPORT_BATCH_SIZE = 1000
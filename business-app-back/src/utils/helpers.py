@@ -1,5 +1,9 @@
+import base64
+import binascii
+import json
 import math
 from datetime import datetime, timezone
+from decimal import Decimal
 from uuid import UUID
 from typing import (
     Optional,
@@ -11,6 +15,8 @@ from typing import (
 from fastapi import (
     HTTPException,
     Query,
+    Response,
+    status,
 )
 
 from sqlalchemy import (
@@ -23,6 +29,7 @@ from sqlalchemy.orm import aliased
 from src.api.schemes import (
     BaseSortOptions,
     PaginationParams,
+    PaginationSchema,
     SortParams,
 )
 from src.utils.constants import DATETIME_FORMAT
@@ -58,36 +65,82 @@ def get_paginated_query(query: Query, pagination: PaginationParams):
     return query.limit(pagination.per_page).offset((pagination.page - 1) * pagination.per_page)
 
 
-def get_pagination_info(pagination: PaginationParams | None, total: int | None) -> dict[str, int | bool | None]:
+def get_pagination_info(
+    pagination: PaginationParams | None,
+    total: int | None,
+    next_cursor: str | None = None,
+) -> PaginationSchema:
     """
     Generates pagination info based on the current page, items per page, and total items.
 
     Args:
         pagination (PaginationParams): The pagination parameters.
         total (int): The total number of items.
+        next_cursor (str | None): The cursor of the next page, if any.
 
     Returns:
-        dict[str, int | bool | None]: A dictionary containing pagination info.
+        PaginationSchema: The pagination info. Without pagination parameters all the items
+        are on one page.
     """
     if pagination is None or total is None:
-        return {
-            "total_items": total,
-            "page": None,
-            "items_per_page": None,
-            "next_page": None,
-            "prev_page": None,
-            "total_pages": None,
-        }
+        return PaginationSchema(
+            total_items=total,
+            page=None,
+            items_per_page=pagination.per_page if pagination else total or 0,
+            next_page=None,
+            prev_page=None,
+            total_pages=None,
+            next_cursor=next_cursor,
+        )
     is_last_page = pagination.page * pagination.per_page >= total
     total_pages = math.ceil(total / pagination.per_page) if pagination.per_page else 0
-    return {
-        "total_items": total,
-        "page": pagination.page,
-        "items_per_page": pagination.per_page,
-        "next_page": pagination.page + 1 if not is_last_page else None,
-        "prev_page": pagination.page - 1 if pagination.page > 1 else None,
-        "total_pages": total_pages,
-    }
+    return PaginationSchema(
+        total_items=total,
+        page=pagination.page,
+        items_per_page=pagination.per_page,
+        next_page=pagination.page + 1 if not is_last_page else None,
+        prev_page=pagination.page - 1 if pagination.page > 1 else None,
+        total_pages=total_pages,
+        next_cursor=next_cursor,
+    )
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Encodes the sort-key values of the last row of a page into an opaque cursor.
+
+    Args:
+        values (List[Any]): The sort-key values, the last one being the row ID.
+
+    Returns:
+        str: A URL-safe cursor string.
+    """
+    payload = json.dumps(values, default=json_serializer, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Decodes a cursor created by `encode_cursor`.
+
+    Args:
+        cursor (str): The cursor string.
+
+    Returns:
+        List[Any]: The JSON-decoded sort-key values.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(payload)
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
 
 
 def apply_sorting(query: Query, sort_params: SortParams, model: Type) -> Query:
@@ -182,6 +235,7 @@ async def filter_query(query: Query, model: Type, filters: Optional[dict[str, An
 def pagination_params(
     page: int = Query(1, ge=1, description="Page number (must be 1 or greater)"),
     per_page: int = Query(100, ge=1, description="Number of items per page (must be 1 or greater)"),
+    cursor: Optional[str] = Query(None, description="Cursor of the next page, takes precedence over page"),
 ) -> PaginationParams:
     """
     Validates and creates pagination parameters.
@@ -189,6 +243,8 @@ def pagination_params(
     Args:
         page (int): The page number, must be 1 or greater.
         per_page (int): The number of items per page, must be 1 or greater.
+        cursor (Optional[str]): The `next_cursor` of a previous page. If given, keyset
+                                pagination is used and `page` is ignored.
 
     Returns:
         PaginationParams: The validated pagination parameters.
@@ -198,7 +254,7 @@ def pagination_params(
     """
     if page < 1 or per_page < 1:
         raise HTTPException(status_code=400, detail="Page number and per_page must be greater than 0")
-    return PaginationParams(page=page, per_page=per_page)
+    return PaginationParams(page=page, per_page=per_page, cursor=cursor)
 
 
 def sorting_params(sort_options: BaseSortOptions):
@@ -246,4 +302,35 @@ def json_serializer(obj):
         return str(obj)
     elif isinstance(obj, datetime):
         return obj.isoformat()
+    elif isinstance(obj, Decimal):
+        return str(obj)
     raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
+def etag_matches(etag: str, if_none_match: Optional[str]) -> bool:
+    """
+    Checks an ``If-None-Match`` header value against an entity tag (weak comparison, RFC 9110).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def get_etag_response(body: bytes, etag: str, if_none_match: Optional[str] = None) -> Response:
+    """
+    Builds the JSON response of a pre-serialized body, or an empty 304 if the client has it already.
+
+    Args:
+        body (bytes): The JSON body.
+        etag (str): The strong entity tag of the body.
+        if_none_match (Optional[str]): The ``If-None-Match`` request header.
+
+    Returns:
+        Response: The 200 response with the body or the 304 response.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(etag, if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,19 @@
+import secrets
+
+from src.config.authentication.strategy import StatelessJWTStrategy
+from src.models.dbo.database_models import AccessToken
+
+
+def test_session_id_fits_access_token_column():
+    column_length = AccessToken.__table__.c.token.type.length
+
+    for _ in range(100):
+        session_id = StatelessJWTStrategy._session_id(secrets.token_urlsafe())
+        assert len(session_id) <= column_length
+
+
+def test_session_id_is_deterministic_and_unique():
+    refresh_token = secrets.token_urlsafe()
+
+    assert StatelessJWTStrategy._session_id(refresh_token) == StatelessJWTStrategy._session_id(refresh_token)
+    assert StatelessJWTStrategy._session_id(refresh_token) != StatelessJWTStrategy._session_id(refresh_token + "x")
@@ -0,0 +1,50 @@
+import base64
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.utils.helpers import decode_cursor, encode_cursor, split_into_batches
+
+
+def test_cursor_round_trip():
+    entity_id = uuid4()
+    created_at = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+
+    cursor = encode_cursor(["name", 3, Decimal("1.50"), created_at, entity_id])
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ["name", 3, "1.50", created_at.isoformat(), str(entity_id)]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "!!!",
+        "not a cursor",
+        base64.urlsafe_b64encode(b"\xff\xfe").decode(),
+        base64.urlsafe_b64encode(b'{"id": 1}').decode(),
+        base64.urlsafe_b64encode(b"42").decode(),
+    ],
+)
+def test_decode_cursor_rejects_malformed_input(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize(
+    "data, batch_size, expected",
+    [
+        ([1, 2, 3, 4, 5], 2, [[1, 2], [3, 4], [5]]),
+        ([1, 2, 3, 4], 2, [[1, 2], [3, 4]]),
+        ([1, 2], 5, [[1, 2]]),
+        ([1, 2, 3], None, [[1, 2, 3]]),
+        ([1, 2, 3], 0, [[1, 2, 3]]),
+        ([], 3, []),
+        ([], None, []),
+    ],
+)
+def test_split_into_batches(data, batch_size, expected):
+    assert split_into_batches(data, batch_size) == expected
@@ -0,0 +1,41 @@
+import asyncio
+import json
+from uuid import uuid4
+
+from src.api.schemes import PaginationParams, SearchResult
+from src.models.dbo.database_models import QuizQuestion
+from src.services.quiz_questions.quiz_question import QuizQuestionService
+
+
+class StubQuizQuestionManager:
+    def __init__(self, questions):
+        self.questions = questions
+
+    async def search_with_total(self, **filters):
+        return SearchResult(items=self.questions, total=len(self.questions))
+
+
+def test_question_list_does_not_expose_correct_answer():
+    question = QuizQuestion(
+        id=uuid4(),
+        lesson_id=uuid4(),
+        question_text="2 + 2?",
+        choices=["3", "4"],
+        correct_answer="4",
+    )
+    service = QuizQuestionService(db=None)
+    service.quiz_manager = StubQuizQuestionManager([question])
+
+    entry = asyncio.run(
+        service.get_questions(
+            question_id=question.id,
+            lesson_id=None,
+            search=None,
+            order_by=[],
+            pagination=PaginationParams(page=1, per_page=10),
+        )
+    )
+
+    body = json.loads(entry.body)
+    assert [item["id"] for item in body["data"]] == [str(question.id)]
+    assert all("correct_answer" not in item for item in body["data"])
@@ -0,0 +1,29 @@
+from uuid import uuid4
+
+from src.api.schemes import BatchDeleteResultSchema
+
+
+def test_batch_delete_result_reports_missing_ids():
+    first, second, third = uuid4(), uuid4(), uuid4()
+
+    result = BatchDeleteResultSchema.create([first, second, third], [second])
+
+    assert result.deleted == [second]
+    assert result.missing == [first, third]
+
+
+def test_batch_delete_result_deduplicates_missing_ids():
+    first, second = uuid4(), uuid4()
+
+    result = BatchDeleteResultSchema.create([first, second, first], [second])
+
+    assert result.missing == [first]
+
+
+def test_batch_delete_result_all_deleted():
+    ids = [uuid4(), uuid4()]
+
+    result = BatchDeleteResultSchema.create(ids, ids)
+
+    assert result.deleted == ids
+    assert result.missing == []